@@ -9,7 +9,8 @@ designed for ethical information gathering, research, and cybersecurity awarenes
 Features:
 ---------
 - Loads all major OSINT modules (Google Dorking, Deep Web, IP Tracking, Metadata, etc.)
-- Verifies internet connection and required Python dependencies
+- Verifies internet connection and required Python dependencies (without importing them)
+- Loads every tool only when its menu option is picked
 - Displays ASCII branding and developer attribution
 - Prompts the user to accept legal terms via disclaimer before proceeding
 - Handles graceful fallback for missing packages with auto-install
@@ -54,13 +55,47 @@ Usage:
 Run this file directly via terminal or Python interpreter:
     python SpyNexus.py
 
+Headless commands (no menu, results written as JSON Lines):
+    python SpyNexus.py ip 8.8.8.8 1.1.1.1
+    python SpyNexus.py user john_doe jane_doe --nsfw --out -
+    python SpyNexus.py dork 'site="example.com"&docs' --results 20
+    python SpyNexus.py run jobs.yaml --workers 8 --processes
+    Commands: ip, domain, phone, user, image, dork, deep and run (job file)
+
+Service mode (tools, connections and caches kept warm between requests):
+    python SpyNexus.py serve --port 8765
+    curl -H 'Content-Type: application/json' -H 'X-SpyNexus-Token: <token printed at startup>' \
+         -d '{"target": "8.8.8.8"}' http://127.0.0.1:8765/ip
+
+Options:
+    --refresh          Ignore the cached user search results
+    --cache-ttl HOURS  Max age of the cached user search results
+    --quarantined      List the websites quarantined by the user search
+    --output MODE      tty (animated), plain or jsonl (one JSON object per message)
+    --lookup TARGET    Show the stored results of a target (add --partial to match part of it)
+    --render TARGET    Write the Markdown report of a target from the stored results
+    --probe-url URL    Endpoint used to check the internet connection
+    --tor-proxy URL    SOCKS endpoint of Tor (e.g. a local stand-in for testing)
+    --tor-circuits N   Number of isolated Tor circuits used at the same time
+    --tor-policy NAME  host, thread or round_robin, how requests are spread over the circuits
+    --timing           Show the import-time breakdown of the startup and of every tool loaded
+
 Note:
 -----
 Do not use SpyNexus against systems without explicit permission.
 The creator is not responsible for any misuse or illegal activity.
 """
 
+import time
+
+startup = time.perf_counter()
+
 import os
+import sys
+import argparse
+import contextlib
+import importlib
+import importlib.util
 
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan,
@@ -70,24 +105,30 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line, set_backend
 )
 from core.ma_command import launch
 from core.ma_command import check_internet
+from core import ma_command
+
+timings = []
+phase = {"last": startup}
 
-try:
-    import requests
-    import whois
-    import phonenumbers
-    from googlesearch import search
-    from exif import Image
-    from bs4 import BeautifulSoup
-    from geopy.geocoders import Nominatim
-
-except ModuleNotFoundError as pkg:
-    write_effect(f"{display_question} Missing packages {maBold(pkg)}...\n{display_info} Trying to install the missing packages automatically...", 0.05)
+def mark(label):
+    now = time.perf_counter()
+    timings.append((label, (now - phase["last"]) * 1000))
+    phase["last"] = now
+
+mark("core modules")
+
+# Only looked up (import specs), the packages are imported by the tools when they're used
+required = ["requests", "whois", "phonenumbers", "googlesearch", "exif", "bs4", "geopy"]
+missing = [pkg for pkg in required if importlib.util.find_spec(pkg) is None]
+
+if missing:
+    write_effect(f"{display_question} Missing packages {maBold(', '.join(missing))}...\n{display_info} Trying to install the missing packages automatically...", 0.05)
     space_between()
-    print()
+    blank_line()
 
     try:
         launch("pip install -r requirements.txt")
@@ -99,18 +140,155 @@ except ModuleNotFoundError as pkg:
     write_effect(f"\n{display_validate} {maGreen('Successfully downloaded the missing packages!')} {maGreen(pointing)}\n{display_info} Run the script again!", 0.05)
     exit()
 
+mark("dependency check")
+
+
+def load(module):
+    """
+    Imports a module the first time it's needed, the time it took is added to the timing report.
+    """
+
+    if module in sys.modules: return sys.modules[module]
+
+    begin = time.perf_counter()
+    loaded = importlib.import_module(module)
+    took = (time.perf_counter() - begin) * 1000
+    timings.append((module, took))
+    if args.timing: write_effect(f"{display_info} Loaded {maBold(module)} in {maGreen(round(took, 1))} ms", 0.005)
+    return loaded
+
+def tool(module, name):
+    """
+    Returns a function that loads the tool module when it's called for the first time.
+    """
+
+    def run(*params, **kwargs):
+        return getattr(load(f"tools.{module}"), name)(*params, **kwargs)
+    return run
+
+available_commands = tool("g_dorking", "available_commands")
+ex_deep = tool("deep_search", "ex_deep")
+search_ip = tool("ip_search", "search_ip")
+execute_webtool = tool("data_web", "execute_webtool")
+execute_user = tool("user_search", "execute_user")
+get_location = tool("coordinates", "get_location")
+execute_img = tool("metadata_img", "execute_img")
+execute_ph = tool("track_phone", "execute_ph")
+
+def timing_report():
+    total = sum(took for _, took in timings)
+    write_effect(f"\n{display_info} Startup timing ({maGreen(round(total, 1))} ms):", 0.005)
+    for label, took in timings:
+        write_effect(f"    {display_extra} {label}: {maBold(round(took, 1))} ms", 0.005)
 
-from tools.g_dorking import make_search, available_commands
-from tools.deep_search import ex_deep
-from tools.ip_search import search_ip
-from tools.data_web import execute_webtool
-from tools.user_search import execute_user
-from tools.coordinates import get_location
-from tools.metadata_img import execute_img
-from tools.track_phone import execute_ph
-from core.save_data import save_data
 from core.agents import agents
 from core.icons import show_icon
+from core import probe_cache, link_cache, rate_limit
+
+mark("tool loaders")
+
+parser = argparse.ArgumentParser(description="SpyNexus - The network of espionage and information analysis")
+parser.add_argument("--refresh", action="store_true", help="ignore the cached user search results and check every website again")
+parser.add_argument("--cache-ttl", type=float, metavar="HOURS", help="max age of the cached user search results (default: 6)")
+parser.add_argument("--link-cache", type=float, nargs="?", const=24, metavar="HOURS", help="keep the titles and descriptions of the dork result links on disk between runs (default: 24 hours)")
+parser.add_argument("--google-rate", type=float, metavar="PER_MINUTE", help="max Google searches per minute, lowered on its own when Google blocks them (default: 10)")
+parser.add_argument("--quarantined", action="store_true", help="list the websites quarantined by the user search and exit")
+parser.add_argument("--lookup", metavar="TARGET", help="show the stored results of a target (IP, domain, username, phone, query...) and exit")
+parser.add_argument("--partial", action="store_true", help="with --lookup, match every target containing the text")
+parser.add_argument("--render", metavar="TARGET", help="write the Markdown report of a target from the stored results and exit")
+parser.add_argument("--probe-url", metavar="URL", help="endpoint used to check the internet connection (default: https://google.com)")
+parser.add_argument("--tor-proxy", metavar="URL", help="SOCKS endpoint of Tor (default: socks5h://127.0.0.1:9050)")
+parser.add_argument("--tor-circuits", type=int, metavar="N", help="number of isolated Tor circuits used at the same time (default: 4)")
+parser.add_argument("--tor-policy", choices=["host", "thread", "round_robin"], help="how the requests are spread over the Tor circuits (default: host)")
+parser.add_argument("--timing", action="store_true", help="show how long the startup and every module load took")
+parser.add_argument("--output", choices=["tty", "plain", "jsonl"], help="how to show the results (default: tty on a terminal, plain otherwise)")
+
+commands = parser.add_subparsers(dest="command", metavar="COMMAND", help="run a tool without the menu (headless), see: COMMAND --help")
+headless = {
+    "ip": "search information of IP addresses",
+    "domain": "whois data of domains",
+    "phone": "analyze phone numbers (international format)",
+    "user": "find usernames across the websites",
+    "image": "extract the metadata of images",
+    "dork": "Google Dorking queries (custom syntax, e.g. site=\"example.com\"&docs)",
+    "deep": "deep/dark web searches through Tor",
+    "run": "run the jobs of a job file (YAML, JSON or CSV with tool,target and options)"
+}
+for name, description in headless.items():
+    command = commands.add_parser(name, help=description, description=description)
+    if name == "run": command.add_argument("targets", nargs=1, metavar="JOB_FILE")
+    else: command.add_argument("targets", nargs="+", metavar="TARGET")
+    if name in ("user", "dork"): command.add_argument("--tor", action="store_true", help="use the Tor network")
+    if name == "user": command.add_argument("--nsfw", action="store_true", help="include the NSFW websites")
+    if name in ("dork", "deep"): command.add_argument("--results", type=int, default=10, help="results of each search (default: 10)")
+    if name == "deep": command.add_argument("--searcher", type=int, default=1, help="1: Torch, 2: VormWeb, 3: Tordex (default: 1)")
+    command.add_argument("--workers", type=int, default=4, help="max jobs running at the same time (default: 4)")
+    command.add_argument("--processes", action="store_true", help="run the jobs in processes instead of threads")
+    command.add_argument("--out", metavar="FILE", help="JSON Lines file of the results, - for the standard output (default: data/jobs/)")
+
+command = commands.add_parser("serve", help="keep the tools warm behind a local HTTP/JSON API", description="keep the tools warm behind a local HTTP/JSON API")
+command.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+command.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+command.add_argument("--tor", action="store_true", help="verify the Tor connection at startup")
+
+args = parser.parse_args()
+
+if args.output: set_backend(args.output)
+if args.probe_url: ma_command.probe_url = args.probe_url
+
+if args.tor_proxy or args.tor_circuits or args.tor_policy:
+    from core import socks_connect
+    if args.tor_proxy: socks_connect.tor_proxy = args.tor_proxy
+    if args.tor_circuits: socks_connect.circuits = args.tor_circuits
+    if args.tor_policy: socks_connect.circuit_policy = args.tor_policy
+
+probe_cache.refresh = args.refresh
+if args.cache_ttl is not None: probe_cache.ttl = args.cache_ttl * 3600
+if args.google_rate: rate_limit.rate = args.google_rate / 60
+if args.link_cache is not None:
+    link_cache.persist = True
+    link_cache.ttl = args.link_cache * 3600
+
+if args.quarantined:
+    from core import site_health
+    import time
+
+    sites = site_health.quarantined()
+    if not sites: write_effect(f"{display_validate} There are no quarantined websites {maGreen(happy)}", 0)
+    for site, template, rate, consecutive, error, checked in sites:
+        write_effect(f"{display_extra} {maBold(site)}: {maUnderline(template)}", 0)
+        write_effect(f"    {display_info} Success rate: {maYellow(str(rate) + '%')}, failures in a row: {maRed(consecutive)}, last error: {maRed(error)}, last check: {time.strftime('%Y-%m-%d %H:%M', time.localtime(checked))}", 0)
+    exit()
+
+if args.lookup:
+    from core import results_store
+    import time
+
+    records = results_store.lookup(args.lookup, partial=args.partial)
+    if not records: write_effect(f"{display_question} There are no results stored for {maBold(args.lookup)}", 0)
+    for record in records:
+        write_effect(f"{display_info} {time.strftime('%Y-%m-%d %H:%M', time.localtime(record['created']))} {maBold(record['tool'])}: {maCyan(record['target'])}", 0)
+        for key, value in record["fields"].items():
+            if isinstance(value, list): value = f"{len(value)} items"
+            write_effect(f"    {display_extra} {key}: {maGreen(value)}", 0)
+        for url in record["sources"]: write_effect(f"    {display_extra} {maUnderline(url)}", 0)
+    exit()
+
+if args.render:
+    from core import results_store
+    from core.save_data import show_saved
+
+    content = results_store.render_markdown(args.render)
+    if not content:
+        write_effect(f"{display_question} There are no results stored for {maBold(args.render)}", 0)
+        exit()
+    file = f"data/records_{args.render.replace('/', '_')}.md"
+    with open(file, "w", encoding="utf-8") as out: out.write(content)
+    show_saved(file)
+    exit()
+
+ma_command.start_probe()
+mark("arguments and options")
 
 conditions = "READ_CONDITIONS.txt"
 
@@ -130,7 +308,48 @@ By using this program, you agree that **you are solely responsible** for your ac
 ⚠️ Please use it **ethically**, always respecting applicable laws and the privacy of others.
 """
 
-print('Authentic MAM')
+def run_headless():
+    """
+    Runs the jobs of a headless command (or the service mode) and exits.
+    """
+
+    from core import jobs as runner
+
+    if not os.path.exists(conditions):
+        write_effect(f"{display_error} Run {maBold('python SpyNexus.py')} once and accept the conditions before using the headless commands.", 0.01)
+        exit(1)
+    if not args.output: set_backend("plain")
+
+    if args.command == "serve":
+        from core.service import serve
+        serve(args.host, args.port, args.tor)
+        exit(0)
+
+    if args.command == "run": jobs = runner.read_jobs(args.targets[0])
+    else:
+        options = {key: getattr(args, key) for key in ("tor", "nsfw", "results", "searcher") if hasattr(args, key)}
+        if options.get("tor") is False: del options["tor"]
+        if options.get("nsfw") is False: del options["nsfw"]
+        jobs = [dict(tool=args.command, target=target, **options) for target in args.targets]
+
+    # With --out - the standard output only holds the records, the messages go to the standard error
+    with contextlib.redirect_stdout(sys.stderr) if args.out == "-" else contextlib.nullcontext():
+        online = all(job["tool"] in runner.offline_tools for job in jobs) or check_internet()
+    if not online: exit(1)
+
+    summary = runner.run_jobs(jobs, args.out, max(1, args.workers), args.processes)
+    if args.out != "-":
+        write_effect(f"{display_validate} {summary['ok']} jobs done, {summary['failed']} failed in {summary['seconds']} seconds, results in: {maBold(summary['file'])}", 0.01)
+    exit(0 if not summary["failed"] else 2)
+
+if args.command:
+    try:
+        run_headless()
+    except Exception as err:
+        write_effect(err, 0.01)
+        exit(1)
+
+write_effect('Authentic MAM', 0)
 
 SpyNexus = """
              _____             _   __
@@ -186,10 +405,10 @@ icon = """                               +@+ @@@@@@@@@@@- +@<
 
 def show_main():
     launch("clear")
-    prRed(SpyNexus)
-    prRed(icon)
-    print(f"{backRed('THE NETWORK OF ESPIONAGE AND INFORMATION ANALYSIS')}: {maGreen('SpyNexus')}")
-    print(f'\nCreated and Developed by: {maGreen("l-craft-l")}\n{maBold("GitHub")}: {maUnderline("https://github.com/l-craft-l")}\n{maBold("Repository")}: {maUnderline("https://github.com/l-craft-l/SpyNexus")}')
+    write_effect(maRed(SpyNexus), 0)
+    write_effect(maRed(icon), 0)
+    write_effect(f"{backRed('THE NETWORK OF ESPIONAGE AND INFORMATION ANALYSIS')}: {maGreen('SpyNexus')}", 0)
+    write_effect(f'\nCreated and Developed by: {maGreen("l-craft-l")}\n{maBold("GitHub")}: {maUnderline("https://github.com/l-craft-l")}\n{maBold("Repository")}: {maUnderline("https://github.com/l-craft-l/SpyNexus")}', 0)
 
 def make_conditions():
     if not os.path.exists(conditions):
@@ -207,7 +426,8 @@ write_effect(maRed(SpyNexus), 0.005)
 write_effect(maRed(icon), 0.0005)
 write_effect(f'{backRed("THE NETWORK OF ESPIONAGE AND INFORMATION ANALYSIS")}: {maGreen("SpyNexus")}', 0.05)
 
-print(f'\nCreated and Developed by: {maGreen("l-craft-l")}\n{maBold("GitHub")}: {maUnderline("https://github.com/l-craft-l")}\n{maBold("Repository")}: {maUnderline("https://github.com/l-craft-l/SpyNexus")}')
+write_effect(f'\nCreated and Developed by: {maGreen("l-craft-l")}\n{maBold("GitHub")}: {maUnderline("https://github.com/l-craft-l")}\n{maBold("Repository")}: {maUnderline("https://github.com/l-craft-l/SpyNexus")}', 0)
+if args.timing: timing_report()
 
 def cont_spy():
     option = str(input(f"\n{display_question} Do you want to continue? ({maGreen('y')}/{maRed('n')}): "))
@@ -234,7 +454,7 @@ def main():
                 'Exit'
             ]
 
-            print()
+            blank_line()
             for i, txt in enumerate(all_commands, start=1):
                 write_effect(f"{maRed('[')}{maBold(i)}{maRed(']')}: {maRed(txt)}", 0.005)
 
@@ -243,6 +463,7 @@ def main():
 
                 if elec == 1:
                     wait_out(2)
+                    import requests
                     from core.socks_connect import get_tor_connection
                     select_agent = agents()
                     try:
@@ -254,7 +475,7 @@ def main():
                     if response.status_code == 200:
                         final_ip = response.json().get("ip")
                         write_effect(f'\n{display_info} Your actual IP Address is: {maGreen(final_ip)}', 0.02)
-                        print()
+                        blank_line()
                         search_ip(final_ip)
                     cont_spy()
 
@@ -262,13 +483,13 @@ def main():
                 elif elec == 2:
                     show_icon("icons/tl_ip", maBlue, maTeal)
 
-                    print(f"{display_info} Enter a IP Address like: 127.0.0.1")
+                    write_effect(f"{display_info} Enter a IP Address like: 127.0.0.1", 0)
 
                     ip_address = input(f'\n×××{maRed("[")}{maBold("SPY-IP")}{maRed("]")}---> ').strip()
                     if not ip_address: raise Exception(f"{display_error} You can't leave the IP Address empty!")
 
                     wait_out(0.5)
-                    print()
+                    blank_line()
                     search_ip(ip_address)
                     cont_spy()
 
@@ -293,7 +514,7 @@ def main():
                         "Search coordinates (latitude, longitude)",
                         "Search place (example: Washington)"
                     ]
-                    print()
+                    blank_line()
                     for i, item in enumerate(ls_loc, start=1):
                         write_effect(f"{maRed('[')}{maBold(i)}{maRed(']')}: {maRed(item)}", 0.003)
 
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark of the dork compiler (core/dork_parser.py).
+
+Generates a batch of random dorks and measures the uncached parse+render,
+the first (cold) pass through the memoized translate() and a second (warm)
+pass over the same batch.
+
+Usage:
+    python benchmarks/dork_parser_bench.py [number of dorks] [distinct dorks]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import dork_parser
+
+values = ["example.com", "john doe", "admin,login", "report 2024", "jane_doe", "pdf,xls", "secret plans"]
+
+
+def generate(count, distinct, seed=1):
+    rand = random.Random(seed)
+    commands = list(dork_parser.value_commands) + list(dork_parser.keyword_commands)
+
+    pool = []
+    for _ in range(distinct):
+        parts = []
+        for _ in range(rand.randint(1, 6)):
+            name = rand.choice(commands)
+            if name in dork_parser.value_commands: parts.append(f'{name}="{rand.choice(values)}"')
+            else: parts.append(name)
+        pool.append("&".join(parts))
+    return [rand.choice(pool) for _ in range(count)]
+
+
+def measure(label, function, batch):
+    begin = time.perf_counter()
+    for dork in batch: function(dork)
+    took = time.perf_counter() - begin
+    print(f"{label:<22} {took * 1000:9.1f} ms  {len(batch) / took:12,.0f} dorks/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    batch = generate(count, distinct)
+
+    print(f"{count} dorks, {distinct} distinct")
+    measure("parse + render", lambda dork: dork_parser.render(dork_parser.parse(dork)[0]), batch)
+
+    dork_parser.translate.cache_clear()
+    measure("translate (cold)", dork_parser.translate, batch)
+    measure("translate (warm)", dork_parser.translate, batch)
+    print(dork_parser.translate.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark of the streaming head reader (core/head_reader.py) against parsing
+the whole page, on a page with a normal head and a large body.
+
+Usage:
+    python benchmarks/head_reader_bench.py [size of the body in MB]
+"""
+
+import os
+import sys
+import time
+from html.parser import HTMLParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import head_reader
+
+
+class Response:
+    """
+    Stand-in of a streamed requests.Response over an in-memory page.
+    """
+
+    def __init__(self, body, kind="text/html; charset=utf-8"):
+        self.body = body
+        self.headers = {"Content-Type": kind}
+        self.read = 0
+
+    def iter_content(self, size):
+        for start in range(0, len(self.body), size):
+            chunk = self.body[start:start + size]
+            self.read += len(chunk)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+def build_page(megabytes):
+    head = '<html><head><meta charset="utf-8"><title>Quarterly report</title>' + '<link rel="stylesheet" href="/s.css">' * 40
+    head += '<meta name="description" content="Results of the quarter"></head><body>'
+    row = '<div class="row"><a href="/item">item</a><p>Lorem ipsum dolor sit amet</p></div>\n'
+    return (head + row * (megabytes * 1024 * 1024 // len(row)) + "</body></html>").encode()
+
+
+def measure(label, function):
+    begin = time.perf_counter()
+    read = function()
+    took = time.perf_counter() - begin
+    print(f"{label:<28} {took * 1000:9.2f} ms  {read:>12,} bytes read")
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    page = build_page(megabytes)
+    print(f"Page of {len(page):,} bytes")
+
+    def full_parse():
+        parser = HTMLParser()
+        parser.feed(page.decode("utf-8"))
+        return len(page)
+
+    def stream(kind="text/html; charset=utf-8"):
+        response = Response(page, kind)
+        head_reader.read_head(response)
+        return response.read
+
+    measure("full parse (html.parser)", full_parse)
+    try:
+        from bs4 import BeautifulSoup
+        measure("full parse (BeautifulSoup)", lambda: BeautifulSoup(page.decode("utf-8"), "html.parser") and len(page))
+    except ModuleNotFoundError:
+        pass
+    measure("streaming head", stream)
+    measure("streaming head, PDF", lambda: stream("application/pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import os
+import time
 import random
+import threading
 from core.display import (
     write_effect, display_error, display_extra, display_info
 )
@@ -20,17 +23,73 @@ default = [
     "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:95.0) Gecko/20100101 Firefox/95.0"
 ]
 
-def agents():
-    try:
-        with open("core/user_agents.txt", "r") as file:
-            lines = file.readlines()
+agents_file = "core/user_agents.txt"
+
+# "random", "round_robin" or "sticky" (same User-Agent for every request to a host)
+strategy = "random"
+check_every = 5
+max_sticky = 10000
+
+pool = {"agents": list(default), "mtime": None, "checked": 0, "next": 0}
+sticky = {}
+lock = threading.Lock()
+
+def refresh():
+    """
+    Loads the User-Agents file into memory, it's only read again when its
+    modification time changes (checked at most every check_every seconds).
+    Must be called with the lock held.
+    """
 
-            user_agent = {'User-Agent': random.choice(lines).strip()}
-            return user_agent
+    now = time.monotonic()
+    if pool["mtime"] is not None and now - pool["checked"] < check_every: return
+    pool["checked"] = now
 
+    try:
+        mtime = os.path.getmtime(agents_file)
     except FileNotFoundError:
-        write_effect("{display_extra} File 'user_agents' don't found...\n{display_info} creating file with user agents...", 0.03)
-        with open("core/user_agents.txt", "a") as file:
+        write_effect(f"{display_extra} File 'user_agents' don't found...\n{display_info} creating file with user agents...", 0.03)
+        with open(agents_file, "a") as file:
             for line in default: file.write(line + '\n')
-        user_agent = {'User-Agent': random.choice(default)}
-        return user_agent
+        mtime = os.path.getmtime(agents_file)
+
+    if mtime == pool["mtime"]: return
+
+    with open(agents_file, "r") as file:
+        lines = [line.strip() for line in file if line.strip()]
+
+    pool["agents"] = lines or list(default)
+    pool["mtime"] = mtime
+    pool["next"] = 0
+    sticky.clear()
+
+def agents(host=None, mode=None):
+    """
+    Picks the headers of the next request from the in-memory User-Agent pool.
+    Safe to call from any thread.
+
+    Parameters:
+        host (str or None): Host of the request, used by the "sticky" strategy.
+        mode (str or None): Rotation strategy for this call, defaults to the module strategy.
+
+    Returns:
+        dict: Headers with the selected User-Agent.
+    """
+
+    mode = mode or strategy
+    with lock:
+        refresh()
+        lines = pool["agents"]
+
+        if mode == "round_robin":
+            user_agent = lines[pool["next"] % len(lines)]
+            pool["next"] += 1
+        elif mode == "sticky" and host:
+            user_agent = sticky.get(host)
+            if user_agent is None:
+                if len(sticky) >= max_sticky: sticky.clear()
+                user_agent = sticky[host] = random.choice(lines)
+        else:
+            user_agent = random.choice(lines)
+
+    return {'User-Agent': user_agent}
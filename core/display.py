@@ -1,5 +1,8 @@
 import time
 import sys
+import re
+import json
+import threading
 
 ########################
 #Colors output#############
@@ -54,10 +57,51 @@ angry = '(⁠╯⁠ರ⁠ ⁠~⁠ ⁠ರ⁠)⁠╯⁠︵⁠ ⁠┻⁠━⁠
 surprised = '(⁠´⁠⊙⁠ω⁠⊙⁠`⁠)!'
 waiting = '(⁠-⁠_⁠-⁠;⁠)⁠・⁠・⁠・'
 
+##output backends
+# "tty": animated, one character at a time (default on a terminal)
+# "plain": whole blocks in a single write, colors removed when not a terminal
+# "jsonl": one JSON object per message, for piping into other tools
+
+ansi = re.compile(r"\033\[[0-9;]*[mK]")
+backend = {"mode": "tty" if sys.stdout.isatty() else "plain"}
+levels = [
+    (display_error, "error"),
+    (display_validate, "ok"),
+    (display_question, "question"),
+    (display_extra, "extra"),
+    (display_info, "info"),
+]
+
+def set_backend(mode):
+    if mode not in ("tty", "plain", "jsonl"):
+        raise Exception(f"{display_error} Unknown output mode '{mode}', use: tty, plain or jsonl")
+    backend["mode"] = mode
+
+def animated():
+    return backend["mode"] == "tty"
+
+def render_plain(text):
+    if not sys.stdout.isatty(): text = ansi.sub("", text)
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+def render_jsonl(text, level=None, **extra):
+    for icon, name in levels:
+        if level: break
+        if icon in text: level = name
+    record = {"level": level or "text", "text": ansi.sub("", text).strip("\n"), "time": round(time.time(), 3)}
+    record.update(extra)
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
 ##write effect
 def write_effect(text, speed):
     if not isinstance(text, str):
         text = str(text)
+
+    if backend["mode"] == "plain": return render_plain(text)
+    if backend["mode"] == "jsonl": return render_jsonl(text)
+
     for letter in text:
         sys.stdout.write(letter)
         sys.stdout.flush()
@@ -66,13 +110,39 @@ def write_effect(text, speed):
 
 
 def wait_out(wait):
+    if not animated(): return
     w_text = f'{maYellow("..........")} {maYellow(waiting)}'
     write_effect(w_text, 0.05)
     time.sleep(wait)
 
+progress_lock = threading.Lock()
+def progress_line(done, total, label="Progress"):
+    with progress_lock:
+        if not animated():
+            if done < total: return
+            if backend["mode"] == "jsonl": return render_jsonl(label, "progress", done=done, total=total)
+            return render_plain(f"{display_info} {label}: {done}/{total}")
+
+        sys.stdout.write(f"\r{display_info} {label}: {maGreen(done)}/{maMagenta(total)}")
+        sys.stdout.flush()
+        if done >= total: print()
+
+def clear_line():
+    if not animated(): return
+    with progress_lock:
+        sys.stdout.write("\r\033[K")
+        sys.stdout.flush()
+
 def space_between():
+    if backend["mode"] == "jsonl": return
+    if backend["mode"] == "plain": return render_plain(maYellow("--------------------------------------------"))
     prYellow("--------------------------------------------")
 
+def blank_line():
+    if backend["mode"] == "jsonl": return
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
 def between_tag(name_tag):
     write_effect(f'\n--------{maSkyBlue(name_tag)}--------\n', 0.005)
 
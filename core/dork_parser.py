@@ -0,0 +1,169 @@
+"""
+Compiler of the custom dork syntax of SpyNexus into Google queries.
+
+    site="example.com"&docs&title="login,admin"
+
+A query is tokenized in one pass (quoted values can hold "&" and ","),
+parsed into a small AST of (command, values) nodes and rendered with a
+dispatch table built once at import, where the keyword commands (docs, pass,
+breach...) are already pre-rendered. translate() is memoized, so repeated
+dorks of a batch cost a dictionary lookup.
+"""
+
+import re
+from functools import lru_cache
+from core.display import display_error, maBold
+
+cache_size = 4096
+
+all_pass = ['password', 'passwd', 'admin_password', 'user_password',
+'login_password', 'contraseña', 'contrasena', 'clave']
+
+all_email = ['email', 'e-mail', 'correo', '@gmail.com', '@hotmail.com',
+'@protonmail.com', '@yahoo.com', '@outlook.com', '@edu', '@gov']
+
+all_ph = ['phone', 'phone number', 'mobile', 'telefono', 'movil', 'celular',
+'numero', 'contacto']
+
+all_adr = ['address', 'billing address', 'shipping address', 'direccion',
+'residencia', 'ubicacion', 'direccion postal']
+
+all_doc = ['pdf', 'txt', 'xlsx', 'docx', 'pptx', 'json', 'log', 'xls', 'sql', 'env', 'db', 'bak',
+'xml', 'csv', 'ini', 'yml', 'conf']
+
+all_cf = ['ini', 'json', 'conf', 'csv', 'xml', 'sql', 'env', 'db', 'bak']
+
+possible_breaches = ['admin', 'phpMyAdmin', 'DB_PASSWORD', 'cpanel',
+'dashboard', 'adminpanel', 'administrator', 'admin/login', 'config.php', '.env',
+'wp-admin', 'login.php', 'root', 'index of /admin', 'ftp', 'ssh']
+
+all_db = ['database', 'sql dump', 'mysql', 'postgres', 'mongodb', 'oracle',
+'DB_USER', 'DB_HOST', 'DB_NAME']
+
+all_ky = ['api_key', 'api-token', 'secret', 'client_secret', 'private_key',
+'auth_token', 'access_token', 'github_token']
+
+all_sn = ['confidential', 'internal use only', 'do not distribute', 'restricted',
+'private', 'classified', 'sensitive', 'top secret', 'confidencial', 'clasificado',
+'restringido', 'privado', 'no distribuir', 'sensible']
+
+all_idx = ['index of /admin', 'index of /backup', 'index of /private', 'index of /db',
+'index of /ftp', 'index of /documents']
+
+all_ivc = ['invoice', 'invoice number', 'total amount', 'quote', 'quotation',
+'factura']
+
+all_ctr = ['confidential contract', 'service level agreement', 'contract between',
+'license agreement', 'memorandum of understanding', 'contrato confidencial',
+'contrato']
+
+all_cv = ['curriculum', 'curriculum vitae', 'resume', 'CV', 'CV of', 'contact',
+'hoja de vida']
+
+# command=value: template of each value, the values are joined with OR
+value_commands = {
+    "site": ' site:"{}" ',
+    "title": ' intitle:"{}" ',
+    "url": ' inurl:"{}" ',
+    "descr": ' intext:"{}" ',
+    "rel": ' related:"{}" ',
+    "a_title": ' allintitle:"{}" ',
+    "a_url": ' allinurl:"{}" ',
+    "a_descr": ' allintext:"{}" ',
+    "loc": ' location:"{}" ',
+    "auth": ' inauthor:"{}" ',
+    "src": ' source:"{}" ',
+    "cache": ' cache:"{}" ',
+    "kword": ' "{}" ',
+    "doc": ' filetype:{} ',
+}
+
+# command alone: template and list of values
+keyword_commands = {
+    "dbase": (' inurl:"{}" ', all_db),
+    "breach": (' inurl:"{}" ', possible_breaches),
+    "index": (' intitle:"{}" ', all_idx),
+    "pass": (' "{}" ', all_pass),
+    "email": (' "{}" ', all_email),
+    "phone": (' "{}" ', all_ph),
+    "adr": (' "{}" ', all_adr),
+    "keys": (' "{}" ', all_ky),
+    "leak": (' "{}" ', all_sn),
+    "invoice": (' "{}" ', all_ivc),
+    "contr": (' "{}" ', all_ctr),
+    "cv": (' "{}" ', all_cv),
+    "docs": (' filetype:{} ', all_doc),
+    "conf": (' filetype:{} ', all_cf),
+}
+
+def render_values(template, values):
+    return "OR".join(template.format(value) for value in values)
+
+# Dispatch table: command -> (needs a value, template or pre-rendered text)
+dispatch = {name: (True, template) for name, template in value_commands.items()}
+dispatch.update({name: (False, render_values(template, values)) for name, (template, values) in keyword_commands.items()})
+
+# A part is a run of quoted strings (unterminated at the end too) and characters other than & and "
+part_re = re.compile(r'(?:"[^"]*"?|[^&"]+)+')
+
+
+def tokenize(dork_query):
+    """
+    Splits a dork into (command, value) tokens, value is None when the part has no "=".
+    """
+
+    for match in part_re.finditer(dork_query):
+        part = match.group().strip()
+        if not part: continue
+        name, equals, value = part.partition("=")
+        yield name.strip().lower(), value.strip().strip('" ') if equals else None
+
+
+def parse(dork_query):
+    """
+    Parses a dork into its AST.
+
+    Returns:
+        tuple: (tuple of (command, values) nodes, tuple of error messages)
+    """
+
+    nodes = []
+    errors = []
+    for name, value in tokenize(dork_query):
+        entry = dispatch.get(name)
+        if entry is None:
+            errors.append(f"{display_error} Unknown command {maBold(name)}, it was left out of the search.")
+            continue
+
+        needs_value = entry[0]
+        if needs_value and value is None: errors.append(f"{display_error} Error, the command '{name}' can't be empty!")
+        elif needs_value and not value: errors.append(f"{display_error} You can't leave the command '{name}' empty!")
+        elif needs_value: nodes.append((name, tuple(item.strip() for item in value.split(","))))
+        else: nodes.append((name, None))
+
+    return tuple(nodes), tuple(errors)
+
+
+def render(nodes):
+    """
+    Renders an AST into the final Google query.
+    """
+
+    final_search = []
+    for name, values in nodes:
+        needs_value, template = dispatch[name]
+        final_search.append(render_values(template, values) if needs_value else template)
+    return "".join(final_search)
+
+
+@lru_cache(maxsize=cache_size)
+def translate(dork_query):
+    """
+    Compiles a dork into the final Google query, memoized.
+
+    Returns:
+        tuple: (final query, empty if nothing valid was given, tuple of error messages)
+    """
+
+    nodes, errors = parse(dork_query)
+    return render(nodes), errors
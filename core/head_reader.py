@@ -0,0 +1,130 @@
+"""
+Streaming reader of the title and meta description of a page.
+
+The dork and deep search results only need the <head> of a page, but
+parsing response.text downloads the whole body first (multi-megabyte PDFs and
+pages included). Here the body of a streamed response (stream=True) is read
+in chunks and fed to an incremental HTML parser that stops at </head> (or
+<body>), once the title and description are known, or at a byte cap.
+Responses that aren't HTML are skipped from their headers without reading
+the body.
+"""
+
+import codecs
+from html.parser import HTMLParser
+
+chunk_size = 8192
+max_head_bytes = 128 * 1024
+# With a text to look for, the body is read further, up to this cap
+max_match_bytes = 1024 * 1024
+
+html_types = ("text/html", "application/xhtml+xml")
+
+
+class HeadParser(HTMLParser):
+    """
+    Incremental parser that keeps the title and meta description, done is set
+    once both are found or the head is over.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.title = None
+        self.description = None
+        self.in_title = False
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title" and self.title is None:
+            self.in_title = True
+            self.title = ""
+        elif tag == "meta" and self.description is None:
+            values = dict(attrs)
+            if (values.get("name") or "").lower() == "description": self.description = values.get("content") or ""
+        elif tag == "body":
+            self.done = True
+        self.check()
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "title": self.in_title = False
+        elif tag == "head": self.done = True
+        self.check()
+
+    def handle_data(self, data):
+        if self.in_title: self.title += data
+
+    def check(self):
+        if self.title is not None and not self.in_title and self.description is not None: self.done = True
+
+
+def content_type(response):
+    return (response.headers.get("Content-Type") or "").lower()
+
+
+def is_html(response):
+    """
+    Returns:
+        bool: Whether the response is HTML, a response without Content-Type is tried as HTML.
+    """
+
+    kind = content_type(response).split(";")[0].strip()
+    return not kind or kind in html_types
+
+
+def get_decoder(response):
+    charset = "utf-8"
+    for param in content_type(response).split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip() == "charset" and value.strip(): charset = value.strip().strip('"\'')
+    try:
+        return codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def read_head(response, needle=None):
+    """
+    Reads the title and meta description of a streamed response and closes it.
+
+    Parameters:
+        response (requests.Response): Response requested with stream=True.
+        needle (str or None): Text that has to be in the page, the body is then
+                              read up to max_match_bytes looking for it.
+
+    Returns:
+        tuple: (title or None, description or None, whether the needle was found,
+               always True without a needle and False for the non HTML pages)
+    """
+
+    if not is_html(response):
+        response.close()
+        return None, None, needle is None
+
+    parser = HeadParser()
+    decoder = get_decoder(response)
+    found = needle is None
+    limit = max_head_bytes if found else max_match_bytes
+    tail = ""
+    read = 0
+
+    try:
+        for chunk in response.iter_content(chunk_size):
+            read += len(chunk)
+            text = decoder.decode(chunk)
+
+            if not parser.done: parser.feed(text)
+            if not found:
+                window = tail + text
+                found = needle in window
+                tail = window[-len(needle):]
+
+            if (parser.done and found) or read >= limit: break
+        if not parser.done: parser.feed(decoder.decode(b"", final=True))
+    finally:
+        response.close()
+
+    title = parser.title.strip() if parser.title else None
+    return title or None, parser.description, found
@@ -0,0 +1,165 @@
+"""
+Headless runner of the tools, used by the subcommands of SpyNexus.py.
+
+A job is a dict with the tool, the target and the options of the tool, e.g.
+{"tool": "user", "target": "john_doe", "nsfw": true}. Jobs come from the
+command line or from a job file (YAML, JSON, JSON Lines or CSV with a header)
+and are run through a thread or process pool, with a cap of jobs of the same
+tool running at the same time. Every finished job is written right away as a
+JSON line: job number, tool, target, ok, seconds and the fields and sources
+found (or the error).
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import threading
+import contextlib
+import importlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from core.scheduler import stream_queue
+from core.display import display_error, maBold, ansi, progress_line
+
+tools = {
+    "ip": "tools.ip_search",
+    "domain": "tools.data_web",
+    "phone": "tools.track_phone",
+    "user": "tools.user_search",
+    "image": "tools.metadata_img",
+    "dork": "tools.g_dorking",
+    "deep": "tools.deep_search",
+}
+
+max_workers = 4
+default_limit = 4
+# Google blocks parallel dorks quickly and every user search already runs its own pool
+tool_limits = {"dork": 1, "user": 1, "deep": 2}
+# Tools that work without an internet connection
+offline_tools = ("image", "phone")
+
+
+def coerce(value):
+    text = value.strip()
+    if text.lower() in ("true", "yes", "y"): return True
+    if text.lower() in ("false", "no", "n"): return False
+    if text.isdigit(): return int(text)
+    return text
+
+
+def read_jobs(path):
+    """
+    Reads the jobs of a job file.
+
+    Parameters:
+        path (str): YAML, JSON (list of jobs or {"jobs": [...]}), JSON Lines or CSV file.
+
+    Returns:
+        list: The jobs.
+    """
+
+    ext = os.path.splitext(path)[1].lower()
+    if not os.path.isfile(path): raise Exception(f"{display_error} Error, the job file {maBold(path)} doesn't exist!")
+
+    with open(path, "r", encoding="utf-8") as file:
+        if ext in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ModuleNotFoundError:
+                raise Exception(f"{display_error} Error, PyYAML is needed to read {maBold(path)}: pip install pyyaml")
+            data = yaml.safe_load(file)
+        elif ext == ".json": data = json.load(file)
+        elif ext == ".jsonl": data = [json.loads(line) for line in file if line.strip()]
+        elif ext == ".csv": data = [{key: coerce(value) for key, value in row.items() if key and value} for row in csv.DictReader(file)]
+        else: raise Exception(f"{display_error} Error, unknown type of job file {maBold(path)}, use YAML, JSON or CSV")
+
+    if isinstance(data, dict): data = data.get("jobs", [])
+
+    jobs = []
+    for number, job in enumerate(data or [], start=1):
+        if not isinstance(job, dict) or job.get("tool") not in tools or not job.get("target"):
+            raise Exception(f"{display_error} Error in the job {number} of {maBold(path)}, every job needs a tool ({', '.join(tools)}) and a target")
+        jobs.append(job)
+    return jobs
+
+
+def execute(job):
+    """
+    Runs a single job. It's a module function so it can be sent to a process pool.
+
+    Returns:
+        dict: Record of the job.
+    """
+
+    options = {key: value for key, value in job.items() if key not in ("tool", "target")}
+    record = {"tool": job["tool"], "target": job["target"]}
+    begin = time.time()
+    try:
+        module = importlib.import_module(tools[job["tool"]])
+        fields, sources = module.run_job(str(job["target"]), **options)
+        record.update(ok=True, fields=fields, sources=sources)
+    except Exception as err:
+        record.update(ok=False, error=ansi.sub("", str(err)).strip())
+    record["seconds"] = round(time.time() - begin, 2)
+    return record
+
+
+def reset_child():
+    # The SQLite connections of the parent can't be used after a fork
+    from core import local_db
+    local_db.databases.clear()
+    local_db.databases_lock = threading.Lock()
+
+
+def get_executor(workers, processes):
+    if processes and "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"), initializer=reset_child)
+    return ThreadPoolExecutor(workers)
+
+
+def run_jobs(jobs, out=None, workers=max_workers, processes=False):
+    """
+    Runs the jobs through a pool and writes every record as soon as its job finishes.
+
+    Parameters:
+        jobs (list): The jobs to run.
+        out (str or None): JSON Lines file of the records, "-" for the standard output
+                           (the messages of the tools go to the standard error then).
+        workers (int): Max jobs running at the same time.
+        processes (bool): Use a process pool instead of threads (only where fork is available).
+
+    Returns:
+        dict: Number of jobs "ok" and "failed", the "seconds" taken and the output "file".
+    """
+
+    if out is None:
+        os.makedirs("data/jobs", exist_ok=True)
+        out = f"data/jobs/jobs_{int(time.time())}_results.jsonl"
+    stream = sys.stdout if out == "-" else open(out, "a", encoding="utf-8")
+    # Only the records are written to the standard output, so it can be piped
+    messages = contextlib.redirect_stdout(sys.stderr) if out == "-" else contextlib.nullcontext()
+
+    summary = {"ok": 0, "failed": 0, "seconds": 0, "file": out}
+    queue_jobs = [(job["tool"], (number, job)) for number, job in enumerate(jobs, start=1)]
+    begin = time.time()
+
+    try:
+        with messages, get_executor(workers, processes) as executor:
+            worker = lambda item: (item[0], executor.submit(execute, item[1]).result())
+
+            for event, item, value in stream_queue(queue_jobs, worker, workers, default_limit, limits=tool_limits):
+                if event == "progress":
+                    if out != "-": progress_line(item, value, "Jobs")
+                    continue
+
+                number, record = value
+                summary["ok" if record["ok"] else "failed"] += 1
+                stream.write(json.dumps(dict(job=number, **record), ensure_ascii=False, default=str) + "\n")
+                stream.flush()
+    finally:
+        if stream is not sys.stdout: stream.close()
+
+    summary["seconds"] = round(time.time() - begin, 2)
+    return summary
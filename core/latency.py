@@ -0,0 +1,168 @@
+"""
+Per-host latency history, kept across runs in the local database.
+
+Each request records how long the host took to answer (or that it failed or
+timed out). The history is kept per host and transport ("direct" or "tor"),
+since the same host is far slower through Tor. From the last samples of a
+host its p50/p95 are computed, which give:
+- The timeout of the next requests to that host, instead of a flat 20-30 seconds
+- The order of the jobs, so the historically slow hosts are started first
+
+A timeout widens the next timeout of the host (widen times the time waited),
+so a host that got slower isn't stuck at a timeout that is too short.
+"""
+
+import time
+import threading
+from core.local_db import open_db
+
+max_samples = 50
+min_samples = 3
+factor = 2.5
+min_timeout = 3
+dead_timeout = 5
+widen = 2
+
+pending = []
+stats = {}
+state = {"loaded": False, "ready": False}
+lock = threading.Lock()
+
+schema = """
+CREATE TABLE IF NOT EXISTS latency (
+    host TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    at REAL NOT NULL,
+    transport TEXT NOT NULL DEFAULT 'direct',
+    timed_out INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+index = "CREATE INDEX IF NOT EXISTS latency_transport ON latency (host, transport, at);"
+
+
+def get_db():
+    db = open_db()
+    if not state["ready"]:
+        db.script(schema)
+        # Tables of older versions don't have the transport and timed_out columns
+        columns = [row[1] for row in db.execute("PRAGMA table_info(latency)")]
+        if "transport" not in columns: db.execute("ALTER TABLE latency ADD COLUMN transport TEXT NOT NULL DEFAULT 'direct'")
+        if "timed_out" not in columns: db.execute("ALTER TABLE latency ADD COLUMN timed_out INTEGER NOT NULL DEFAULT 0")
+        db.script(index)
+        state["ready"] = True
+    return db
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def load():
+    """
+    Reads the history of every host and transport and computes its p50/p95
+    and the timeouts since its last answer.
+    """
+
+    samples = {}
+    for host, transport, seconds, ok, timed_out in get_db().execute("SELECT host, transport, seconds, ok, timed_out FROM latency ORDER BY at"):
+        samples.setdefault((host, transport), []).append((seconds, ok, timed_out))
+
+    with lock:
+        stats.clear()
+        for key, values in samples.items():
+            values = values[-max_samples:]
+            good = [sec for sec, ok, _ in values if ok]
+
+            # Timeouts in a row at the end of the history widen the next timeout
+            waited = None
+            for sec, ok, timed_out in reversed(values):
+                if ok or not timed_out: break
+                waited = max(waited or 0, sec)
+
+            stats[key] = {
+                "p50": percentile(good, 50) if good else None,
+                "p95": percentile(good, 95) if good else None,
+                "samples": len(values),
+                "failures": len(values) - len(good),
+                "waited": waited
+            }
+        state["loaded"] = True
+
+
+def get_stats(host, transport="direct"):
+    if not state["loaded"]: load()
+    with lock: return stats.get((host, transport))
+
+
+def timeout_for(host, default, transport="direct"):
+    """
+    Timeout to use for the next request to a host.
+
+    Parameters:
+        host (str): The host key of the request.
+        default (float): Timeout used when there's not enough history.
+        transport (str): "direct" or "tor".
+
+    Returns:
+        float: p95 of the successful requests times the factor (between min_timeout and
+               default), dead_timeout if the host never answered, or default. After a
+               timeout, at least widen times the time waited (up to default).
+    """
+
+    info = get_stats(host, transport)
+    if not info or info["samples"] < min_samples: return default
+
+    timeout = dead_timeout if info["p95"] is None else max(min_timeout, info["p95"] * factor)
+    if info["waited"]: timeout = max(timeout, info["waited"] * widen)
+    return round(min(default, timeout), 2)
+
+
+def slow_first(jobs, transport="direct"):
+    """
+    Sorts (host, item) jobs so the hosts with the highest p95 are started first.
+    """
+
+    def key(job):
+        info = get_stats(job[0], transport)
+        if not info: return 0
+        return info["p95"] if info["p95"] is not None else dead_timeout
+
+    return sorted(jobs, key=key, reverse=True)
+
+
+def record(host, seconds, ok=True, transport="direct", timed_out=False):
+    """
+    Keeps a sample in memory, they are written to disk by save().
+
+    Parameters:
+        host (str): The host key of the request.
+        seconds (float): Time until the answer (or the failure).
+        ok (bool): Whether the host answered.
+        transport (str): "direct" or "tor".
+        timed_out (bool): Whether the request failed by a timeout.
+    """
+
+    with lock: pending.append((host, transport, round(seconds, 3), 1 if ok else 0, 1 if timed_out else 0, time.time()))
+
+
+def save():
+    """
+    Writes the pending samples, trims every host to its last max_samples and reloads the stats.
+    """
+
+    with lock:
+        rows = pending[:]
+        pending.clear()
+    if not rows: return
+
+    db = get_db()
+    db.executemany("INSERT INTO latency (host, transport, seconds, ok, timed_out, at) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    for host, transport in set(row[:2] for row in rows):
+        db.execute(
+            "DELETE FROM latency WHERE host = ? AND transport = ? AND rowid NOT IN (SELECT rowid FROM latency WHERE host = ? AND transport = ? ORDER BY at DESC LIMIT ?)",
+            (host, transport, host, transport, max_samples)
+        )
+    load()
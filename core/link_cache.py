@@ -0,0 +1,144 @@
+"""
+Enrichment cache of the links found by the Google Dork searches, keyed by normalized URL.
+
+The preset batches of multi_search fire many overlapping dorks (site=X,
+site=X&docs, site=X&docs&email...) that return the same pages. A LinkCache
+lives for a whole batch: the title and description (or the error) of every
+normalized URL is kept in memory, so a repeated link is fetched only once,
+and the searches each link came up in are recorded for the report. With
+persist on, the titles and descriptions found are also kept on disk for ttl
+seconds, across runs.
+"""
+
+import time
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from core.local_db import open_db
+
+persist = False
+ttl = 24 * 3600
+
+# Query parameters that only track the click, dropped from the cache key
+tracking_params = ("utm_", "fbclid", "gclid", "msclkid", "srsltid")
+default_ports = {"http": 80, "https": 443}
+
+state = {"ready": False}
+
+schema = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    fetched REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_fetched ON links (fetched);
+"""
+
+
+def get_db():
+    db = open_db()
+    if not state["ready"]:
+        db.script(schema)
+        state["ready"] = True
+    return db
+
+
+def normalize_url(url):
+    """
+    Reduces a URL to the key of the cache: lowercase scheme and host, no
+    default port, fragment, tracking parameters or trailing slash, and the
+    query parameters sorted.
+
+    Parameters:
+        url (str): The link found.
+
+    Returns:
+        str: The normalized URL.
+    """
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != default_ports.get(scheme): host = f"{host}:{parts.port}"
+
+    params = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not key.lower().startswith(tracking_params)]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(sorted(params)), ""))
+
+
+class LinkCache:
+    """
+    Batch-scoped enrichment cache, safe to share between threads.
+
+    Parameters:
+        persistent (bool or None): Also read and write the disk cache, defaults to persist.
+    """
+
+    def __init__(self, persistent=None):
+        self.persistent = persist if persistent is None else persistent
+        self.entries = {}
+        self.found_in = {}
+        self.links = {}
+        self.hits = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns:
+            tuple or None: (kind, value) of the enrichment of the link, None on a miss.
+        """
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+
+        if not self.persistent: return None
+        rows = get_db().execute("SELECT title, description FROM links WHERE url = ? AND fetched >= ?", (key, time.time() - ttl))
+        if not rows: return None
+
+        entry = ("head", tuple(rows[0]))
+        with self.lock:
+            self.entries[key] = entry
+            self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """
+        Stores the (kind, value) enrichment of a link, only the titles and
+        descriptions found go to the disk cache.
+        """
+
+        with self.lock: self.entries[key] = entry
+        if self.persistent and entry[0] == "head":
+            get_db().execute(
+                "INSERT OR REPLACE INTO links (url, title, description, fetched) VALUES (?, ?, ?, ?)",
+                (key, entry[1][0], entry[1][1], time.time())
+            )
+        return entry
+
+    def seen(self, link, search):
+        """
+        Records that a link came up in a search of the batch.
+
+        Returns:
+            list: The other searches of the batch where the link came up before.
+        """
+
+        key = normalize_url(link)
+        with self.lock:
+            self.links.setdefault(key, link)
+            searches = self.found_in.setdefault(key, [])
+            before = [item for item in searches if item != search]
+            if search not in searches: searches.append(search)
+        return before
+
+    def repeated(self):
+        """
+        Returns:
+            list: (link, searches) of every link that came up in more than one search.
+        """
+
+        with self.lock:
+            return [(self.links[key], list(searches)) for key, searches in self.found_in.items() if len(searches) > 1]
@@ -0,0 +1,59 @@
+import os
+import sqlite3
+import threading
+
+default_db = "data/cache/spynexus.db"
+
+databases = {}
+databases_lock = threading.Lock()
+
+
+class Database:
+    """
+    Small thread-safe wrapper around a SQLite file, one connection shared by
+    every thread and protected by a lock.
+
+    Parameters:
+        path (str): Path of the SQLite file, the directory is created if needed.
+    """
+
+    def __init__(self, path):
+        folder = os.path.dirname(path)
+        if folder: os.makedirs(folder, exist_ok=True)
+
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def execute(self, sql, args=()):
+        with self.lock:
+            return self.conn.execute(sql, args).fetchall()
+
+    def executemany(self, sql, rows):
+        with self.lock:
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.executemany(sql, rows)
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def script(self, sql):
+        with self.lock:
+            self.conn.executescript(sql)
+
+
+def open_db(path=default_db):
+    """
+    Returns the shared Database of the given path, opening it the first time.
+    """
+
+    with databases_lock:
+        db = databases.get(path)
+        if db is None:
+            db = Database(path)
+            databases[path] = db
+        return db
@@ -1,17 +1,88 @@
-import requests
+import time
+import threading
 from core.display import display_error, write_effect, maRed
 from subprocess import run
 
+# Endpoint used to check the connection, the state is kept for online_ttl
+# seconds (offline_ttl when there's no connection) and refreshed in background.
+probe_url = "https://google.com"
+probe_timeout = 5
+online_ttl = 120
+offline_ttl = 15
+
+connectivity = {}
+connectivity_lock = threading.Lock()
+
 def launch(cmd):
     try:
         return run(cmd, shell=True, capture_output=False)
     except Exception as err:
         raise Exception(f"{display_error} Fatal error has ocurred... {maRed(err)}")
 
-def check_internet(url="https://google.com"):
+def probe(url):
+    import requests
     try:
-        requests.get(url, timeout=5)
+        requests.head(url, timeout=probe_timeout)
+        online = True
     except Exception:
+        online = False
+
+    with connectivity_lock:
+        state = connectivity[url]
+        state["online"] = online
+        state["checked"] = time.monotonic()
+        state["probing"] = False
+        state["ready"].set()
+
+def start_probe(url=None):
+    """
+    Starts a background check of the connection, unless one is already running.
+    """
+
+    url = url or probe_url
+    with connectivity_lock:
+        state = connectivity.setdefault(url, {"online": None, "checked": 0, "probing": False, "ready": threading.Event()})
+        if state["probing"]: return state
+        state["probing"] = True
+
+    threading.Thread(target=probe, args=(url,), daemon=True).start()
+    return state
+
+def is_online(url=None):
+    """
+    Checks the connection right now and updates the shared state, without
+    showing anything.
+
+    Returns:
+        bool: Whether the probe endpoint answered.
+    """
+
+    url = url or probe_url
+    with connectivity_lock:
+        state = connectivity.setdefault(url, {"online": None, "checked": 0, "probing": False, "ready": threading.Event()})
+        state["probing"] = True
+
+    probe(url)
+    return state["online"]
+
+def check_internet(url=None):
+    """
+    Returns the shared connectivity state right away. The first call waits for
+    the probe, afterwards an expired state is returned as it is while a
+    background probe refreshes it, so being offline fails fast every time.
+    """
+
+    url = url or probe_url
+    with connectivity_lock:
+        state = connectivity.get(url)
+
+    if state is None or state["online"] is None:
+        state = start_probe(url)
+        state["ready"].wait(probe_timeout + 1)
+    elif time.monotonic() - state["checked"] > (online_ttl if state["online"] else offline_ttl):
+        start_probe(url)
+
+    if not state["online"]:
         write_effect(f"{display_error} No connection detected... Try again later.", 0.05)
         return False
 
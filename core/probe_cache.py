@@ -0,0 +1,93 @@
+"""
+Persistent cache of the user search probes, keyed by (site, username).
+
+Every probe stores its status code, classification, final URL and the time it
+was made, so a search repeated within the TTL is answered from disk instead of
+the network. The cache is bounded: once it has more than max_entries rows the
+oldest ones are evicted.
+"""
+
+import time
+from core.local_db import open_db
+
+ttl = 6 * 3600
+max_entries = 50000
+evict_every = 500
+
+refresh = False
+
+state = {"puts": 0, "ready": False}
+
+schema = """
+CREATE TABLE IF NOT EXISTS probes (
+    site TEXT NOT NULL,
+    username TEXT NOT NULL,
+    status INTEGER,
+    result TEXT,
+    url TEXT,
+    checked REAL NOT NULL,
+    PRIMARY KEY (site, username)
+);
+CREATE INDEX IF NOT EXISTS probes_checked ON probes (checked);
+"""
+
+
+def get_db():
+    db = open_db()
+    if not state["ready"]:
+        db.script(schema)
+        state["ready"] = True
+    return db
+
+
+def get(site, username):
+    """
+    Looks up a probe made within the TTL.
+
+    Parameters:
+        site (str): Name of the website.
+        username (str): The username searched.
+
+    Returns:
+        dict or None: status, result, url and checked of the probe, None on a miss
+                      or when the cache is bypassed with --refresh.
+    """
+
+    if refresh: return None
+
+    rows = get_db().execute(
+        "SELECT status, result, url, checked FROM probes WHERE site = ? AND username = ? AND checked >= ?",
+        (site, username, time.time() - ttl)
+    )
+    if not rows: return None
+
+    status, result, url, checked = rows[0]
+    return {"status": status, "result": result, "url": url, "checked": checked}
+
+
+def put(site, username, status, result, url):
+    """
+    Stores the outcome of a probe, result is None when the user wasn't found.
+    """
+
+    db = get_db()
+    db.execute(
+        "INSERT OR REPLACE INTO probes (site, username, status, result, url, checked) VALUES (?, ?, ?, ?, ?, ?)",
+        (site, username, status, result, url, time.time())
+    )
+
+    state["puts"] += 1
+    if state["puts"] % evict_every == 0: evict()
+
+
+def evict():
+    """
+    Drops the expired probes and, if still over max_entries, the oldest ones.
+    """
+
+    db = get_db()
+    db.execute("DELETE FROM probes WHERE checked < ?", (time.time() - ttl,))
+    db.execute(
+        "DELETE FROM probes WHERE rowid IN (SELECT rowid FROM probes ORDER BY checked DESC LIMIT -1 OFFSET ?)",
+        (max_entries,)
+    )
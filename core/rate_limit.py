@@ -0,0 +1,224 @@
+"""
+Adaptive rate limiter of the search engine queries, shared by the whole session.
+
+Every Google query takes a token from a token bucket (one per page of 10
+results). The bucket refills at the current rate, so a batch of dorks is
+spread out instead of fired at once. On a 429 the limiter backs off: the
+queries stop for an exponential cool-down with jitter (or the Retry-After of
+the reply) and the rate is halved, then it slowly recovers after the queries
+that succeed. The cool-down and the rate are kept in the local database, so
+a new run right after a block doesn't hit Google again at full speed.
+
+delay() and pressure() expose the back-pressure, so the callers can show that
+they are slowing down (or plan around it) before they get blocked.
+"""
+
+import time
+import random
+import threading
+from core.local_db import open_db
+
+rate = 10 / 60
+burst = 3
+min_rate = 1 / 60
+
+base_cooldown = 30
+max_cooldown = 15 * 60
+jitter = 0.25
+
+recover_after = 5
+recover_factor = 1.25
+# Saved state older than this is ignored, the block is surely over
+forget_after = 6 * 3600
+
+schema = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    name TEXT PRIMARY KEY,
+    rate REAL NOT NULL,
+    strikes INTEGER NOT NULL,
+    blocked_until REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+limiters = {}
+limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Token bucket with exponential backoff, safe to share between threads.
+
+    Parameters:
+        name (str): Name of the limiter, key of its saved state.
+        persistent (bool): Load and save the cool-down and rate in the local database.
+    """
+
+    def __init__(self, name, persistent=True):
+        self.name = name
+        self.persistent = persistent
+        self.rate = rate
+        self.strikes = 0
+        self.successes = 0
+        self.blocked_until = 0
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.cond = threading.Condition()
+        if persistent: self.load()
+
+    def load(self):
+        db = open_db()
+        db.script(schema)
+        rows = db.execute("SELECT rate, strikes, blocked_until, updated FROM rate_limits WHERE name = ?", (self.name,))
+        if not rows or time.time() - rows[0][3] > forget_after: return
+
+        self.rate, self.strikes, self.blocked_until, _ = rows[0]
+        self.rate = min(max(self.rate, min_rate), rate)
+        if self.strikes: self.tokens = 1
+
+    def save(self):
+        if not self.persistent: return
+        open_db().execute(
+            "INSERT OR REPLACE INTO rate_limits (name, rate, strikes, blocked_until, updated) VALUES (?, ?, ?, ?, ?)",
+            (self.name, self.rate, self.strikes, self.blocked_until, time.time())
+        )
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Only one query goes out right after a cool-down
+        if self.blocked_until > time.time(): self.tokens = min(self.tokens, 1)
+
+    def wait_for(self, cost):
+        # The bucket never holds more than the burst, a bigger query takes all of it
+        cost = min(cost, burst)
+        self.refill()
+        cooldown = self.blocked_until - time.time()
+        if cooldown > 0: return cooldown
+        if self.tokens >= cost: return 0
+        return (cost - self.tokens) / self.rate
+
+    def delay(self, cost=1):
+        """
+        Parameters:
+            cost (int): Tokens of the query (pages of results), capped to the burst.
+
+        Returns:
+            float: Seconds until a query of the given cost can be sent.
+        """
+
+        with self.cond: return self.wait_for(cost)
+
+    def pressure(self):
+        """
+        Returns:
+            float: 0 with the bucket full, 1 while cooling down or with the bucket empty.
+        """
+
+        with self.cond:
+            if self.blocked_until > time.time(): return 1.0
+            self.refill()
+            return round(1 - self.tokens / burst, 2)
+
+    def acquire(self, cost=1):
+        """
+        Waits until the query can be sent and takes its tokens.
+
+        Parameters:
+            cost (int): Tokens of the query (pages of results), capped to the burst.
+
+        Returns:
+            float: Seconds waited.
+        """
+
+        begin = time.monotonic()
+        with self.cond:
+            while True:
+                wait = self.wait_for(cost)
+                if wait <= 0: break
+                self.cond.wait(wait)
+            self.tokens -= min(cost, burst)
+        return time.monotonic() - begin
+
+    def success(self):
+        """
+        Counts a query that went well, the rate recovers after recover_after of them.
+        """
+
+        with self.cond:
+            self.successes += 1
+            if self.successes < recover_after: return
+            self.successes = 0
+            if self.rate >= rate and not self.strikes: return
+
+            self.rate = min(rate, self.rate * recover_factor)
+            self.strikes = max(0, self.strikes - 1)
+            self.save()
+
+    def blocked(self, retry_after=None):
+        """
+        Backs off after a 429: every query waits the cool-down and the rate is halved.
+
+        Parameters:
+            retry_after (float or None): Seconds asked by the server, used instead of the backoff.
+
+        Returns:
+            float: Seconds of the cool-down.
+        """
+
+        with self.cond:
+            self.strikes += 1
+            self.successes = 0
+            cooldown = retry_after or min(max_cooldown, base_cooldown * 2 ** (self.strikes - 1))
+            cooldown *= 1 + random.uniform(0, jitter)
+
+            self.blocked_until = max(self.blocked_until, time.time() + cooldown)
+            self.rate = max(min_rate, self.rate / 2)
+            self.tokens = 0
+            self.save()
+            self.cond.notify_all()
+            return cooldown
+
+    def state(self):
+        """
+        Returns:
+            dict: Current rate (queries per minute), strikes, seconds of cool-down left and pressure.
+        """
+
+        pressure = self.pressure()
+        with self.cond:
+            return {
+                "per_minute": round(self.rate * 60, 2),
+                "strikes": self.strikes,
+                "cooldown": round(max(0, self.blocked_until - time.time()), 1),
+                "pressure": pressure
+            }
+
+
+def get_limiter(name="google"):
+    """
+    Returns:
+        RateLimiter: The limiter of the name shared by the whole process, loaded the first time.
+    """
+
+    with limiters_lock:
+        limiter = limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(name)
+            limiters[name] = limiter
+        return limiter
+
+
+def retry_after(err):
+    """
+    Returns:
+        float or None: Seconds of the Retry-After header of the reply of an HTTP error.
+    """
+
+    response = getattr(err, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
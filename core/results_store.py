@@ -0,0 +1,114 @@
+"""
+Structured store of every result found by the tools, next to the Markdown reports.
+
+Each finding is saved as a typed record (tool, target, time, fields and source
+URLs) in an indexed SQLite file, so questions like "have we already looked at
+this IP/handle/domain?" are a query instead of a grep over data/. The Markdown
+of a target can be rendered back from its records with render_markdown().
+"""
+
+import json
+import time
+from core.local_db import open_db
+
+results_db = "data/results.db"
+
+state = {"ready": False}
+
+schema = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    tool TEXT NOT NULL,
+    target TEXT NOT NULL,
+    created REAL NOT NULL,
+    fields TEXT NOT NULL,
+    sources TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_target ON records (target COLLATE NOCASE, created);
+CREATE INDEX IF NOT EXISTS records_tool ON records (tool, target COLLATE NOCASE);
+"""
+
+
+def get_db():
+    db = open_db(results_db)
+    if not state["ready"]:
+        db.script(schema)
+        state["ready"] = True
+    return db
+
+
+def add(tool, target, fields, sources=None):
+    """
+    Saves a record, values that aren't JSON (dates, objects) are stored as text.
+
+    Parameters:
+        tool (str): Tool that made the finding (ip, domain, phone, location, user, image, dork, deep).
+        target (str): What was searched (IP, domain, username, query...).
+        fields (dict): Data found.
+        sources (list or None): URLs the data comes from.
+    """
+
+    get_db().execute(
+        "INSERT INTO records (tool, target, created, fields, sources) VALUES (?, ?, ?, ?, ?)",
+        (tool, str(target), time.time(), json.dumps(fields, ensure_ascii=False, default=str), json.dumps(sources or [], ensure_ascii=False))
+    )
+
+
+def to_dict(row):
+    id, tool, target, created, fields, sources = row
+    return {"id": id, "tool": tool, "target": target, "created": created, "fields": json.loads(fields), "sources": json.loads(sources)}
+
+
+def like_escape(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def lookup(target, tool=None, partial=False):
+    """
+    Returns the records of a target (case insensitive), newest first.
+
+    Parameters:
+        target (str): What was searched.
+        tool (str or None): Only the records of this tool.
+        partial (bool): Match targets containing the text instead of the exact target.
+    """
+
+    sql = "SELECT id, tool, target, created, fields, sources FROM records WHERE "
+    # LIKE is already case insensitive, the wildcards of the target are matched literally
+    sql += "target LIKE ? ESCAPE '\\'" if partial else "target = ? COLLATE NOCASE"
+    args = [f"%{like_escape(target)}%" if partial else target]
+    if tool:
+        sql += " AND tool = ?"
+        args.append(tool)
+    sql += " ORDER BY created DESC"
+
+    return [to_dict(row) for row in get_db().execute(sql, args)]
+
+
+def render_markdown(target, tool=None):
+    """
+    Renders the records of a target as a Markdown report.
+
+    Returns:
+        str: The Markdown content, empty if there are no records.
+    """
+
+    records = lookup(target, tool)
+    if not records: return ""
+
+    lines = [f"# <center>🗃️ Records of {target}</center>", "---"]
+    for record in reversed(records):
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record["created"]))
+        lines.append(f"\n### {record['tool']} — {when}")
+
+        for key, value in record["fields"].items():
+            if isinstance(value, list):
+                lines.append(f"- **{key}**:")
+                for item in value:
+                    if isinstance(item, dict): item = ", ".join(f"{k}: {v}" for k, v in item.items())
+                    lines.append(f"    - {item}")
+            else: lines.append(f"- **{key}**: {value}")
+
+        for url in record["sources"]: lines.append(f"- 🔗 <{url}>")
+
+    return "\n".join(lines) + "\n"
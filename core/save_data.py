@@ -1,17 +1,40 @@
 import os
+import time
+import queue
 import datetime
+import threading
+from contextlib import contextmanager
 from core.display import (
     maGreen, maBold, display_validate, pointing, maMagenta, write_effect, display_info,
     maUnderline
 )
 
 date = datetime.datetime.now()
+
+flush_size = 65536
+flush_every = 1.0
+
+open_reports = {}
+reports_lock = threading.Lock()
+
+def generated_header():
+    return f'> 📂 File generated by SpyNexus\n> 🛠️ Creator and developer: [l-craft-l](https://github.com/l-craft-l)\n> 📅 Date this file was created: **{date}**\n\n---\n\n'
+
+def show_saved(file):
+    write_effect(f"\n{display_validate} Saved successfully the info in: '{maBold(file)}' {maMagenta(pointing)}", 0.05)
+    if file.endswith(".md"): write_effect(f"{display_info} This it seems a {maBold('Markdown file')}, you can see his content on this website:\n{display_info} {maBold('Stackedit.io')}: {maUnderline('https://stackedit.io/app#')}", 0.003)
+
 def save_data(file, title, text, pr, show):
-    generated_spy_nexus = f'> 📂 File generated by SpyNexus\n> 🛠️ Creator and developer: [l-craft-l](https://github.com/l-craft-l)\n> 📅 Date this file was created: **{date}**\n\n---\n\n'
+    writer = open_reports.get(os.path.abspath(file))
+    if writer:
+        writer.save(title, text)
+        # Shown by close(), once the data is on disk
+        if show: writer.show = True
+        return
 
     if not os.path.exists(file):
         with open(file, pr) as file_data:
-            file_data.write(generated_spy_nexus)
+            file_data.write(generated_header())
 
     with open(file, pr) as file_data:
         if title:
@@ -19,6 +42,100 @@ def save_data(file, title, text, pr, show):
         if text:
             file_data.write(text + '\n')
 
-    if show:
-        write_effect(f"\n{display_validate} Saved successfully the info in: '{maBold(file)}' {maMagenta(pointing)}", 0.05)
-        if file.endswith(".md"): write_effect(f"{display_info} This it seems a {maBold('Markdown file')}, you can see his content on this website:\n{display_info} {maBold('Stackedit.io')}: {maUnderline('https://stackedit.io/app#')}", 0.003)
+    if show: show_saved(file)
+
+
+class ReportWriter:
+    """
+    Writes a whole report through a single open file.
+
+    Every write goes through one writer thread that appends to the report in
+    buffered chunks, flushed on size or time, so the writes are never
+    interleaved and a killed run only loses its last second of output. The
+    "saved" message asked while the report is open is shown by close(), after
+    the last chunk is written.
+
+    Parameters:
+        file (str): Path of the report.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.users = 0
+        self.show = False
+
+        folder = os.path.dirname(file) or "."
+        os.makedirs(folder, exist_ok=True)
+
+        new = not os.path.exists(file)
+        self.out = open(file, "a", encoding="utf-8")
+        if new:
+            self.out.write(generated_header())
+            self.out.flush()
+
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def save(self, title, text):
+        if title: self.queue.put(title + '\n')
+        if text: self.queue.put(text + '\n')
+
+    def run(self):
+        buffer = []
+        size = 0
+        last = time.monotonic()
+
+        while True:
+            try:
+                data = self.queue.get(timeout=flush_every)
+            except queue.Empty:
+                data = ""
+            if data is None: break
+
+            if data:
+                buffer.append(data)
+                size += len(data)
+
+            now = time.monotonic()
+            if buffer and (size >= flush_size or now - last >= flush_every):
+                self.out.write("".join(buffer))
+                self.out.flush()
+                buffer, size, last = [], 0, now
+
+        if buffer: self.out.write("".join(buffer))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.out.close()
+        if self.show: show_saved(self.file)
+
+
+@contextmanager
+def report(file):
+    """
+    Opens (or joins, if it's already open) the ReportWriter of a file. While it's
+    open every save_data() call for that file goes through the writer, so the
+    tools and the modules they call share the same single open file.
+
+    Usage:
+        with report(file):
+            save_data(file, title, text, "a", False)
+    """
+
+    key = os.path.abspath(file)
+    with reports_lock:
+        writer = open_reports.get(key)
+        if writer is None:
+            writer = open_reports[key] = ReportWriter(file)
+        writer.users += 1
+
+    try:
+        yield writer
+    finally:
+        with reports_lock:
+            writer.users -= 1
+            last = writer.users == 0
+            if last: del open_reports[key]
+        if last: writer.close()
@@ -0,0 +1,171 @@
+"""
+Shared work-queue scheduler used by the tools that fan out many HTTP probes.
+
+Instead of cutting the work into fixed slices (one slow site then holds up
+everything behind it), every worker pulls the next runnable job from a single
+queue. A job is only handed out when its host is below the per-host cap (and,
+optionally, once the host's rate interval has passed), so a run is bounded by
+the slowest single job and no site gets hammered.
+"""
+
+import threading
+import queue
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+# Second level of the country domains that sell names under it (example.co.uk, example.com.br)
+country_second_levels = {"co", "com", "org", "net", "gov", "edu", "ac", "or", "ne", "go", "gob", "nic", "mil"}
+# Hosting where every subdomain is a different owner (alice.github.io and bob.github.io are unrelated)
+shared_suffixes = {
+    "github.io", "gitlab.io", "blogspot.com", "wordpress.com", "tumblr.com", "substack.com",
+    "wixsite.com", "weebly.com", "ghost.io", "itch.io", "neocities.org", "netlify.app",
+    "vercel.app", "pages.dev", "herokuapp.com", "appspot.com", "firebaseapp.com", "web.app",
+}
+
+
+def host_key(url):
+    """
+    Reduces a URL to the host used for the per-host concurrency caps: its
+    registrable domain ("shop.example.co.uk" -> "example.co.uk"), where the
+    shared hosting suffixes count as public ("alice.github.io" stays apart).
+
+    Sites like "{}.newgrounds.com" put the username in the hostname, so for
+    the templates of the catalogue (before inserting the username) the "{}"
+    label is dropped, every username of a batch then shares the site's cap.
+
+    Parameters:
+        url (str): The full URL of the job, or the template of a site.
+
+    Returns:
+        str: The host key (e.g. "newgrounds.com").
+    """
+
+    host = urlsplit(url).hostname or url
+    labels = host.split(".")
+    if "{}" in labels: return ".".join(labels[labels.index("{}") + 1:])
+    if len(labels) < 3 or host.replace(".", "").isdigit(): return host
+
+    keep = 2
+    if ".".join(labels[-2:]) in shared_suffixes: keep = 3
+    elif len(labels[-1]) == 2 and labels[-2] in country_second_levels: keep = 3
+    return ".".join(labels[-keep:])
+
+
+def run_queue(jobs, worker, workers=20, per_host=2, progress=None, interval=0, limits=None):
+    """
+    Runs every job through a pool of threads pulling from a shared queue.
+
+    Parameters:
+        jobs (list): List of (host, item) tuples, hosts are started in the given order.
+        worker (callable): Function called with each item.
+        workers (int): Number of worker threads.
+        per_host (int): Max jobs running at the same time against one host.
+        progress (callable or None): Called as progress(done, total) after each job.
+        interval (float): Min seconds between two job starts on the same host.
+        limits (dict or None): Cap of specific hosts, overriding per_host.
+
+    Returns:
+        int: Number of jobs that raised an unexpected error.
+    """
+
+    limits = limits or {}
+    pending = {}
+    for host, item in jobs: pending.setdefault(host, deque()).append(item)
+
+    total = len(jobs)
+    active = {}
+    next_start = {}
+    state = {"done": 0, "errors": 0}
+    cond = threading.Condition()
+
+    def take():
+        now = time.monotonic()
+        wait = None
+        for host, items in pending.items():
+            if active.get(host, 0) >= limits.get(host, per_host): continue
+
+            ready = next_start.get(host, 0)
+            if ready > now:
+                wait = ready - now if wait is None else min(wait, ready - now)
+                continue
+
+            item = items.popleft()
+            if not items: del pending[host]
+            active[host] = active.get(host, 0) + 1
+            if interval: next_start[host] = now + interval
+            return (host, item), None
+        return None, wait
+
+    def run():
+        while True:
+            with cond:
+                job = None
+                while pending:
+                    job, wait = take()
+                    if job: break
+                    cond.wait(wait)
+                if not job: return
+
+            host, item = job
+            try:
+                worker(item)
+            except Exception:
+                with cond: state["errors"] += 1
+            finally:
+                with cond:
+                    active[host] -= 1
+                    state["done"] += 1
+                    cond.notify_all()
+                    if progress: progress(state["done"], total)
+
+    thr = []
+    for _ in range(max(1, min(workers, total))):
+        t = threading.Thread(target=run, daemon=True)
+        thr.append(t)
+        t.start()
+    for t in thr: t.join()
+
+    return state["errors"]
+
+
+def stream_queue(jobs, worker, workers=20, per_host=2, interval=0, limits=None):
+    """
+    Same as run_queue, but the jobs run in the background and their outcome is
+    streamed back to the calling thread as soon as each one finishes, so the
+    caller can show and save every result right away.
+
+    Parameters:
+        jobs (list): List of (host, item) tuples, hosts are started in the given order.
+        worker (callable): Function called with each item, a result is streamed if it returns something.
+        workers (int): Number of worker threads.
+        per_host (int): Max jobs running at the same time against one host.
+        interval (float): Min seconds between two job starts on the same host.
+        limits (dict or None): Cap of specific hosts, overriding per_host.
+
+    Yields:
+        tuple: ("result", item, value) for every job that returned a value and
+               ("progress", done, total) after every job.
+    """
+
+    events = queue.Queue()
+
+    def job(item):
+        value = worker(item)
+        if value is not None: events.put(("result", item, value))
+
+    def run():
+        try:
+            run_queue(jobs, job, workers, per_host, lambda done, total: events.put(("progress", done, total)), interval, limits)
+        finally:
+            events.put(None)
+
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+
+    while True:
+        event = events.get()
+        if event is None: break
+        yield event
+
+    runner.join()
@@ -0,0 +1,256 @@
+"""
+Local service mode: the tools behind a small HTTP/JSON API on 127.0.0.1.
+
+The process stays alive between requests, so the tool modules, the site
+catalogues, the geocoder, the keep-alive connection pools, the Tor sessions
+and the caches are loaded once and every request only pays its network time.
+
+Endpoints:
+    GET  /health               status, uptime and requests served
+    GET  /stats                connection reuse, Tor circuits, Google rate limiter and jobs running
+    GET  /lookup?target=X      stored results of a target (&tool=ip, &partial=1)
+    POST /<tool>               run a tool (ip, domain, phone, user, image, dork, deep)
+                               body: {"target": "...", ...options of the tool}
+                               reply: the same record written by the headless runner
+
+Every endpoint but /health needs the token printed at startup in the
+X-SpyNexus-Token header, and the POSTs need "Content-Type: application/json".
+Requests with a Host other than this machine (DNS rebinding) or from a web
+page of another origin are refused, so a website open in the browser can't
+read the stored results or start scans through the service. Only the options
+listed in tool_options (checked against their range) reach the tools.
+"""
+
+import os
+import json
+import time
+import secrets
+import threading
+import importlib
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from core import jobs, results_store
+from core.sessions import SessionPool
+from core.display import write_effect, display_info, display_validate, maBold, maGreen
+
+default_port = 8765
+max_body = 65536
+max_target = 512
+
+token = secrets.token_urlsafe(24)
+token_header = "X-SpyNexus-Token"
+local_hosts = ("127.0.0.1", "localhost", "::1")
+image_types = (".jpg", ".jpeg", ".tif", ".tiff", ".png", ".webp", ".heic")
+
+# Options accepted by every tool: bool, or (lowest, highest) for the numbers
+tool_options = {
+    "user": {"nsfw": bool, "tor": bool, "workers": (1, 40), "per_host": (1, 8)},
+    "dork": {"results": (1, 100), "tor": bool},
+    "deep": {"searcher": (1, 3), "results": (1, 100)},
+}
+
+state = {"started": time.time(), "served": 0, "running": 0, "tor": False}
+state_lock = threading.Lock()
+user_pool = SessionPool()
+limits = {tool: threading.BoundedSemaphore(jobs.tool_limits.get(tool, jobs.default_limit)) for tool in jobs.tools}
+
+
+def warm_up(tor=False):
+    """
+    Loads everything a request would otherwise load on its own.
+    """
+
+    for module in jobs.tools.values(): importlib.import_module(module)
+
+    from tools import user_search, coordinates
+    for ls, main in user_search.get_catalogue(True): user_search.read_catalogue(ls, main)
+    coordinates.get_geocoder()
+
+    if tor:
+        from core.socks_connect import verify_tor
+        verify_tor()
+        state["tor"] = True
+
+
+def local_host(host, port):
+    """
+    Returns:
+        bool: True if the Host header names this machine and the port of the service.
+    """
+
+    if not host: return False
+    try:
+        address = urlsplit(f"//{host}")
+        return address.hostname in local_hosts and (address.port or 80) == port
+    except ValueError:
+        return False
+
+
+def local_origin(origin):
+    """
+    Returns:
+        bool: True if there's no Origin (not a browser) or it's a page of this machine.
+    """
+
+    if not origin: return True
+    return urlsplit(origin).hostname in local_hosts
+
+
+def check_options(tool, body):
+    """
+    Keeps the target and the known options of the tool, checking their types and ranges.
+
+    Parameters:
+        tool (str): Name of the tool.
+        body (dict): Body of the request.
+
+    Returns:
+        dict: The options to run the tool with.
+    """
+
+    target = body.get("target")
+    if not isinstance(target, str) or not target.strip() or len(target) > max_target:
+        raise Exception(f"target is needed (a text of {max_target} characters at most)")
+    if tool == "image" and (not target.lower().endswith(image_types) or not os.path.isfile(target)):
+        raise Exception(f"the target of image must be an image file ({', '.join(image_types)})")
+
+    allowed = tool_options.get(tool, {})
+    unknown = set(body) - set(allowed) - {"target"}
+    if unknown: raise Exception(f"unknown options for {tool}: {', '.join(sorted(unknown))}")
+
+    options = {"target": target.strip()}
+    for key, kind in allowed.items():
+        if key not in body: continue
+        value = body[key]
+        if kind is bool:
+            if not isinstance(value, bool): raise Exception(f"{key} must be true or false")
+        else:
+            lowest, highest = kind
+            if isinstance(value, bool) or not isinstance(value, int) or not lowest <= value <= highest:
+                raise Exception(f"{key} must be a number from {lowest} to {highest}")
+        options[key] = value
+    return options
+
+
+def run_tool(tool, options):
+    job = dict(options, tool=tool)
+    if tool == "user":
+        if options.get("tor"):
+            from core.socks_connect import get_pool
+            job["pool"] = get_pool()
+        else: job["pool"] = user_pool
+
+    with state_lock: state["running"] += 1
+    try:
+        with limits[tool]: return jobs.execute(job)
+    finally:
+        with state_lock:
+            state["running"] -= 1
+            state["served"] += 1
+
+
+def get_stats():
+    stats = {"running": state["running"], "served": state["served"], "user_search": user_pool.stats()}
+    from core import sessions
+    if sessions.shared["pool"]: stats["requests"] = sessions.shared["pool"].stats()
+
+    from core import socks_connect
+    stats["tor_circuits"] = [
+        {"circuit": circuit, "requests": sent, "errors": errors, "bytes": size, "seconds": seconds, "kbps": speed}
+        for circuit, sent, errors, size, seconds, speed in socks_connect.circuit_report()
+    ]
+
+    from core import rate_limit
+    stats["rate_limits"] = {name: limiter.state() for name, limiter in list(rate_limit.limiters.items())}
+    return stats
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "SpyNexus"
+
+    def reply(self, code, data):
+        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def refused(self, path):
+        """
+        Answers the request if it must be refused.
+
+        Returns:
+            bool: True if the request was refused (and already answered).
+        """
+
+        if not local_host(self.headers.get("Host"), self.server.server_address[1]):
+            self.reply(403, {"ok": False, "error": "the Host must be 127.0.0.1, localhost or ::1 with the port of the service"})
+        elif not local_origin(self.headers.get("Origin")):
+            self.reply(403, {"ok": False, "error": "requests from other origins are not allowed"})
+        elif path != "/health" and not secrets.compare_digest(self.headers.get(token_header, ""), token):
+            self.reply(401, {"ok": False, "error": f"the {token_header} header with the token of the service is needed"})
+        else: return False
+        return True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if self.refused(url.path): return
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/health":
+            return self.reply(200, {"ok": True, "uptime": round(time.time() - state["started"], 1), "served": state["served"], "tor": state["tor"]})
+        if url.path == "/stats": return self.reply(200, get_stats())
+        if url.path == "/lookup":
+            if not query.get("target"): return self.reply(400, {"ok": False, "error": "target is needed"})
+            records = results_store.lookup(query["target"], query.get("tool"), query.get("partial") in ("1", "true", "yes"))
+            return self.reply(200, {"ok": True, "records": records})
+        self.reply(404, {"ok": False, "error": "unknown endpoint"})
+
+    def do_POST(self):
+        if self.refused(urlsplit(self.path).path): return
+        if self.headers.get_content_type() != "application/json":
+            return self.reply(415, {"ok": False, "error": "the Content-Type must be application/json"})
+
+        tool = urlsplit(self.path).path.strip("/")
+        if tool not in jobs.tools: return self.reply(404, {"ok": False, "error": f"unknown tool, use: {', '.join(jobs.tools)}"})
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > max_body: return self.reply(413, {"ok": False, "error": "body too large"})
+        try:
+            options = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self.reply(400, {"ok": False, "error": "the body must be JSON"})
+        if not isinstance(options, dict): return self.reply(400, {"ok": False, "error": "the body must be a JSON object"})
+        try:
+            options = check_options(tool, options)
+        except Exception as err:
+            return self.reply(400, {"ok": False, "error": str(err)})
+
+        record = run_tool(tool, options)
+        self.reply(200 if record["ok"] else 422, record)
+
+    def log_message(self, format, *args):
+        write_effect(f"{display_info} {self.address_string()} {format % args}", 0)
+
+
+def serve(host="127.0.0.1", port=default_port, tor=False):
+    """
+    Warms everything up and serves the API until Ctrl+C.
+    """
+
+    write_effect(f"{display_info} Warming up the tools, catalogues and connections...", 0.01)
+    warm_up(tor)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    write_effect(f"{display_validate} SpyNexus service listening on {maBold(f'http://{host}:{port}')} {maGreen('(Ctrl+C to stop)')}", 0.01)
+    write_effect(f"{display_info} Send the header {maBold(f'{token_header}: {token}')} with every request", 0.01)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        user_pool.close()
+        write_effect(f"{display_info} Service stopped after {state['served']} requests.", 0.01)
@@ -0,0 +1,133 @@
+"""
+Pooled keep-alive HTTP sessions for the tools that make many requests.
+
+A SessionPool hands out one requests.Session, shared by every thread, mounted
+on a large connection pool with headers picked once. The worker threads of
+the scheduler come and go on every run, but the session (and its open
+connections) stays, so repeated hosts (many sites share CDNs) reuse the
+TCP+TLS connection instead of doing a new handshake on every request.
+
+The reuse is counted by the adapter itself (requests sent and connections
+opened, the proxied ones included), the connection pools of urllib3 can't be
+read for it since only the last pool_connections hosts are kept.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from core.agents import agents
+
+pool_connections = 100
+# Connections kept open per host, every worker of a run can have its own
+pool_maxsize = 32
+
+
+def counting_pool(pool_class, adapter):
+    """
+    Returns:
+        type: Subclass of the urllib3 connection pool class that counts the connections it opens in the adapter.
+    """
+
+    def new_conn(pool):
+        adapter.count("connections")
+        return pool_class._new_conn(pool)
+    return type(pool_class.__name__, (pool_class,), {"_new_conn": new_conn})
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that counts the requests it sends and the connections it opens,
+    direct or through a proxy.
+    """
+
+    def __init__(self, **kwargs):
+        self.counts = {"requests": 0, "connections": 0}
+        self.counts_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def count(self, key):
+        with self.counts_lock: self.counts[key] += 1
+
+    def counted(self, manager):
+        if not getattr(manager, "counted", False):
+            manager.pool_classes_by_scheme = {scheme: counting_pool(cls, self) for scheme, cls in manager.pool_classes_by_scheme.items()}
+            manager.counted = True
+        return manager
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.counted(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **kwargs):
+        return self.counted(super().proxy_manager_for(proxy, **kwargs))
+
+    def send(self, request, **kwargs):
+        self.count("requests")
+        return super().send(request, **kwargs)
+
+
+class SessionPool:
+    """
+    Hands out a single pooled session shared by every thread, created on
+    first use, so the connection reuse of a whole run can be reported at the end.
+
+    Parameters:
+        proxies (dict or None): Proxies for every session (e.g. the Tor SOCKS proxy).
+        adapter (callable or None): Builds the transport adapter of each session, defaults to a tuned CountingAdapter.
+    """
+
+    def __init__(self, proxies=None, adapter=None):
+        self.proxies = proxies
+        self.adapter = adapter
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def get(self):
+        with self.lock:
+            if self.sessions: return self.sessions[0]
+
+            session = requests.Session()
+            adapter = self.adapter() if self.adapter else CountingAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(agents())
+            if self.proxies: session.proxies = dict(self.proxies)
+
+            self.sessions.append(session)
+            return session
+
+    def stats(self):
+        """
+        Returns:
+            dict: Requests sent, connections opened and requests that reused a connection.
+        """
+
+        sent = opened = 0
+        with self.lock:
+            for session in self.sessions:
+                for adapter in set(session.adapters.values()):
+                    counts = getattr(adapter, "counts", None)
+                    if counts is None: continue
+                    sent += counts["requests"]
+                    opened += counts["connections"]
+        return {"requests": sent, "connections": opened, "reused": max(sent - opened, 0)}
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions: session.close()
+            self.sessions.clear()
+
+
+shared = {"pool": None}
+shared_lock = threading.Lock()
+
+def session():
+    """
+    Returns:
+        requests.Session: Keep-alive session of the process-wide pool, for
+        the single requests made by the tools.
+    """
+
+    with shared_lock:
+        if shared["pool"] is None: shared["pool"] = SessionPool()
+        return shared["pool"].get()
@@ -0,0 +1,152 @@
+"""
+Health ledger of the websites checked by the user search.
+
+Every probe updates the row of its site: successes, failures, consecutive
+failures and the last error (DNS, timeout, 5xx...). A site that fails
+max_failures times in a row is quarantined and skipped, it's only re-tested
+once every retest_after seconds and released as soon as it answers again.
+
+A search run goes through a RunLedger, so a site gets at most one failure per
+run (a batch of usernames doesn't count once per username) and the failures
+are dropped when the connection itself was down.
+"""
+
+import time
+import threading
+import requests
+from core.local_db import open_db
+from core.ma_command import is_online
+
+max_failures = 5
+retest_after = 24 * 3600
+
+# Failures that come from the Tor circuit rather than from the site
+circuit_errors = ("proxy", "timeout")
+
+state = {"ready": False}
+
+schema = """
+CREATE TABLE IF NOT EXISTS site_health (
+    template TEXT PRIMARY KEY,
+    site TEXT NOT NULL,
+    successes INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    consecutive INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    last_check REAL,
+    quarantined INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def get_db():
+    db = open_db()
+    if not state["ready"]:
+        db.script(schema)
+        state["ready"] = True
+    return db
+
+
+def describe(err):
+    """
+    Short name of a request error for the ledger.
+    """
+
+    if isinstance(err, requests.exceptions.Timeout): return "timeout"
+    if isinstance(err, requests.exceptions.ProxyError) or "SOCKS" in str(err): return "proxy"
+    if isinstance(err, requests.exceptions.ConnectionError):
+        text = str(err)
+        if "NameResolution" in text or "Name or service not known" in text or "getaddrinfo" in text: return "dns"
+        return "connection"
+    return type(err).__name__
+
+
+def skip(site):
+    """
+    Returns:
+        bool: True if the site is quarantined and not due for a re-test yet.
+    """
+
+    rows = get_db().execute("SELECT quarantined, last_check FROM site_health WHERE template = ?", (site["template"],))
+    if not rows or not rows[0][0]: return False
+    return time.time() - rows[0][1] < retest_after
+
+
+def record(site, error=None):
+    """
+    Updates the ledger of a site after a probe.
+
+    Parameters:
+        site (dict): Entry of the website, "template" is the url before inserting the nickname.
+        error (str or None): Description of the failure, None if the site answered fine.
+    """
+
+    ok = 0 if error else 1
+    get_db().execute(
+        """INSERT INTO site_health (template, site, successes, failures, consecutive, last_error, last_check, quarantined)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (template) DO UPDATE SET
+            site = excluded.site,
+            successes = successes + excluded.successes,
+            failures = failures + excluded.failures,
+            consecutive = CASE WHEN excluded.successes THEN 0 ELSE consecutive + 1 END,
+            last_error = COALESCE(excluded.last_error, last_error),
+            last_check = excluded.last_check,
+            quarantined = CASE WHEN excluded.successes THEN 0 ELSE consecutive + 1 >= ? END""",
+        (site["template"], site["site"], ok, 1 - ok, 1 - ok, error, time.time(), 0, max_failures)
+    )
+
+
+class RunLedger:
+    """
+    Health records of a single search run. The successes are written right
+    away, the failures are kept (one per site) and only written by flush(),
+    once the connection is known to be up. Through Tor the proxy errors and
+    timeouts are blamed on the circuit and never recorded.
+
+    Parameters:
+        tor (bool): Whether the run goes through the Tor network.
+    """
+
+    def __init__(self, tor=False):
+        self.tor = tor
+        self.failures = {}
+        self.lock = threading.Lock()
+
+    def record(self, site, error=None):
+        if error is None:
+            with self.lock: self.failures.pop(site["template"], None)
+            record(site)
+            return
+
+        if self.tor and error in circuit_errors: return
+        with self.lock: self.failures.setdefault(site["template"], (site, error))
+
+    def flush(self):
+        """
+        Writes the failures of the run, unless the connection is down.
+
+        Returns:
+            int: Number of failures written.
+        """
+
+        with self.lock: failures, self.failures = list(self.failures.values()), {}
+        if not failures or not is_online(): return 0
+
+        for site, error in failures: record(site, error)
+        return len(failures)
+
+
+def quarantined():
+    """
+    Returns:
+        list: (site, template, success rate, consecutive failures, last error, last check) of every quarantined site.
+    """
+
+    rows = get_db().execute(
+        "SELECT site, template, successes, failures, consecutive, last_error, last_check FROM site_health WHERE quarantined ORDER BY site"
+    )
+    return [
+        (site, template, round(100 * ok / max(ok + bad, 1), 1), consecutive, error, last_check)
+        for site, template, ok, bad, consecutive, error, last_check in rows
+    ]
@@ -1,16 +1,208 @@
+"""
+Process-wide manager of the Tor connection.
+
+The Tor proxy is verified once (a request to check.torproject.org) and the
+result is kept for health_ttl seconds (failure_ttl when it failed), so a batch
+of dorks pays the verification once instead of on every call. The sessions
+are pooled, one keep-alive session per circuit reused by every tool.
+
+Stream isolation: Tor puts the streams opened with different SOCKS
+username/password on different circuits (IsolateSOCKSAuth, on by default),
+so every circuit gets its own credentials and its own session pool. The
+requests are spread over the circuits by circuit_policy:
+    "host": the same host always goes through the same circuit
+    "thread": every worker thread is pinned to one circuit
+    "round_robin": every new session request takes the next circuit
+"""
+
+import time
+import zlib
+import secrets
+import itertools
+import threading
 import requests
+from core import sessions
+from core.sessions import SessionPool, CountingAdapter
 from core.display import display_error, display_question, maRed
 
-def get_tor_connection():
-    session = requests.session()
-    session.proxies = {
-        "http": "socks5h://127.0.0.1:9050",
-        "https": "socks5h://127.0.0.1:9050"
-    }
-    try:
-        test = session.get(url="https://check.torproject.org/", timeout=20)
-    except requests.exceptions.ConnectionError:
-        raise Exception(f"{display_error} Error, can't connect to the website... Are you connected to the Tor network?")
-    except requests.exceptions.RequestException as err:
-        raise Exception(f"{display_error} Error in the Tor network, {maRed(err)}")
-    return session
+tor_proxy = "socks5h://127.0.0.1:9050"
+check_url = "https://check.torproject.org/"
+check_timeout = 20
+health_ttl = 300
+failure_ttl = 30
+
+circuits = 4
+circuit_policy = "host"
+
+# Different on every run, so a new run never reuses the circuits of the last one
+run_token = secrets.token_hex(8)
+
+health = {"checked": 0, "error": None}
+pool = {"sessions": None}
+tor_lock = threading.Lock()
+
+circuit_stats = {}
+stats_lock = threading.Lock()
+
+def tor_proxies(circuit=None):
+    """
+    Returns:
+        dict: Proxies of the Tor endpoint, with the credentials of the circuit if given.
+    """
+
+    if circuit is None: return {"http": tor_proxy, "https": tor_proxy}
+
+    scheme, address = tor_proxy.split("://", 1)
+    address = address.rsplit("@", 1)[-1]
+    proxy = f"{scheme}://spynexus-{circuit}:{run_token}@{address}"
+    return {"http": proxy, "https": proxy}
+
+def count(circuit, size=0, seconds=0, error=False):
+    with stats_lock:
+        stats = circuit_stats.setdefault(circuit, {"requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0})
+        stats["requests"] += 1
+        stats["errors"] += error
+        stats["bytes"] += size
+        stats["seconds"] += seconds
+
+def circuit_report():
+    """
+    Returns:
+        list: (circuit, requests, errors, bytes, seconds, KB/s) of every circuit used by this process.
+    """
+
+    with stats_lock:
+        return [
+            (circuit, stats["requests"], stats["errors"], stats["bytes"], round(stats["seconds"], 2), round(stats["bytes"] / 1024 / stats["seconds"], 1) if stats["seconds"] else 0)
+            for circuit, stats in sorted(circuit_stats.items())
+        ]
+
+
+class CircuitAdapter(CountingAdapter):
+    """
+    Adapter that counts the requests, bytes and time of its circuit (and the
+    connection reuse, as every CountingAdapter). Streamed bodies are counted
+    by their Content-Length.
+    """
+
+    def __init__(self, circuit, **kwargs):
+        self.circuit = circuit
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        begin = time.monotonic()
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+            size = int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+        except Exception:
+            count(self.circuit, seconds=time.monotonic() - begin, error=True)
+            raise
+
+        count(self.circuit, size, time.monotonic() - begin)
+        return response
+
+
+class TorPool:
+    """
+    One SessionPool per Tor circuit, sessions are handed out following the circuit policy.
+
+    Parameters:
+        count (int or None): Number of circuits, defaults to the module circuits.
+        policy (str or None): "host", "thread" or "round_robin", defaults to the module circuit_policy.
+    """
+
+    def __init__(self, count=None, policy=None):
+        self.count = max(1, count or circuits)
+        self.policy = policy or circuit_policy
+        self.pools = [
+            SessionPool(tor_proxies(circuit), lambda circuit=circuit: CircuitAdapter(circuit, pool_connections=sessions.pool_connections, pool_maxsize=sessions.pool_maxsize))
+            for circuit in range(self.count)
+        ]
+        self.local = threading.local()
+        self.turn = itertools.count()
+
+    def pick(self, host=None):
+        if self.policy == "host" and host: return zlib.crc32(host.encode()) % self.count
+        if self.policy == "thread":
+            circuit = getattr(self.local, "circuit", None)
+            if circuit is None: circuit = self.local.circuit = next(self.turn) % self.count
+            return circuit
+        return next(self.turn) % self.count
+
+    def get(self, host=None, circuit=None):
+        """
+        Parameters:
+            host (str or None): Host that will be requested, used by the "host" policy.
+            circuit (int or None): Circuit to use instead of the one of the policy.
+
+        Returns:
+            requests.Session: Session of the circuit picked for the host.
+        """
+
+        circuit = self.pick(host) if circuit is None else circuit % self.count
+        session = self.pools[circuit].get()
+        session.tor_circuit = circuit
+        return session
+
+    def stats(self):
+        total = {"requests": 0, "connections": 0, "reused": 0}
+        for circuit_pool in self.pools:
+            for key, value in circuit_pool.stats().items(): total[key] += value
+        return total
+
+    def close(self):
+        for circuit_pool in self.pools: circuit_pool.close()
+
+
+def get_pool():
+    with tor_lock:
+        if pool["sessions"] is None: pool["sessions"] = TorPool()
+        return pool["sessions"]
+
+def verify_tor(force=False):
+    """
+    Checks the Tor connection, the result is cached so only the first call
+    (or the first one after the TTL) goes to the network.
+    """
+
+    with tor_lock:
+        age = time.monotonic() - health["checked"]
+        fresh = health["checked"] and age < (failure_ttl if health["error"] else health_ttl)
+        if fresh and not force:
+            if health["error"]: raise Exception(health["error"])
+            return
+
+        try:
+            with requests.session() as session:
+                session.proxies = tor_proxies()
+                session.get(url=check_url, timeout=check_timeout)
+            health["error"] = None
+        except requests.exceptions.ConnectionError:
+            health["error"] = f"{display_error} Error, can't connect to the website... Are you connected to the Tor network?"
+        except requests.exceptions.RequestException as err:
+            health["error"] = f"{display_error} Error in the Tor network, {maRed(err)}"
+        health["checked"] = time.monotonic()
+
+        if health["error"]: raise Exception(health["error"])
+
+def get_tor_connection(host=None, circuit=None):
+    """
+    Parameters:
+        host (str or None): Host that will be requested, used by the "host" circuit policy.
+        circuit (int or None): Circuit to use instead of the one of the policy.
+
+    Returns:
+        requests.Session: Pooled session routed through a Tor circuit.
+    """
+
+    verify_tor()
+    return get_pool().get(host, circuit)
+
+def is_tor(connection):
+    return getattr(connection, "tor_circuit", None) is not None
+
+def close_tor():
+    with tor_lock:
+        if pool["sessions"]: pool["sessions"].close()
+        pool["sessions"] = None
+        health["checked"] = 0
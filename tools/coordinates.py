@@ -1,4 +1,5 @@
 from core.save_data import save_data
+from core import results_store
 from core.ma_command import check_internet
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan,
@@ -8,13 +9,20 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line
 )
 from geopy.geocoders import Nominatim
 
+geocoder = {"nominatim": None}
+
+def get_geocoder():
+    # Created once and reused, Nominatim keeps its own connection
+    if geocoder["nominatim"] is None: geocoder["nominatim"] = Nominatim(user_agent="stfu")
+    return geocoder["nominatim"]
+
 def get_location(lat, lng, file):
     if not check_internet(): raise Exception(f"{display_error} Error, connection needed for this module...")
-    geocode = Nominatim(user_agent="stfu")
+    geocode = get_geocoder()
 
     if isinstance(lat, str):
         lat = lat.strip()
@@ -38,10 +46,13 @@ def get_location(lat, lng, file):
             if place: save_data(file, f"## <center>🌎 Location from the place {place}</center>", None, "a", False)
             else: save_data(file, f"## <center>📍 Location from the coordinates {final}</center>", None, "a", False)
 
+        fields = {}
+
         def display_data(tag, list, dt):
             data = list.get(dt, "Unknown")
 
             if data != "Unknown":
+                fields[tag.split(" ", 1)[1]] = data
                 write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
                 sv_info = f'{tag}: {data}\n'
                 save_data(file, None, sv_info, "a", False)
@@ -50,7 +61,7 @@ def get_location(lat, lng, file):
 
         if not place: save_data(file, f"## ℹ️ Results coordinates: {final}\n", None, "a", False)
 
-        print()
+        blank_line()
         display_data("🌐 Latitude", other_data, "lat")
         display_data("🌐 Longitude", other_data, "lon")
         display_data("🆔 Place ID", other_data, "place_id")
@@ -68,4 +79,6 @@ def get_location(lat, lng, file):
         display_data("🛣️ Road", location, "road")
         display_data("🏠 House Number", location, "house_number")
 
-        save_data(file, f"- 📍[Google Maps](https://www.google.com/maps/place/{lat}+{lng})", None, "a", True)
+        maps = f"https://www.google.com/maps/place/{lat}+{lng}"
+        results_store.add("location", str(place) if place else final, fields, [maps])
+        save_data(file, f"- 📍[Google Maps]({maps})", None, "a", True)
@@ -14,7 +14,8 @@ Features:
 import whois
 import datetime
 from whois import parser
-from core.save_data import save_data
+from core.save_data import save_data, report
+from core import results_store
 from core.ma_command import check_internet
 from tools.g_dorking import multi_search, gg_connection
 from tools.coordinates import get_location
@@ -26,9 +27,36 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line
 )
 
+def fetch_whois(site):
+    try:
+        return whois.whois(site)
+    except whois.parser.PywhoisError:
+        raise Exception(f"{display_error} Error, the domain {maBold(site)} don't found.")
+    except Exception as err:
+        raise Exception(f"{display_error} Another error has occurred, {maRed(err)}")
+
+def run_job(site):
+    """
+    Non-interactive WHOIS lookup of a domain, used by the headless runner.
+
+    Parameters:
+        site (str): The target domain name (e.g. "example.com")
+
+    Returns:
+        tuple: (dict with the WHOIS data found, list of source URLs)
+    """
+
+    fields = {}
+    for tag, data in fetch_whois(site).items():
+        if not data or data == "null": continue
+        fields[tag.replace("_", " ").capitalize()] = data
+
+    results_store.add("domain", site, fields)
+    return fields, []
+
 def get_site(site):
     """
     Retrieves WHOIS information about a given domain and displays it to the user.
@@ -43,67 +71,68 @@ def get_site(site):
 
     global file
     file = f"data/websites/results_{site}_file.md"
-    try:
-        get_data = whois.whois(site)
-    except whois.parser.PywhoisError:
-        raise Exception(f"{display_error} Error, the domain {maBold(site)} don't found.")
-    except Exception as err:
-        raise Exception(f"{display_error} Another error has occurred, {maRed(err)}")
+    get_data = fetch_whois(site)
+
+    with report(file):
+        write_effect(f"\n{display_validate} {maGreen('Data of the website found!')} {maGreen(surprised)}\n", 0.05)
+        save_data(file, f"## <center>🖥️ Extracting WHOIS data from the website {site}</center>", "---\n", "a", False)
+
+        fields = {}
+
+        for tag, data in get_data.items():
+            tag = tag.replace("_", " ").capitalize()
+
+            if not data or data == "null":
+                write_effect(f"{display_question} {maBold(tag)}: {maYellow('Unknown')}", 0.005)
+                continue
+
+            fields[tag] = data
+            if isinstance(data, list):
+                write_effect(f"{display_info} {maBold(tag)}:", 0.005)
+                save_data(file, f"ℹ️ {tag}:", None, "a", False)
+
+                if len(data) == 1 and isinstance(data[0], str) and '\n' in data[0]:
+                    for line in data[0].splitlines():
+                        write_effect(f"  {display_extra} {maGreen(line)}", 0.005)
+                        save_data(file, f"- 🔹{line}", None, "a", False)
+                else:
+                    for item in data:
+                        if isinstance(item, datetime.datetime):
+                            item = item.strftime("%Y-%m-%d %H:%M:%S")
+                        write_effect(f"  {display_extra} {maGreen(item)}", 0.005)
+                        save_data(file, f"- 🔹{item}", None, "a", False)
+
+            elif isinstance(data, datetime.datetime):
+                formatted = data.strftime("%Y-%m-%d %H:%M:%S")
+                write_effect(f"{display_info} {maBold(tag)}: {maGreen(formatted)}", 0.005)
+                save_data(file, f"📅 {tag}: {formatted}", None, "a", False)
+
+            elif isinstance(data, str) and '\n' in data:
+                write_effect(f"{display_info} {maBold(tag)}:", 0.005)
+                save_data(file, f"ℹ️ {tag}:", None, "a", False)
+                for line in data.splitlines():
+                    write_effect(f"  {display_extra} {maGreen(line)}", 0.005)
+                    save_data(file, f"🔹{line}", None, "a", False)
 
-    write_effect(f"\n{display_validate} {maGreen('Data of the website found!')} {maGreen(surprised)}\n", 0.05)
-    save_data(file, f"## <center>🖥️ Extracting WHOIS data from the website {site}</center>", "---\n", "a", False)
+            else:
+                write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
+                save_data(file, f"✴️ {tag}: {data}", None, "a", False)
 
-    for tag, data in get_data.items():
-        tag = tag.replace("_", " ").capitalize()
+        results_store.add("domain", site, fields)
 
-        if not data or data == "null":
-            write_effect(f"{display_question} {maBold(tag)}: {maYellow('Unknown')}", 0.005)
-            continue
+        get_adr = get_data.get("address")
 
-        if isinstance(data, list):
-            write_effect(f"{display_info} {maBold(tag)}:", 0.005)
-            save_data(file, f"ℹ️ {tag}:", None, "a", False)
+        if get_adr != "null":
+            between_tag("INFO LOCATION")
+            try:
+                get_location(get_adr, None, file)
+                mess = "### 🗺️ Location found: ✅"
+            except Exception:
+                write_effect(f"{display_question} Location from {maBold(site)} not found...", 0.05)
+                mess = "### 🗺️ Location found: ❌"
+            save_data(file, "\n---\n", mess, "a", False)
 
-            if len(data) == 1 and isinstance(data[0], str) and '\n' in data[0]:
-                for line in data[0].splitlines():
-                    write_effect(f"  {display_extra} {maGreen(line)}", 0.005)
-                    save_data(file, f"- 🔹{line}", None, "a", False)
-            else:
-                for item in data:
-                    if isinstance(item, datetime.datetime):
-                        item = item.strftime("%Y-%m-%d %H:%M:%S")
-                    write_effect(f"  {display_extra} {maGreen(item)}", 0.005)
-                    save_data(file, f"- 🔹{item}", None, "a", False)
-
-        elif isinstance(data, datetime.datetime):
-            formatted = data.strftime("%Y-%m-%d %H:%M:%S")
-            write_effect(f"{display_info} {maBold(tag)}: {maGreen(formatted)}", 0.005)
-            save_data(file, f"📅 {tag}: {formatted}", None, "a", False)
-
-        elif isinstance(data, str) and '\n' in data:
-            write_effect(f"{display_info} {maBold(tag)}:", 0.005)
-            save_data(file, f"ℹ️ {tag}:", None, "a", False)
-            for line in data.splitlines():
-                write_effect(f"  {display_extra} {maGreen(line)}", 0.005)
-                save_data(file, f"🔹{line}", None, "a", False)
-
-        else:
-            write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
-            save_data(file, f"✴️ {tag}: {data}", None, "a", False)
-
-    get_adr = get_data.get("address")
-
-    if get_adr != "null":
-        between_tag("INFO LOCATION")
-        try:
-            get_location(get_adr, None, file)
-            mess = "### 🗺️ Location found: ✅"
-        except Exception:
-            write_effect(f"{display_question} Location from {maBold(site)} not found...", 0.05)
-            mess = "### 🗺️ Location found: ❌"
-        save_data(file, "\n---\n", mess, "a", False)
-
-    save_data(file, None, None, "a", True)
+        save_data(file, None, None, "a", True)
 
 def execute_webtool():
     """
@@ -114,7 +143,7 @@ def execute_webtool():
     to perform Google Dorking analysis on the same domain with or without Tor.
     """
 
-    print(f"{display_info} Enter a website like: example.com\n{display_info} Always put the website with his domain at the end like: .gov, .us, .com\n{display_extra} It's not necessary to put http, https at the beginning of the website")
+    write_effect(f"{display_info} Enter a website like: example.com\n{display_info} Always put the website with his domain at the end like: .gov, .us, .com\n{display_extra} It's not necessary to put http, https at the beginning of the website", 0)
 
     site = input(f"\n×××{maRed('[')}{maBold('SPY-WEBSITE')}{maRed(']')}---> ").strip()
     if not site: raise Exception(f"{display_error} Error, the website can't be empty!")
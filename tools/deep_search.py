@@ -14,8 +14,11 @@ Never attempt to access unauthorized or illegal content.
 """
 
 import requests
+from urllib.parse import urlsplit
 from core.save_data import save_data
+from core import results_store
 from core.agents import agents
+from core.head_reader import read_head
 from bs4 import BeautifulSoup
 from core.display import (
     prRed, prGreen, prYellow, prCyan, maGreen, maYellow, maCyan,
@@ -24,7 +27,7 @@ from core.display import (
     maSkyBlue, maBold, maUnderline, backRed, display_info,
     display_extra, display_validate, display_error, display_question,
     happy, angry, sad, pointing, waiting, nervous, surprised,
-    write_effect, wait_out, space_between, between_tag, check_key
+    write_effect, wait_out, space_between, between_tag, check_key, blank_line
 )
 
 deep_warning = f"""
@@ -96,6 +99,10 @@ def save_info(query, list, src, lk):
         if st == no_info:
             no_dt += 1
             save_data(file, f"\n- Unknown Website: ({url})", None, "a", False)
+
+    found = [{"title": st, "description": ds, "url": url} for st, ds, url in list]
+    results_store.add("deep", query, {"searcher": src, "results": found}, [url for _, _, url in list])
+
     mess = f"""
 \n---
 ## 🗃️ Final Summary
@@ -128,7 +135,7 @@ def get_searcher():
     sel = int(input(f"\n×××{maRed('[')}{maBold('SELECT-SEARCHER')}{maRed(']')}---> "))
     if sel in searchers:
         searcher, url = searchers[sel]
-        print(f"\n{display_info} Searcher selected: {maBold(searcher)}")
+        write_effect(f"\n{display_info} Searcher selected: {maBold(searcher)}", 0)
 
         query = str(input(f"\n×××{maRed('[')}{maBold('QUERY')}{maRed(']')}---> ")).strip()
         if len(query) <= 0: raise Exception(f"{display_error} The query can't be empty!")
@@ -144,7 +151,7 @@ def get_searcher():
         raise Exception(f"{display_error} There's not valid option such as {maBold(sel)}!")
 
 
-def obtain_results(query, lk, results, src):
+def obtain_results(query, lk, results, src, ask=True):
     """
     Requests and parses dark web search results using Tor connection.
 
@@ -152,10 +159,14 @@ def obtain_results(query, lk, results, src):
         query (str): Search query.
         lk (str): Full URL to perform search.
         results (int): Maximum number of valid result pages to retrieve.
+        ask (bool): Ask the user whether to save the results.
+
+    Returns:
+        list: List of tuples (title, description, URL) of the results.
     """
 
     from core.socks_connect import get_tor_connection
-    connect = get_tor_connection()
+    connect = get_tor_connection(urlsplit(lk).hostname)
     main_agent = agents()
     try:
         main_query = connect.get(lk, headers=main_agent, timeout=20)
@@ -183,11 +194,11 @@ def obtain_results(query, lk, results, src):
             if list_response(link): continue
 
             visited_urls.add(link)
-            link_agent = agents()
+            host = urlsplit(link).hostname
+            link_agent = agents(host)
 
             try:
-                get_link = connect.get(link, headers=link_agent, timeout=15)
-                if not query in get_link.text: continue
+                get_link = get_tor_connection(host).get(link, headers=link_agent, timeout=15, stream=True)
             except requests.exceptions.ConnectionError:
                 save_data(no_response, None, link, "a", False)
                 continue
@@ -201,16 +212,17 @@ def obtain_results(query, lk, results, src):
                 continue
 
             if get_link.status_code != 200:
+                get_link.close()
                 write_effect(f"{display_error} Error in the link, status code: {maRed(get_link.status_code)}, link: {maRed(link)}", 0.02)
                 space_between()
                 continue
 
             try:
-                info_link = BeautifulSoup(get_link.text, "html.parser")
-
-                title = info_link.title.text if info_link.text else no_info
-                ds = info_link.find("meta", attrs={"name": "description"})
-                description = ds["content"] if ds else no_info
+                # Only the head is parsed, the rest of the body is streamed looking for the query
+                title, description, found = read_head(get_link, query)
+                if not found: continue
+                title = title or no_info
+                description = description or no_info
 
             except Exception as err:
                 write_effect(f"{display_error} Another error has ocurred in the link: {maRed(err)}", 0.02)
@@ -231,8 +243,33 @@ def obtain_results(query, lk, results, src):
             space_between()
             save_list.append((title, description, link))
 
+    if not ask: return save_list
+
     sv_conf = str(input(f"\n{display_question} Do you want to save the results? ({maGreen('y')}/{maRed('n')}): "))
     if check_key(sv_conf): save_info(query, save_list, src, lk)
+    return save_list
+
+
+def run_job(query, searcher=1, results=10):
+    """
+    Non-interactive deep web search through Tor, used by the headless runner.
+
+    Parameters:
+        query (str): Search query.
+        searcher (int): Number of the searcher in the searchers list.
+        results (int): Maximum number of valid result pages to retrieve.
+
+    Returns:
+        tuple: (dict with the searcher and the results, list of result URLs)
+    """
+
+    if int(searcher) not in searchers: raise Exception(f"{display_error} There's not valid option such as {maBold(searcher)}!")
+    src, url = searchers[int(searcher)]
+
+    save_list = obtain_results(query, url + query, int(results), src, ask=False)
+    found = [{"title": st, "description": ds, "url": link} for st, ds, link in save_list]
+    results_store.add("deep", query, {"searcher": src, "results": found}, [link for _, _, link in save_list])
+    return {"searcher": src, "results": found}, [link for _, _, link in save_list]
 
 
 def ex_deep():
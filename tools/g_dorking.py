@@ -15,12 +15,11 @@ Key features:
 
 import requests
 import time
-import random
+import queue
 import urllib.parse
-import warnings
-from googlesearch import search as dorking_google
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
-from bs4 import XMLParsedAsHTMLWarning
+from googlesearch import search as dorking_google
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan, maYellow, maOrange,
     maMagenta, maGreen, maPink,
@@ -28,16 +27,33 @@ from core.display import (
     maTeal, maSkyBlue, backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line
 )
-from core.save_data import save_data
+from core.save_data import save_data, report
 from core.agents import agents
+from core.sessions import session
+from core.scheduler import host_key, stream_queue
+from core import latency, results_store
+from core.dork_parser import translate
+from core.link_cache import LinkCache, normalize_url
+from core.head_reader import read_head
+from core.rate_limit import get_limiter, retry_after
 from http import HTTPStatus
 
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 no_info = 'Unknown'
-errs = []
-conf = []
+
+# Google searches of a multi_search batch running ahead of the report
+search_workers = 3
+
+google_url = "https://www.google.com/search"
+google_timeout = 15
+
+# Enrichment of the result links: bounded pool, a few requests at a time per
+# domain and a min delay between two requests to the same domain, so the links
+# of a site= sweep (all on one domain) are still fetched in parallel
+enrich_workers = 8
+domain_limit = 3
+domain_interval = 0.3
 
 all_operators = [
     ("site", 'Search on a specific website. Example: site="example.com"'),
@@ -73,147 +89,346 @@ all_operators = [
     ("index", 'Search for publicly exposed web directories (index of). Use: index'),
 ]
 
-def gg_connection(value=False):
+def gg_connection(value=False, host=None, circuit=None):
     """
     Determines the HTTP request method: either standard requests or Tor proxy.
 
     Parameters:
-        value (bool): If True, initialize and return a requests.Session object
-                      with SOCKS5 proxy routing via Tor. If False, return the
-                      standard requests module.
+        value (bool): If True, return the pooled requests.Session of a Tor circuit
+                      with SOCKS5 proxy routing via Tor (the Tor connection is
+                      only verified again once its health check expires). If
+                      False, return the process-wide pooled keep-alive session.
+        host (str or None): Host that will be requested, picks its Tor circuit.
+        circuit (int or None): Tor circuit to use instead of the one picked for the host.
 
     Returns:
-        requests or requests.Session: Configured interface for HTTP requests.
+        requests.Session: Configured session for HTTP requests.
     """
 
     if value:
         from core.socks_connect import get_tor_connection
-        ses = get_tor_connection()
+        ses = get_tor_connection(host, circuit)
         return ses
     else:
-        return requests
+        return session()
 
-def make_search(query, num_of_results, file, tor=False):
+def tor_google(query, num_of_results, circuit=None):
     """
-    Executes a Google Dork search based on the final parsed query.
-    Handles request retries, result formatting, and optional Tor usage.
+    Google search through a Tor circuit. googlesearch only takes HTTP proxies,
+    so the result pages are requested with the Tor session of the circuit and
+    the links are read from the result anchors ("/url?q=...").
 
     Parameters:
         query (str): A final Google Dork query string.
         num_of_results (int): How many search results to retrieve.
-        file (str): Destination filepath to save formatted results.
-        tor (bool): Whether to route requests through the Tor network.
+        circuit (int or None): Tor circuit of the query, the one of the Google host if not given.
 
-    Side Effects:
-        - Results are printed to the terminal.
-        - Results are saved to a markdown file.
-        - Prints errors or warnings for invalid links or failed requests.
+    Returns:
+        list: The result links.
+
+    Raises:
+        requests.exceptions.HTTPError: If Google answered with an error (429 when blocked).
+    """
+
+    connection = gg_connection(True, "www.google.com", circuit)
+    links = []
+    start = 0
+    while len(links) < num_of_results:
+        page = connection.get(
+            google_url, timeout=google_timeout,
+            params={"q": query, "num": min(num_of_results - len(links), 100) + 2, "start": start, "hl": "en"},
+            cookies={"CONSENT": "PENDING+987", "SOCS": "CAESHAgBEhIaAB"}
+        )
+        page.raise_for_status()
+
+        found = 0
+        for anchor in BeautifulSoup(page.text, "html.parser").find_all("a", href=True):
+            href = anchor["href"]
+            if not href.startswith("/url?q="): continue
+            url = urllib.parse.unquote(href[len("/url?q="):].split("&")[0])
+            if url in links or "google." in urllib.parse.urlsplit(url).netloc: continue
+            links.append(url)
+            found += 1
+
+        if not found: break
+        start += 10
+    return links[:num_of_results]
+
+def google_links(query, num_of_results, tor=False, circuit=None, notify=None):
     """
+    Runs the Google search of a final query through the session-wide rate limiter,
+    backing off and retrying when Google blocks it.
+
+    Parameters:
+        query (str): A final Google Dork query string.
+        num_of_results (int): How many search results to retrieve.
+        tor (bool): Whether to send the query through the Tor network.
+        circuit (int or None): Tor circuit of the query, the one of the Google host if not given.
+        notify (callable or None): Receives the messages (slow down, block) instead of
+                                   write_effect(), for the searches running in a pool.
+
+    Returns:
+        list: The result links.
+    """
+
     MAX_RETRIES = 4
     retry_count = 0
-
-    total_search_results = 0
-    connection = gg_connection(tor)
+    limiter = get_limiter("google")
+    cost = max(1, -(-int(num_of_results) // 10))
+    if notify is None: notify = lambda text: write_effect(text, 0.02)
+    if tor:
+        from core.socks_connect import verify_tor
+        verify_tor()
 
     while retry_count < MAX_RETRIES:
+        wait = limiter.delay(cost)
+        if wait >= 5:
+            notify(f"{display_info} Slowing down the searches to avoid a block from Google, waiting {maBold(round(wait))} seconds... {maYellow(waiting)}")
+        limiter.acquire(cost)
+
         get_list = []
         try:
-            for url in dorking_google(query, num_results=num_of_results):
+            urls = tor_google(query, num_of_results, circuit) if tor else dorking_google(query, num_results=num_of_results)
+            for url in urls:
                 if not url or not url.startswith(('http://', 'https://')): continue
                 if url: get_list.append(url)
 
+            limiter.success()
             if get_list: break
             else:
                 retry_count = MAX_RETRIES
                 break
 
         except Exception as err:
+            retry_count += 1
             if "429" in str(err):
-                retry_count += 1
-                write_effect(f"{display_error} Oops!, it seems Google detect an {maRed('suspicious activity')}...\n{display_info} Trying to make the search again in 30 seconds...\n{display_info} Try change your IP Address with a {maBold('VPN')}, to evade the block from Google...", 0.02)
-                space_between()
-                time.sleep(30)
+                cooldown = limiter.blocked(retry_after(err))
+                notify(f"{display_error} Oops!, it seems Google detect an {maRed('suspicious activity')}...\n{display_info} Trying to make the search again in {round(cooldown)} seconds...\n{display_info} Try change your IP Address with a {maBold('VPN')}, to evade the block from Google...")
+
+    return get_list
+
+def fetch_link(link, tor=False, circuit=None):
+    """
+    Requests a result link (through Tor if selected), keeping the latency history of its host.
+    The politeness delay is applied per domain by enrich_links() and the body is
+    streamed, only the head is read by read_head().
+    """
+
+    host = host_key(link)
+    select_agent = agents(host)
+    transport = "tor" if tor else "direct"
+    begin = time.time()
+    try:
+        result_dork = gg_connection(tor, host, circuit).get(link, headers=select_agent, timeout=latency.timeout_for(host, 30, transport), stream=True)
+    except requests.exceptions.RequestException as err:
+        latency.record(host, time.time() - begin, False, transport, isinstance(err, requests.exceptions.Timeout))
+        raise
+    latency.record(host, time.time() - begin, transport=transport)
+    return result_dork
+
+def enrich_link(link, tor=False, circuit=None):
+    """
+    Fetches a result link and reads its title and description, never raises.
+
+    Returns:
+        tuple: ("head", (title, description)), ("status", status code) or ("error", exception)
+    """
+
+    try:
+        result_dork = fetch_link(link, tor, circuit)
+        if result_dork.status_code != 200:
+            result_dork.close()
+            return "status", result_dork.status_code
+        title_url, description_url, _ = read_head(result_dork)
+        return "head", (title_url or no_info, description_url or no_info)
+    except Exception as err:
+        return "error", err
+
+def enrich_links(links, tor=False, workers=enrich_workers, cache=None, circuit=None):
+    """
+    Enriches the result links on a bounded pool of workers, with the politeness
+    delay applied per domain so different sites are fetched at the same time.
+    Links already in the cache (or repeated in the list) are not fetched again.
+
+    Parameters:
+        links (list): The result links, in the order given by Google.
+        tor (bool): Whether to route the requests through the Tor network.
+        workers (int): Max links fetched at the same time.
+        cache (LinkCache or None): Enrichment cache of the batch, a new one if not given.
+        circuit (int or None): Tor circuit of every link instead of the one picked for each host.
+
+    Yields:
+        tuple: (link, kind, value) of enrich_link(), in the order of the links
+               and as soon as every link before it has finished.
+    """
+
+    if cache is None: cache = LinkCache()
+    keys = [normalize_url(link) for link in links]
+
+    jobs = []
+    queued = set()
+    for link, key in zip(links, keys):
+        if key in queued or cache.get(key) is not None: continue
+        queued.add(key)
+        jobs.append((host_key(link), (key, link)))
+
+    following = 0
+    for event, item, value in stream_queue(jobs, lambda item: cache.put(item[0], enrich_link(item[1], tor, circuit)), workers, domain_limit, domain_interval):
+        while following < len(links) and keys[following] in cache.entries:
+            yield (links[following],) + cache.entries[keys[following]]
+            following += 1
+
+    for rank in range(following, len(links)):
+        yield (links[rank],) + cache.entries.get(keys[rank], ("error", Exception("the link couldn't be checked")))
+
+def run_job(dork_query, results=10, tor=False):
+    """
+    Non-interactive Google Dork search, used by the headless runner.
+
+    Parameters:
+        dork_query (str): Search string using the custom syntax (e.g. site="example.com"&docs).
+        results (int): Number of search results desired.
+        tor (bool): Whether to route the requests through the Tor network.
+
+    Returns:
+        tuple: (dict with the query and the results, list of result URLs)
+    """
+
+    final_search = build_query(dork_query)
+    if not final_search: raise Exception(f"{display_error} Error, the query is empty! {maRed(angry)}")
+    if tor: gg_connection(True)
+
+    found = []
+    failed = []
+    for link, kind, value in enrich_links(google_links(final_search, int(results), tor), tor):
+        if kind == "status": failed.append({"url": link, "status": value})
+        elif kind == "error": failed.append({"url": link, "error": str(value)})
+        else: found.append({"title": value[0], "description": value[1], "url": link})
+
+    latency.save()
+    results_store.add("dork", final_search, {"results": found}, [item["url"] for item in found])
+    return {"query": final_search.strip(), "results": found, "errors": failed}, [item["url"] for item in found]
+
+def make_search(query, num_of_results, file, tor=False, cache=None, search=None, links=None, circuit=None):
+    """
+    Executes a Google Dork search based on the final parsed query.
+    Handles request retries, result formatting, and optional Tor usage.
+
+    Parameters:
+        query (str): A final Google Dork query string.
+        num_of_results (int): How many search results to retrieve.
+        file (str): Destination filepath to save formatted results.
+        tor (bool): Whether to route requests through the Tor network.
+        cache (LinkCache or None): Enrichment cache shared by the searches of a batch.
+        search (str or None): Name of the search in the report, defaults to the query.
+        links (list or None): Result links of the query when Google was already searched.
+        circuit (int or None): Tor circuit of the links of this search.
+
+    Side Effects:
+        - Results are printed to the terminal.
+        - Results are saved to a markdown file.
+        - Prints errors or warnings for invalid links or failed requests.
+
+    Returns:
+        tuple: (list of the valid links, list of (link, status code) of the links that failed)
+    """
+    total_search_results = 0
+    valid = []
+    errs = []
+    if tor: gg_connection(True)
+
+    get_list = google_links(query, num_of_results, tor, circuit) if links is None else links
 
     if not get_list:
         save_data(file, "- No **results found** on this search ❌", None, "a", False)
         write_effect(f"{display_error} There are not enough results for this search {maBlue(sad)}", 0.03)
-        return
+        return valid, errs
 
-    for link in get_list:
-        select_agent = agents()
-        time.sleep(random.uniform(0.5, 2))
-        try:
-            result_dork = connection.get(link, headers=select_agent, timeout=30)
-
-            if result_dork.status_code != 200:
-                write_effect(f"{display_error} Error, can't check the url, status code: {maRed(result_dork.status_code)}, {maRed(link)}", 0.02)
-                errs.append((link, result_dork.status_code))
-                space_between()
-                continue
-
-            try:
-                soup = BeautifulSoup(result_dork.text, 'html.parser')
-                title_url = soup.title.text if soup.title else no_info
-                description_tag = soup.find('meta', attrs={'name': 'description'})
-                description_url = description_tag["content"] if description_tag else no_info
-            except AssertionError:
-                write_effect(f'{display_error} Assertion Error in the site. {maRed(link)}', 0.05)
-                space_between()
-                continue
-            except Exception as err:
-                write_effect(f"{display_error} Another error has ocurred, {maRed(err)}\n{display_info} {maBold('URL:')} {maUnderline(link)}", 0.02)
-                space_between()
-                continue
-
-            total_search_results += 1
-            conf.append(link)
-
-            if file:
-                if title_url != no_info:
-                    write_effect(f'{display_info} {maBold("Site")}: {maSkyBlue(title_url)}', 0.005)
-                    save_data(file, f"\n{total_search_results}. [{title_url}]({link})", None, 'a', False)
-                else:
-                    write_effect(f"{display_question} {maBold('Site')}: {maYellow(no_info)}", 0.005)
-
-                if description_url != no_info:
-                    write_effect(f"{display_extra} {maBold('Description')}: {maGreen(description_url)}", 0.005)
-                    save_data(file, f"> {description_url}", None, 'a', False)
-                else:
-                    write_effect(f"{display_question} {maBold('Description')}: {maYellow(no_info)}", 0.005)
-
-                write_effect(f"{display_info} {maCyan('URL')}: {maUnderline(link)}", 0.005)
-                space_between()
-                if title_url == no_info:
-                    save_data(file, f'{total_search_results}. **Website unknown:** ({link})', None, 'a', False)
-
-        except requests.exceptions.RequestException as url_err:
-            write_effect(f'{display_error} Another error has ocurred, {maRed(url_err)}', 0.02)
-            space_between()
+    if cache is None: cache = LinkCache()
+    search = search or query.strip()
 
-        except requests.exceptions.HTTPError as http_err:
-            write_effect(f'{display_error} Error in HTTP, {maRed(http_err)}', 0.02)
+    found = []
+    for link, kind, value in enrich_links(get_list, tor, cache=cache, circuit=circuit):
+        before = cache.seen(link, search)
+
+        if kind == "status":
+            write_effect(f"{display_error} Error, can't check the url, status code: {maRed(value)}, {maRed(link)}", 0.02)
+            if not before: errs.append((link, value))
             space_between()
+            continue
 
-        except requests.exceptions.ConnectionError:
-            write_effect(f"{display_error} Error, can't connect to url... {maYellow(waiting)}", 0.02)
+        if kind == "error":
+            if isinstance(value, AssertionError):
+                write_effect(f'{display_error} Assertion Error in the site. {maRed(link)}', 0.05)
+            elif isinstance(value, requests.exceptions.ConnectionError):
+                write_effect(f"{display_error} Error, can't connect to url... {maYellow(waiting)}", 0.02)
+            elif isinstance(value, requests.exceptions.ReadTimeout):
+                write_effect(f'{display_error} Error, read timeout exceeded, {maRed(value)}', 0.02)
+            elif isinstance(value, requests.exceptions.RequestException):
+                write_effect(f'{display_error} Another error has ocurred, {maRed(value)}', 0.02)
+            else:
+                write_effect(f"{display_error} Another error has ocurred, {maRed(value)}\n{display_info} {maBold('URL:')} {maUnderline(link)}", 0.02)
             space_between()
+            continue
+
+        title_url, description_url = value
+        total_search_results += 1
+        valid.append(link)
+        found.append({"title": title_url, "description": description_url, "url": link})
+
+        if file:
+            if title_url != no_info:
+                write_effect(f'{display_info} {maBold("Site")}: {maSkyBlue(title_url)}', 0.005)
+                save_data(file, f"\n{total_search_results}. [{title_url}]({link})", None, 'a', False)
+            else:
+                write_effect(f"{display_question} {maBold('Site')}: {maYellow(no_info)}", 0.005)
 
-        except requests.exceptions.ReadTimeout as rd_error:
-             write_effect(f'{display_error} Error, read timeout exceeded, {maRed(rd_error)}', 0.02)
-             space_between()
+            if description_url != no_info:
+                write_effect(f"{display_extra} {maBold('Description')}: {maGreen(description_url)}", 0.005)
+                save_data(file, f"> {description_url}", None, 'a', False)
+            else:
+                write_effect(f"{display_question} {maBold('Description')}: {maYellow(no_info)}", 0.005)
+
+            write_effect(f"{display_info} {maCyan('URL')}: {maUnderline(link)}", 0.005)
+            if title_url == no_info:
+                save_data(file, f'{total_search_results}. **Website unknown:** ({link})', None, 'a', False)
+            if before:
+                write_effect(f"{display_extra} {maBold('Also found in')}: {maYellow(', '.join(before))}", 0.005)
+                save_data(file, f"> 🔁 Also found in: {', '.join(f'`{item}`' for item in before)}", None, 'a', False)
+            space_between()
 
+    latency.save()
+    results_store.add("dork", query, {"results": found}, [item["url"] for item in found])
     save_data(file, "\n---\n", None, "a", False)
     if total_search_results <= 0:
         write_effect(f'\n{display_extra} There were a total of "{total_search_results}" confirmed searches {maBlue(sad)}', 0.05)
     else:
         write_effect(f'\n{display_info} There were a total of "{total_search_results}" confirmed searches {maGreen(happy)}', 0.02)
+    return valid, errs
 
 
 #########################
 # special search of google/dorking
 #########################
 
-def search_dork(dork_query, results, file, tor=False):
+def build_query(dork_query):
+    """
+    Converts a user-friendly query containing smart keywords into a valid
+    Google Dork query (compiled and memoized by core.dork_parser).
+
+    Parameters:
+        dork_query (str): Raw search string using simplified custom syntax.
+
+    Returns:
+        str: The final Google query, empty if nothing valid was given.
+    """
+
+    final_search, errors = translate(dork_query)
+    for error in errors: write_effect(error, 0.03)
+    return final_search
+
+
+def search_dork(dork_query, results, file, tor=False, cache=None, links=None, circuit=None):
     """
     Converts a user-friendly query containing smart keywords into a valid
     Google Dork query, then triggers a search.
@@ -223,155 +438,64 @@ def search_dork(dork_query, results, file, tor=False):
         results (int): Number of search results desired.
         file (str): Path to a file where results are saved.
         tor (bool): Whether to use the Tor proxy session for anonymity.
+        cache (LinkCache or None): Enrichment cache shared by the searches of a batch.
+        links (list or None): Result links of the query when Google was already searched.
+        circuit (int or None): Tor circuit of the links of this search.
 
     Behavior:
         - Automatically converts special terms into valid search operators.
         - Validates and handles malformed or empty commands.
         - Delegates execution to make_search().
+
+    Returns:
+        tuple: (valid links, failed links) of make_search(), both empty if the query is empty.
     """
 
-    final_search = ''
-
-    site_search = 'site:'
-    related_search = 'related:'
-    intext_search = 'intext:'
-    title_search = 'intitle:'
-    url_search = 'inurl:'
-    file_tp = 'filetype:'
-    aut_search = 'inauthor:'
-    src_search = 'source:'
-    loc_search = 'location:'
-    cac_search = 'cache:'
-
-    allintitle_search = 'allintitle:'
-    allinurl_search = 'allinurl:'
-    allintext_search = 'allintext:'
-
-    all_pass = ['password', 'passwd', 'admin_password', 'user_password',
-    'login_password', 'contraseña', 'contrasena', 'clave']
-
-    all_email = ['email', 'e-mail', 'correo', '@gmail.com', '@hotmail.com',
-    '@protonmail.com', '@yahoo.com', '@outlook.com', '@edu', '@gov']
-
-    all_ph = ['phone', 'phone number', 'mobile', 'telefono', 'movil', 'celular',
-    'numero', 'contacto']
-
-    all_adr = ['address', 'billing address', 'shipping address', 'direccion',
-    'residencia', 'ubicacion', 'direccion postal']
-
-    all_doc = ['pdf', 'txt', 'xlsx', 'docx', 'pptx', 'json', 'log', 'xls', 'sql', 'env', 'db', 'bak',
-    'xml', 'csv', 'ini', 'yml', 'conf']
-
-    all_cf = ['ini', 'json', 'conf', 'csv', 'xml', 'sql', 'env', 'db', 'bak']
-
-    possible_breaches = ['admin', 'phpMyAdmin', 'DB_PASSWORD', 'cpanel',
-    'dashboard', 'adminpanel', 'administrator', 'admin/login', 'config.php', '.env',
-    'wp-admin', 'login.php', 'root', 'index of /admin', 'ftp', 'ssh']
-
-    all_db = ['database', 'sql dump', 'mysql', 'postgres', 'mongodb', 'oracle',
-    'DB_USER', 'DB_HOST', 'DB_NAME']
-
-    all_ky = ['api_key', 'api-token', 'secret', 'client_secret', 'private_key',
-    'auth_token', 'access_token', 'github_token']
-
-    all_sn = ['confidential', 'internal use only', 'do not distribute', 'restricted',
-    'private', 'classified', 'sensitive', 'top secret', 'confidencial', 'clasificado',
-    'restringido', 'privado', 'no distribuir', 'sensible']
-
-    all_idx = ['index of /admin', 'index of /backup', 'index of /private', 'index of /db',
-    'index of /ftp', 'index of /documents']
-
-    all_ivc = ['invoice', 'invoice number', 'total amount', 'quote', 'quotation',
-    'factura']
-
-    all_ctr = ['confidential contract', 'service level agreement', 'contract between',
-    'license agreement', 'memorandum of understanding', 'contrato confidencial',
-    'contrato']
-
-    all_cv = ['curriculum', 'curriculum vitae', 'resume', 'CV', 'CV of', 'contact',
-    'hoja de vida']
-
-    dork_query.lower()
-    parts = dork_query.split('&')
-
-    def command_search(cmd, dork, part, final_search):
-        if part.startswith(f'{cmd}='):
-            ext = part.split('=')[1].strip('" ')
-            if ext:
-                cont = [dt.strip() for dt in ext.split(",")]
-                if cont and dork: final_search += "OR".join(f' {dork}"{dt}" ' for dt in cont)
-                elif cont and not dork: final_search += "OR".join(f' "{dt}" ' for dt in cont)
-                else:
-                    if dork: final_search += f' {dork}"{ext}" '
-                    else: final_search += f' "{ext}" '
-            else: write_effect(f"{display_error} You can't leave the command '{cmd}' empty!", 0.03)
-
-        elif part == cmd: write_effect(f"{display_error} Error, the command '{cmd}' can't be empty!", 0.02)
-        return final_search
-
-    def special_command(cmd, dork, part, list, final_search):
-        if part == cmd:
-            if dork: final_search += "OR".join([f' {dork}"{ext}" ' for ext in list])
-            else: final_search += "OR".join([f' "{ext}" ' for ext in list])
-        return final_search
-
-    for part in parts:
-        part = part.strip()
-
-        final_search = command_search('site', site_search, part, final_search)
-        final_search = command_search('title', title_search, part, final_search)
-        final_search = command_search('url', url_search, part, final_search)
-        final_search = command_search('descr', intext_search, part, final_search)
-        final_search = command_search('rel', related_search, part, final_search)
-        final_search = command_search('a_title', allintitle_search, part, final_search)
-        final_search = command_search('a_url', allinurl_search, part, final_search)
-        final_search = command_search('a_descr', allintext_search, part, final_search)
-        final_search = command_search('loc', loc_search, part, final_search)
-        final_search = command_search('auth', aut_search, part, final_search)
-        final_search = command_search('src', src_search, part, final_search)
-        final_search = command_search('cache', cac_search, part, final_search)
-        final_search = command_search('kword', None, part, final_search)
-
-
-        final_search = special_command('dbase', url_search, part, all_db, final_search)
-        final_search = special_command('breach', url_search, part, possible_breaches, final_search)
-        final_search = special_command('index', title_search, part, all_idx, final_search)
-        final_search = special_command('pass', None, part, all_pass, final_search)
-        final_search = special_command('email', None, part, all_email, final_search)
-        final_search = special_command('phone', None, part, all_ph, final_search)
-        final_search = special_command('adr', None, part, all_adr, final_search)
-        final_search = special_command('keys', None, part, all_ky, final_search)
-        final_search = special_command('leak', None, part, all_sn, final_search)
-        final_search = special_command('invoice', None, part, all_ivc, final_search)
-        final_search = special_command('contr', None, part, all_ctr, final_search)
-        final_search = special_command('cv', None, part, all_cv, final_search)
-
-        if part.startswith("doc="):
-            ext = part.split("=")[1].strip('" ')
-            if ext:
-                cont = [dt.strip() for dt in ext.split(",")]
-                if cont: final_search += "OR".join(f' {file_tp}{dt} ' for dt in cont)
-                else: final_search += f' {file_tp}{ext} '
-            else: write_effect(f"{display_error} You can't leave the command '{cmd}' empty!", 0.03)
-
-        if part == "docs": final_search += "OR".join(f' {file_tp}{fl} ' for fl in all_doc)
-        if part == "conf": final_search += "OR".join(f' {file_tp}{fl} ' for fl in all_cf)
+    final_search = build_query(dork_query)
 
     if final_search == '':
         write_effect(f"{display_error} Error, the query is empty! {maRed(angry)}", 0.03)
+        return [], []
     else:
         space_between()
-        print(f"{display_extra} Command converted: {maBold(final_search)}")
+        write_effect(f"{display_extra} Command converted: {maBold(final_search)}", 0)
         save_data(file, f"## 🔍 Search: `{dork_query}` [Check](https://www.google.com/search?q={urllib.parse.quote_plus(final_search.strip())}) \n**Searched results:** {results}\n", "### ✅ Results", "a", False)
         space_between()
-        make_search(final_search, results, file, tor)
+        return make_search(final_search, results, file, tor, cache, dork_query, links, circuit)
+
+
+
+def wait_links(search, messages):
+    """
+    Waits for the Google search of a multi_search running in the pool, writing
+    the messages of the pool meanwhile, so they never interleave with the report.
+
+    Parameters:
+        search (Future or None): The google_links() call of the search.
+        messages (queue.Queue): Messages sent by the searches of the pool.
 
+    Returns:
+        list or None: The result links, None if the query was empty.
+    """
+
+    while True:
+        try:
+            write_effect(messages.get(timeout=0.2), 0.02)
+        except queue.Empty:
+            if search is None or search.done(): break
+    return search.result() if search else None
 
 
 def multi_search(num, main_ls, file, tor=False):
     """
-    Executes a batch of multiple search queries sequentially.
+    Executes a batch of multiple search queries.
     Used for automating user-profile searches, leak detection, etc.
+    The Google searches run ahead on a small pool (paced by the Google rate
+    limiter) while the report is written in order, one search after another,
+    as soon as the links of each search are known. The searches share a
+    LinkCache, so a link returned by several of them is only fetched once and
+    listed in the report as repeated. With Tor, every search (the Google query
+    and the fetch of its links) goes through its own circuit.
 
     Parameters:
         num (int): Number of separate search commands to execute.
@@ -404,35 +528,61 @@ def multi_search(num, main_ls, file, tor=False):
             list_src.append((srch, rets))
         main_ls = list_src
 
-    num_cmds = 0
-    for srch, rets in main_ls:
-        num_cmds += 1
-        messg = f'\nMaking search number "{num_cmds}"...\nThe command is: {srch}\n'
-        write_effect(maYellow(messg), 0.05)
-        search_dork(srch, rets, file, tor)
-
-    if not errs: save_data(file, "\n- No errors detected ✅", None, "a", False)
-    else:
-        save_data(file, "\n---\n### ❌ Errors", None, "a", False)
-        for lk, err in errs:
-            try:
-                status = HTTPStatus(err).phrase
-            except Exception:
-                status = "Unknown Status"
-            save_data(file, f'- [Link]({lk}) -> **{err} {status}**', None, "a", False)
-
-    mess = f"""
+    cache = LinkCache()
+    conf = []
+    errs = []
+    messages = queue.Queue()
+    executor = ThreadPoolExecutor(search_workers)
+    with report(file):
+        pending = []
+        try:
+            for circuit, (srch, rets) in enumerate(main_ls):
+                final_search = translate(srch)[0]
+                pending.append(executor.submit(google_links, final_search, rets, tor, circuit, messages.put) if final_search else None)
+
+            num_cmds = 0
+            for (srch, rets), links in zip(main_ls, pending):
+                num_cmds += 1
+                messg = f'\nMaking search number "{num_cmds}"...\nThe command is: {srch}\n'
+                write_effect(maYellow(messg), 0.05)
+                valid, failed = search_dork(srch, rets, file, tor, cache, wait_links(links, messages), num_cmds - 1)
+                conf.extend(valid)
+                errs.extend(failed)
+        finally:
+            for search in pending:
+                if search: search.cancel()
+            executor.shutdown(wait=False)
+
+        repeated = cache.repeated()
+        if repeated:
+            save_data(file, "\n---\n### 🔁 Links found in several searches", None, "a", False)
+            for lk, searches in repeated:
+                save_data(file, f"- [Link]({lk}) -> {', '.join(f'`{item}`' for item in searches)}", None, "a", False)
+
+        if not errs: save_data(file, "\n- No errors detected ✅", None, "a", False)
+        else:
+            save_data(file, "\n---\n### ❌ Errors", None, "a", False)
+            for lk, err in errs:
+                try:
+                    status = HTTPStatus(err).phrase
+                except Exception:
+                    status = "Unknown Status"
+                save_data(file, f'- [Link]({lk}) -> **{err} {status}**', None, "a", False)
+
+        mess = f"""
 \n---\n## 📊 Final Summary\n\n
 - 🔍 Total searches: {num_cmds}
 - 📑 Total Valid Results: {len(conf)} links
 - ⚠️ Total Errors: {len(errs)}
+- 🔁 Links found in several searches: {len(repeated)} ({cache.hits} fetches saved)
+- 🚦 Google rate at the end: {get_limiter("google").state()["per_minute"]} searches/min
     """
 
-    if not tor:
-        mess += '\n- 🧅  Tor used: ❌'
-    else: mess += '\n- 🧅  Tor ued: ✅'
-    tip = f'---\n> Remember this searches are **NOT** 100% acurate, check the links given one by one.'
-    save_data(file, mess, tip, "a", True)
+        if not tor:
+            mess += '\n- 🧅  Tor used: ❌'
+        else: mess += '\n- 🧅  Tor ued: ✅'
+        tip = f'---\n> Remember this searches are **NOT** 100% acurate, check the links given one by one.'
+        save_data(file, mess, tip, "a", True)
 
 
 def three_pr(sh):
@@ -491,7 +641,7 @@ def available_commands():
         ('Custom', 'You can search for whatever you want(using dorks).'),
     ]
     num_commands = 0
-    print()
+    blank_line()
     for cmds, des in help_commands:
         num_commands += 1
         write_effect(f"{maRed('[')}{maBold(num_commands)}{maRed(']')}: {maBold(cmds)}: {maCyan(des)}", 0.005)
@@ -596,9 +746,9 @@ def available_commands():
 
         option = int(input(f"\n×××{maRed('[')}{maBold('SELECT-OPTION')}{maRed(']')}---> "))
         if option == 1:
-            print()
+            blank_line()
             for comm, des in all_operators:
-                print(f"{display_extra} {comm.ljust(7)} --> {maSkyBlue(des)}")
+                write_effect(f"{display_extra} {comm.ljust(7)} --> {maSkyBlue(des)}", 0)
 
             srch, res = three_pr("CUSTOM-SEARCH")
             fl_user = str(input(f"×××{maRed('[')}{maBold('FILE')}{maRed(']')}---> ")).strip()
@@ -608,15 +758,15 @@ def available_commands():
             mess = f'## <center>📝 The user selected the custom option using Google Dorks</center>'
             save_data(file, mess, None, "a", False)
             wait_out(0.5)
-            print()
+            blank_line()
 
             search_dork(srch, res, file, tor)
 
             save_data(file, None, None, "a", True)
         elif option == 2:
-            print()
+            blank_line()
             for comm, des in all_operators:
-                print(f"{display_extra} {comm.ljust(7)} --> {maSkyBlue(des)}")
+                write_effect(f"{display_extra} {comm.ljust(7)} --> {maSkyBlue(des)}", 0)
 
             count = int(input(f"\n×××{maRed('[')}{maBold('NUM-OF-SEARCHES')}{maRed(']')}---> "))
             if count <= 0: raise Exception(f"{display_error} Error, the number of searches can't be below or equals to 0!")
@@ -11,11 +11,12 @@ Features:
 """
 
 from core.save_data import save_data
-from requests import get
+from core import results_store
 import requests
 from tools.g_dorking import multi_search, gg_connection
 from tools.coordinates import get_location
 from core.agents import agents
+from core.sessions import session
 from core.ma_command import check_internet
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan,
@@ -28,6 +29,66 @@ from core.display import (
     wait_out, space_between, between_tag, check_key
 )
 
+def fetch_ip(address):
+    """
+    Requests the data of an IP address to ipapi.co.
+
+    Parameters:
+        address (str): The IP address to investigate.
+
+    Returns:
+        tuple: (dict with the location info, URL of the source)
+    """
+
+    select_agent = agents()
+
+    try:
+        ip_info = session().get(f'https://ipapi.co/{address}/json/', headers=select_agent, timeout=10)
+    except requests.exceptions.ConnectionError:
+        raise Exception(f"{display_error} Error, can't connect to the page, try again later...")
+    except requests.exceptions.RequestException as err:
+        raise Exception(f"{display_error} Another error has ocurred, {maRed(err)}")
+
+    if ip_info.status_code != 200:
+        raise Exception(f"{display_error} Error, can't search the ip address... status code: {maRed(ip_info.status_code)}")
+
+    data = ip_info.json()
+    location_info = {
+        '🌐 IP': address,
+        '🌎 Country': data.get('country'),
+        '🗾 Region': data.get('region'),
+        '🏙️ City': data.get('city'),
+        '📍 Latitude': data.get('latitude'),
+        '📍 Longitude': data.get('longitude'),
+        '🕒 Timezone': data.get('timezone'),
+        '📞 Country Calling Code': data.get('country_calling_code'),
+        '💲 Currency': data.get('currency'),
+        '🔤 Language/s': data.get('languages'),
+        '🔢 Postal': data.get('postal'),
+        '🏢 Org': data.get('org'),
+        '🗒️ Hostname': data.get('hostname')
+    }
+    return location_info, ip_info.url
+
+def plain_fields(location_info):
+    return {info.split(" ", 1)[1]: data for info, data in location_info.items()}
+
+def run_job(address):
+    """
+    Non-interactive lookup of an IP address, used by the headless runner.
+
+    Parameters:
+        address (str): The IP address to investigate.
+
+    Returns:
+        tuple: (dict with the info found, list of source URLs)
+    """
+
+    location_info, source = fetch_ip(address)
+    fields = plain_fields(location_info)
+    results_store.add("ip", address, fields, [source])
+    return fields, [source]
+
 def search_ip(address):
     """
     Searches public information about a given IP address using ipapi.co.
@@ -41,60 +102,37 @@ def search_ip(address):
         address (str): The IP address to investigate.
     """
     if not check_internet(): raise Exception(f"{display_error} Error, connection needed for this module...")
-    select_agent = agents()
 
-    try:
-        ip_info = get(f'https://ipapi.co/{address}/json/', headers=select_agent, timeout=10)
-    except requests.exceptions.ConnectionError:
-        raise Exception(f"{display_error} Error, can't connect to the page, try again later...")
-    except requests.exceptions.RequestException as err:
-        raise Exception(f"{display_error} Another error has ocurred, {maRed(err)}")
+    location_info, source = fetch_ip(address)
     location = f'data/ip_address/info_{address}_ip.md'
+    save_data(location, f'## <center>🌐 IP Address Searched: {address}</center>', "---\n", 'a', False)
+
+    for info, data in location_info.items():
+        write_effect(f'{display_info} {maBold(info)}: {maGreen(data)}', 0.005)
+        save_ip = f'- {info}: {data}'
+        save_data(location, save_ip, None, 'a', False)
+
+    results_store.add("ip", address, plain_fields(location_info), [source])
+
+    lat = location_info.get("📍 Latitude")
+    lng = location_info.get("📍 Longitude")
+
+    between_tag("INFO COORDINATES")
+    get_location(lat, lng, location)
+
+    conf = input(f"\n{display_question} You want to search this {maBold(address)} IP address in google? ({maGreen('y')}/{maRed('n')}): ")
+    if check_key(conf):
+        sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
+        tor = check_key(sel)
+        if tor: gg_connection(True)
+
+        save_data(location, f"## <center>🔍 Results of {address} IP Address</center>", "---\n", 'a', False)
+
+        ls_ip_addr = [
+            (f'descr="{address}"', 10),
+            (f'descr="{address}"&breach', 10),
+            (f'descr="{address}"&dbase', 10),
+            (f'rel="{address}"', 10)
+        ]
 
-    if ip_info.status_code == 200:
-        data = ip_info.json()
-        save_data(location, f'## <center>🌐 IP Address Searched: {address}</center>', "---\n", 'a', False)
-
-        location_info = {
-            '🌐 IP': address,
-            '🌎 Country': data.get('country'),
-            '🗾 Region': data.get('region'),
-            '🏙️ City': data.get('city'),
-            '📍 Latitude': data.get('latitude'),
-            '📍 Longitude': data.get('longitude'),
-            '🕒 Timezone': data.get('timezone'),
-            '📞 Country Calling Code': data.get('country_calling_code'),
-            '💲 Currency': data.get('currency'),
-            '🔤 Language/s': data.get('languages'),
-            '🔢 Postal': data.get('postal'),
-            '🏢 Org': data.get('org'),
-            '🗒️ Hostname': data.get('hostname')
-        }
-        for info, data in location_info.items():
-            write_effect(f'{display_info} {maBold(info)}: {maGreen(data)}', 0.005)
-            save_ip = f'- {info}: {data}'
-            save_data(location, save_ip, None, 'a', False)
-
-        lat = location_info.get("📍 Latitude")
-        lng = location_info.get("📍 Longitude")
-
-        between_tag("INFO COORDINATES")
-        get_location(lat, lng, location)
-
-        conf = input(f"\n{display_question} You want to search this {maBold(address)} IP address in google? ({maGreen('y')}/{maRed('n')}): ")
-        if check_key(conf):
-            sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
-            tor = check_key(sel)
-            if tor: gg_connection(True)
-
-            save_data(location, f"## <center>🔍 Results of {address} IP Address</center>", "---\n", 'a', False)
-
-            ls_ip_addr = [
-                (f'descr="{address}"', 10),
-                (f'descr="{address}"&breach', 10),
-                (f'descr="{address}"&dbase', 10),
-                (f'rel="{address}"', 10)
-            ]
-
-            multi_search(1, ls_ip_addr, location, tor)
-    else: raise Exception(f"{display_error} Error, can't search the ip address... status code: {maRed(ip_info.status_code)}")
+        multi_search(1, ls_ip_addr, location, tor)
@@ -34,7 +34,8 @@ import os
 from exif import Image
 from tools.coordinates import get_location
 from tools.g_dorking import multi_search, gg_connection
-from core.save_data import save_data
+from core.save_data import save_data, report
+from core import results_store
 from core.ma_command import check_internet
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan,
@@ -44,7 +45,7 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line
 )
 
 no_info = "Unknown"
@@ -144,8 +145,35 @@ def velocity_photo(vel_ref):
         vel_text = 'KM/H'
     return vel_text
 
+def run_job(media_photo):
+    """
+    Non-interactive extraction of the Exif metadata of an image, used by the headless runner.
+
+    Parameters:
+        media_photo (str): Path of the image.
+
+    Returns:
+        tuple: (dict with every Exif tag found, list of source URLs)
+    """
+
+    if not os.path.exists(media_photo): raise Exception(f"{display_error} The rute is not valid OR does not exists.")
+    image = Image(media_photo)
+
+    fields = {}
+    for tag in image.list_all():
+        data = image.get(tag, no_info)
+        if data != no_info: fields[tag] = data
+
+    if "gps_latitude" in fields:
+        lat_dcm = dcm_coordinates(image.get("gps_latitude", no_info), image.get("gps_latitude_ref", no_info))
+        lng_dcm = dcm_coordinates(image.get("gps_longitude", no_info), image.get("gps_longitude_ref", no_info))
+        fields["Coordinates"] = f"{lat_dcm}, {lng_dcm}"
+
+    results_store.add("image", os.path.abspath(media_photo), fields)
+    return fields, []
+
 def execute_img():
-    print(f"{display_info} Enter the directory of the image like: images/example_image.png")
+    write_effect(f"{display_info} Enter the directory of the image like: images/example_image.png", 0)
 
     media_photo = input(f'\n×××{maRed("[")}{maBold("SPY-PHOTO")}{maRed("]")}---> ').strip()
     if not os.path.exists(media_photo): raise Exception(f"{display_error} The rute is not valid OR does not exists.")
@@ -159,190 +187,197 @@ def execute_img():
 
     image = Image(media_photo)
     got_location = True
-    save_data(file, f"## <center> Results of image: {media_photo}</center>", None, "a", False)
-
-    def print_tags(tag, info):
-        data = image.get(info, no_info)
-
-        if data != no_info:
-            #amount += 1
-            write_effect(f'{display_info} {maGreen(tag)}: {maUnderline(data)}', 0.005)
-            meta_save = f'- {tag}: **{data}**'
-            save_data(file, None, meta_save, 'a', False)
-            return data
-
-    def extract_us(data):
-        var = image.get(data, no_info)
-        if var != no_info: users.append(var)
-
-    enabled_gps = image.get('gps_latitude', no_info)
-    if enabled_gps == no_info:
-        got_location = False
-
-    lat_dcm = dcm_coordinates(image.get("gps_latitude", no_info), image.get("gps_latitude_ref", no_info))
-    lng_dcm = dcm_coordinates(image.get("gps_longitude", no_info), image.get("gps_longitude_ref", no_info))
-
-
-    between_tag("INFO DEVICE")
-    save_data(file, "---\n### 🎥 Info Device", None, "a", False)
-    print_tags("Make", "make")
-    print_tags("Model", "model")
-    print_tags("Software", "software")
-
-    space_between()
-
-    between_tag("INFO IMAGE")
-    save_data(file, "---\n### 🖼️ Info Image", None, "a", False)
-    print_tags("Image Width", "Image_Width")
-    print_tags("Image Height", "Image_Height")
-    print_tags("Width Resolution", "X_Resolution")
-    print_tags("Vertical Resolution", "Y_Resolution")
-    print_tags("Image Size", "Sony_Raw_Image_Size")
-
-    change_value = {
-        2: "Inches",
-        3: "Centimeters"
-    }
-
-    units_re = print_tags("Unit of Distance", "Resolution_Unit")
-
-    conver_num(units_re, change_value)
-
-
-    print_tags("Profile", "Profile_Name")
-    print_tags("Owner", "Owner_Name")
-    print_tags("Copyright", "Copyright")
-    print_tags("Artist", "Artist")
-    print_tags("Photographer", "Photographer")
-
-    extract_us("Profile_Name")
-    extract_us("Copyright")
-    extract_us("Artist")
-    extract_us("Photographer")
-
-    print_tags("Shared Data", "Shared_Data")
-    print_tags("Description", "Image_Description")
-    print_tags("Comment", "User_Comment")
-    print_tags("Document", "document_name")
-
-    change_value = {
-        1: 'Horizontal',
-        2: 'Mirror Horizontal',
-        3: 'Rotated 180°',
-        4: 'Mirror Vertical',
-        5: 'Mirror Horizontal & Rotated 270° CW',
-        6: 'Rotated 90° CW',
-        7: 'Mirror Horizontal & Rotated 90° CW',
-        8: 'Rotated 270° CW'
-    }
-    orientation = print_tags("Orientacion", "Orientation")
-    conver_num(orientation, change_value)
-
-
-    print_tags("Exposure", "Exposure")
-    print_tags("Exposure Mode", "Exposure_Mode")
-    print_tags("Exposure Time", "exposure_time")
-    print_tags("Iso", "ISO")
-    print_tags("Aperture", "aperture_value")
-    print_tags("Focal Lenght", "focal_lenght")
-    print_tags("Pixel Scale", "pixel_scale")
-    print_tags("Shadows", "Shadows")
-    print_tags("Brightness", "brightness_value")
-
-    change_value = {
-        0: 'Normal',
-        1: 'Low',
-        2: 'High'
-    }
-    contrast = print_tags("Contrast", "Contrast")
-    conver_num(contrast, change_value)
-    saturation = print_tags("Saturation", "Saturation")
-    conver_num(saturation, change_value)
-
-
-    print_tags("Smoothness", "Smoothness")
-    print_tags("Clasification", "Security_Classification")
-    print_tags("History", "Image_History")
-    print_tags("Field of View", "fov_cot")
-
-    space_between()
-
-    between_tag("INFO CAMERA")
-    save_data(file, "---\n### 📷 Info Camera", None, "a", False)
-    print_tags("Make", "lens_make")
-    print_tags("Lens Model", "lens_model")
-    print_tags("Specifications", "lens_specification")
-    print_tags("Lens Info", "Lens_Info")
-
-    space_between()
-
-    between_tag("INFO TIME")
-    save_data(file, "---\n### 🗓️ Info Date & Time", None, "a", False)
-    print_tags("Date & Time", "datetime_original")
-    print_tags("UTC", "offset_time")
-
-    between_tag("INFO PLACE")
-    save_data(file, "---\n### 📍 Info Place", None, "a", False)
-    print_tags("Latitude", "gps_latitude")
-    print_tags("Longitude", "gps_longitude")
-    print(f'{display_info} {maGreen("Latitude Decimal")}: {maYellow(lat_dcm)}')
-    print(f'{display_info} {maGreen("Longitude Decimal")}: {maYellow(lng_dcm)}\n')
-
-    space_between()
-
-    if got_location:
-        if check_internet():
-            get_location(lat_dcm, lng_dcm, file)
-            space_between()
+    with report(file):
+        save_data(file, f"## <center> Results of image: {media_photo}</center>", None, "a", False)
+        fields = {}
+
+        def print_tags(tag, info):
+            data = image.get(info, no_info)
+
+            if data != no_info:
+                #amount += 1
+                write_effect(f'{display_info} {maGreen(tag)}: {maUnderline(data)}', 0.005)
+                meta_save = f'- {tag}: **{data}**'
+                fields.setdefault(tag, data)
+                save_data(file, None, meta_save, 'a', False)
+                return data
+
+        def extract_us(data):
+            var = image.get(data, no_info)
+            if var != no_info: users.append(var)
+
+        enabled_gps = image.get('gps_latitude', no_info)
+        if enabled_gps == no_info:
+            got_location = False
+
+        lat_dcm = dcm_coordinates(image.get("gps_latitude", no_info), image.get("gps_latitude_ref", no_info))
+        lng_dcm = dcm_coordinates(image.get("gps_longitude", no_info), image.get("gps_longitude_ref", no_info))
+
+
+        between_tag("INFO DEVICE")
+        save_data(file, "---\n### 🎥 Info Device", None, "a", False)
+        print_tags("Make", "make")
+        print_tags("Model", "model")
+        print_tags("Software", "software")
+
+        space_between()
+
+        between_tag("INFO IMAGE")
+        save_data(file, "---\n### 🖼️ Info Image", None, "a", False)
+        print_tags("Image Width", "Image_Width")
+        print_tags("Image Height", "Image_Height")
+        print_tags("Width Resolution", "X_Resolution")
+        print_tags("Vertical Resolution", "Y_Resolution")
+        print_tags("Image Size", "Sony_Raw_Image_Size")
+
+        change_value = {
+            2: "Inches",
+            3: "Centimeters"
+        }
+
+        units_re = print_tags("Unit of Distance", "Resolution_Unit")
+
+        conver_num(units_re, change_value)
+
+
+        print_tags("Profile", "Profile_Name")
+        print_tags("Owner", "Owner_Name")
+        print_tags("Copyright", "Copyright")
+        print_tags("Artist", "Artist")
+        print_tags("Photographer", "Photographer")
+
+        extract_us("Profile_Name")
+        extract_us("Copyright")
+        extract_us("Artist")
+        extract_us("Photographer")
+
+        print_tags("Shared Data", "Shared_Data")
+        print_tags("Description", "Image_Description")
+        print_tags("Comment", "User_Comment")
+        print_tags("Document", "document_name")
+
+        change_value = {
+            1: 'Horizontal',
+            2: 'Mirror Horizontal',
+            3: 'Rotated 180°',
+            4: 'Mirror Vertical',
+            5: 'Mirror Horizontal & Rotated 270° CW',
+            6: 'Rotated 90° CW',
+            7: 'Mirror Horizontal & Rotated 90° CW',
+            8: 'Rotated 270° CW'
+        }
+        orientation = print_tags("Orientacion", "Orientation")
+        conver_num(orientation, change_value)
+
+
+        print_tags("Exposure", "Exposure")
+        print_tags("Exposure Mode", "Exposure_Mode")
+        print_tags("Exposure Time", "exposure_time")
+        print_tags("Iso", "ISO")
+        print_tags("Aperture", "aperture_value")
+        print_tags("Focal Lenght", "focal_lenght")
+        print_tags("Pixel Scale", "pixel_scale")
+        print_tags("Shadows", "Shadows")
+        print_tags("Brightness", "brightness_value")
+
+        change_value = {
+            0: 'Normal',
+            1: 'Low',
+            2: 'High'
+        }
+        contrast = print_tags("Contrast", "Contrast")
+        conver_num(contrast, change_value)
+        saturation = print_tags("Saturation", "Saturation")
+        conver_num(saturation, change_value)
+
+
+        print_tags("Smoothness", "Smoothness")
+        print_tags("Clasification", "Security_Classification")
+        print_tags("History", "Image_History")
+        print_tags("Field of View", "fov_cot")
+
+        space_between()
+
+        between_tag("INFO CAMERA")
+        save_data(file, "---\n### 📷 Info Camera", None, "a", False)
+        print_tags("Make", "lens_make")
+        print_tags("Lens Model", "lens_model")
+        print_tags("Specifications", "lens_specification")
+        print_tags("Lens Info", "Lens_Info")
+
+        space_between()
+
+        between_tag("INFO TIME")
+        save_data(file, "---\n### 🗓️ Info Date & Time", None, "a", False)
+        print_tags("Date & Time", "datetime_original")
+        print_tags("UTC", "offset_time")
+
+        between_tag("INFO PLACE")
+        save_data(file, "---\n### 📍 Info Place", None, "a", False)
+        print_tags("Latitude", "gps_latitude")
+        print_tags("Longitude", "gps_longitude")
+        write_effect(f'{display_info} {maGreen("Latitude Decimal")}: {maYellow(lat_dcm)}', 0)
+        write_effect(f'{display_info} {maGreen("Longitude Decimal")}: {maYellow(lng_dcm)}\n', 0)
+
+        space_between()
+
+        if got_location:
+            if check_internet():
+                get_location(lat_dcm, lng_dcm, file)
+                space_between()
+            else: save_data(file, "- ❌ Location not found", None, "a", False)
         else: save_data(file, "- ❌ Location not found", None, "a", False)
-    else: save_data(file, "- ❌ Location not found", None, "a", False)
-
-    between_tag("EXTRA INFO")
-    save_data(file, "---\n### 📌 Extra Info", None, "a", False)
-    dir_image = directions_degrees(image.get("gps_img_direction", no_info))
-    write_effect(f'{display_info} {maGreen("Dir Image")}: {maUnderline(dir_image)}', 0.005)
-    print_tags("Image Direction", "gps_img_direction")
-    write_effect(f'{display_info} {maGreen("Sea Level")}: {maUnderline(sea_level(image.get("gps_altitude", no_info), image.get("gps_altitude_ref", no_info)))}', 0.005)
-    write_effect(f'{display_info} {maGreen("Speed")}: {maUnderline(image.get("gps_speed", no_info))} {maUnderline(velocity_photo(image.get("gps_speed_ref", no_info)))}', 0.005)
-    print_tags("Flash", "Flash")
-    print_tags("Humidity", "Humidity")
-    print_tags("Pressure", "Pressure")
-    print_tags("Temperature Ambient", "temperature_ambient")
-    print_tags("Battery Level", "Battery_Level")
-
-    mess = f"""
+
+        between_tag("EXTRA INFO")
+        save_data(file, "---\n### 📌 Extra Info", None, "a", False)
+        dir_image = directions_degrees(image.get("gps_img_direction", no_info))
+        write_effect(f'{display_info} {maGreen("Dir Image")}: {maUnderline(dir_image)}', 0.005)
+        print_tags("Image Direction", "gps_img_direction")
+        write_effect(f'{display_info} {maGreen("Sea Level")}: {maUnderline(sea_level(image.get("gps_altitude", no_info), image.get("gps_altitude_ref", no_info)))}', 0.005)
+        write_effect(f'{display_info} {maGreen("Speed")}: {maUnderline(image.get("gps_speed", no_info))} {maUnderline(velocity_photo(image.get("gps_speed_ref", no_info)))}', 0.005)
+        print_tags("Flash", "Flash")
+        print_tags("Humidity", "Humidity")
+        print_tags("Pressure", "Pressure")
+        print_tags("Temperature Ambient", "temperature_ambient")
+        print_tags("Battery Level", "Battery_Level")
+
+        if got_location: fields["Coordinates"] = f"{lat_dcm}, {lng_dcm}"
+        if users: fields["Possible users"] = users
+        results_store.add("image", os.path.abspath(media_photo), fields)
+
+        mess = f"""
 \n---\n## 📊 Final Summary\n
 - 📋 Total amount of data: **{amount}**
 - 👤 Possible users found on the image: **{len(users)}**
     """
-    if got_location: mess += "\n- 📍 Location found on the image: ✅"
-    else: mess += "\n- 📍 Location found on the image: ❌"
-    save_data(file, mess, None, "a", False)
-
-    if not users: save_data(file, "- ❌ Possible users not found", None, "a", True)
-    else:
-        if check_internet():
-            for user in users:
-                write_effect(f"\n{display_info} User '{maBold(user)}' found on the image...", 0.02)
-                conf = str(input(f"{display_question} Do you want to search the user '{maBold(user)}' using Google Dorks? ({maGreen('y')}/{maRed('n')}): ")).strip()
-
-                if not check_key(conf): continue
-
-                sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
-                tor = check_key(sel)
-                if tor: gg_connection(True)
-
-                ls_search_user = [
-                    (f'a_descr="{user}"', 10),
-                    (f'a_descr="{user}"&docs', 10),
-                    (f'a_descr="{user}"&email', 10),
-                    (f'a_descr="{user}"&phone', 10),
-                    (f'a_descr="{user}"&adr', 10),
-                    (f'a_descr="{user}"&dbase', 10),
-                    (f'a_descr="{user}"&cv', 10),
-                    (f'a_descr="{user}"&cv&docs', 10)
-                ]
-
-                save_data(file, f"---\n## <center>👤 Searching the user '{user}' using Google Dorks</center>", None, "a", False)
-                multi_search(1, ls_search_user, file, tor)
-        else: write_effect(f"{display_extra} Connection needed to search the users with Google Dorks...", 0.02)
+        if got_location: mess += "\n- 📍 Location found on the image: ✅"
+        else: mess += "\n- 📍 Location found on the image: ❌"
+        save_data(file, mess, None, "a", False)
+
+        if not users: save_data(file, "- ❌ Possible users not found", None, "a", True)
+        else:
+            if check_internet():
+                for user in users:
+                    write_effect(f"\n{display_info} User '{maBold(user)}' found on the image...", 0.02)
+                    conf = str(input(f"{display_question} Do you want to search the user '{maBold(user)}' using Google Dorks? ({maGreen('y')}/{maRed('n')}): ")).strip()
+
+                    if not check_key(conf): continue
+
+                    sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
+                    tor = check_key(sel)
+                    if tor: gg_connection(True)
+
+                    ls_search_user = [
+                        (f'a_descr="{user}"', 10),
+                        (f'a_descr="{user}"&docs', 10),
+                        (f'a_descr="{user}"&email', 10),
+                        (f'a_descr="{user}"&phone', 10),
+                        (f'a_descr="{user}"&adr', 10),
+                        (f'a_descr="{user}"&dbase', 10),
+                        (f'a_descr="{user}"&cv', 10),
+                        (f'a_descr="{user}"&cv&docs', 10)
+                    ]
+
+                    save_data(file, f"---\n## <center>👤 Searching the user '{user}' using Google Dorks</center>", None, "a", False)
+                    multi_search(1, ls_search_user, file, tor)
+            else: write_effect(f"{display_extra} Connection needed to search the users with Google Dorks...", 0.02)
@@ -37,7 +37,8 @@ from phonenumbers import (
     format_out_of_country_calling_number,
     format_out_of_country_keeping_alpha_chars
 )
-from core.save_data import save_data
+from core.save_data import save_data, report
+from core import results_store
 from tools.coordinates import get_location
 from tools.g_dorking import multi_search, gg_connection
 from core.display import (
@@ -48,7 +49,7 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line
 )
 
 def conver_num(num, message=None):
@@ -73,11 +74,21 @@ def conver_num(num, message=None):
     if num in list_num:
         write_effect(f'{display_extra} {maSkyBlue(value)}\n', 0.005)
 
-def execute_ph():
-    print(f"{display_info} Enter a number with his international format... example: +1 23456789")
-
-    phone_number = input(f'\n×××{maRed("[")}{maBold("SPY-PHONE")}{maRed("]")}---> ')
-
+number_types = {
+    0: "Fixed Line",
+    1: "Mobile",
+    2: "Fixed Line or Mobile",
+    3: "Toll Free",
+    4: "Premium Rate",
+    5: "Shared Cost",
+    6: "VOIP",
+    7: "Personal Number",
+    8: "Pager",
+    9: "UAN",
+    10: "VoiceMail",
+}
+
+def parse_number(phone_number):
     exist = phonenumbers.parse(phone_number, None)
 
     possible_numb = phonenumbers.is_possible_number(exist)
@@ -85,113 +96,144 @@ def execute_ph():
 
     if not valid_numb or not possible_numb:
         raise Exception(f"{display_error} Error, the number is not valid OR not exists!")
+    return exist
+
+def run_job(phone_number):
+    """
+    Non-interactive analysis of a phone number, used by the headless runner.
+
+    Parameters:
+        phone_number (str): Number in international format (e.g. +1 23456789).
+
+    Returns:
+        tuple: (dict with the data found, list of source URLs)
+    """
 
+    exist = parse_number(phone_number)
     e_format = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.E164)
-    file = f"data/phones/results_{e_format}_file.txt"
-    save_data(file, f"\nResults of phone number: {exist}\n", None, "a", False)
 
-    def get_data(cmd, tag, lg):
-        try:
-            global data
-            if not lg or lg == None:
-                data = cmd(exist)
-                write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
-            else:
-                data = cmd(exist, lg)
-                write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
-            fn_data = f"{tag}: {data}"
-            save_data(file, None, fn_data, "a", False)
-            return data
-        except Exception as err:
-            write_effect(f"{display_error} Another error has occured, {maRed(err)}", 0.02)
-
-    wait_out(0.3)
-    confirm_num = f'\n{display_validate} {maGreen("Number found...")}\n{maGreen("Getting data...")} {maGreen(happy)}\n'
-    write_effect(confirm_num, 0.05)
-
-    between_tag("PHONE NUMBER FORMATS")
-
-    global_numb = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
-    natal_numb = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.NATIONAL)
-
-    write_effect(f"{display_info} {maBold('International Format')}: {maGreen(global_numb)}", 0.005)
-    write_effect(f"{display_info} {maBold('National Format')}: {maGreen(natal_numb)}", 0.005)
-    write_effect(f"{display_info} {maBold('E.164 Format')}: {maGreen(e_format)}", 0.005)
-    write_effect(f"{display_info} {maBold('RFC3966 Format')}: {maGreen(phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.RFC3966))}", 0.005)
-
-    space_between()
-
-    between_tag("PHONE NUMBER ANALYSIS")
-
-    types = {
-        0: "Fixed Line",
-        1: "Mobile",
-        2: "Fixed Line or Mobile",
-        3: "Toll Free",
-        4: "Premium Rate",
-        5: "Shared Cost",
-        6: "VOIP",
-        7: "Personal Number",
-        8: "Pager",
-        9: "UAN",
-        10: "VoiceMail",
+    fields = {
+        "International Format": phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
+        "National Format": phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.NATIONAL),
+        "E.164 Format": e_format,
+        "RFC3966 Format": phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.RFC3966),
+        "Number Type": number_types.get(phonenumbers.number_type(exist), "Unknown"),
+        "Carrier": carrier.name_for_number(exist, "en"),
+        "Country": geocoder.country_name_for_number(exist, "en"),
+        "Country Code": phonenumbers.region_code_for_number(exist),
+        "Region": geocoder.description_for_number(exist, "en"),
+        "Timezone": list(timezone.time_zones_for_number(exist))
     }
 
-    get_data(phonenumbers.truncate_too_long_number, "Truncate", None)
-    tp = get_data(phonenumbers.number_type, "Number Type", None)
-    conver_num(tp, types)
-    get_data(carrier.name_for_number, "Carrier", "en")
+    results_store.add("phone", e_format, fields)
+    return fields, []
 
-    space_between()
+def execute_ph():
+    write_effect(f"{display_info} Enter a number with his international format... example: +1 23456789", 0)
 
-    between_tag("MOBILE DIALING")
+    phone_number = input(f'\n×××{maRed("[")}{maBold("SPY-PHONE")}{maRed("]")}---> ')
 
-    get_data(format_out_of_country_calling_number, "In Another Country (US)", "us")
-    get_data(format_out_of_country_keeping_alpha_chars, "In Another Country With Letters (US)", "us")
+    exist = parse_number(phone_number)
 
-    space_between()
+    e_format = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.E164)
+    file = f"data/phones/results_{e_format}_file.txt"
+    with report(file):
+        save_data(file, f"\nResults of phone number: {exist}\n", None, "a", False)
+        fields = {}
+
+        def get_data(cmd, tag, lg):
+            try:
+                global data
+                if not lg or lg == None:
+                    data = cmd(exist)
+                    write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
+                else:
+                    data = cmd(exist, lg)
+                    write_effect(f"{display_info} {maBold(tag)}: {maGreen(data)}", 0.005)
+                fn_data = f"{tag}: {data}"
+                fields[tag] = data
+                save_data(file, None, fn_data, "a", False)
+                return data
+            except Exception as err:
+                write_effect(f"{display_error} Another error has occured, {maRed(err)}", 0.02)
+
+        wait_out(0.3)
+        confirm_num = f'\n{display_validate} {maGreen("Number found...")}\n{maGreen("Getting data...")} {maGreen(happy)}\n'
+        write_effect(confirm_num, 0.05)
+
+        between_tag("PHONE NUMBER FORMATS")
+
+        global_numb = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+        natal_numb = phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.NATIONAL)
+        fields["International Format"] = global_numb
+        fields["National Format"] = natal_numb
+
+        write_effect(f"{display_info} {maBold('International Format')}: {maGreen(global_numb)}", 0.005)
+        write_effect(f"{display_info} {maBold('National Format')}: {maGreen(natal_numb)}", 0.005)
+        write_effect(f"{display_info} {maBold('E.164 Format')}: {maGreen(e_format)}", 0.005)
+        write_effect(f"{display_info} {maBold('RFC3966 Format')}: {maGreen(phonenumbers.format_number(exist, phonenumbers.PhoneNumberFormat.RFC3966))}", 0.005)
 
-    between_tag("PHONE NUMBER LOCATION")
+        space_between()
+
+        between_tag("PHONE NUMBER ANALYSIS")
+
+        get_data(phonenumbers.truncate_too_long_number, "Truncate", None)
+        tp = get_data(phonenumbers.number_type, "Number Type", None)
+        conver_num(tp, number_types)
+        get_data(carrier.name_for_number, "Carrier", "en")
 
-    get_data(geocoder.country_name_for_number, "Country", "en")
-    get_data(phonenumbers.region_code_for_number, "Country Code", None)
-    get_data(geocoder.description_for_number, "Region", "en")
-    get_data(timezone.time_zones_for_number, "Timezone", None)
+        space_between()
+
+        between_tag("MOBILE DIALING")
 
-    space_between()
-    write_effect(f"{display_question} {maYellow('Warning')}: The location of the phone number can be approximate.", 0.05)
-    region = geocoder.description_for_number(exist, "en")
-    try:
-        get_location(str(region), None, file)
-    except Exception:
-        save_data(file, "- ❌ Location not found", None, "a", False)
-        write_effect(f"{display_extra} Location not found...\n", 0.02)
+        get_data(format_out_of_country_calling_number, "In Another Country (US)", "us")
+        get_data(format_out_of_country_keeping_alpha_chars, "In Another Country With Letters (US)", "us")
 
-    space_between()
-    ask_ggdork = str(input(f"{display_question} Do you want to search this '{maBold(phone_number)}' phone number in Google? ({maGreen('y')}/{maRed('n')}): "))
+        space_between()
 
-    if check_key(ask_ggdork):
-        sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
-        tor = check_key(sel)
-        if tor: gg_connection(True)
+        between_tag("PHONE NUMBER LOCATION")
 
-        wait_out(0.5)
-        write_effect(maYellow("\nSearching with the international number..."), 0.05)
+        get_data(geocoder.country_name_for_number, "Country", "en")
+        get_data(phonenumbers.region_code_for_number, "Country Code", None)
+        get_data(geocoder.description_for_number, "Region", "en")
+        get_data(timezone.time_zones_for_number, "Timezone", None)
+        if tp in number_types: fields["Number Type"] = number_types[tp]
+        results_store.add("phone", e_format, fields)
 
-        search_phone_int = [
-            (f'a_descr="{global_numb}"', 10, 3),
-            (f'a_descr="{global_numb}"&docs', 10, 3),
-            (f'a_descr="{global_numb}"&dbase', 10, 3)
-        ]
+        space_between()
+        write_effect(f"{display_question} {maYellow('Warning')}: The location of the phone number can be approximate.", 0.05)
+        region = geocoder.description_for_number(exist, "en")
+        try:
+            get_location(str(region), None, file)
+        except Exception:
+            save_data(file, "- ❌ Location not found", None, "a", False)
+            write_effect(f"{display_extra} Location not found...\n", 0.02)
 
-        multi_search(1, search_phone_int, file, tor)
         space_between()
-        write_effect(maYellow("\nSearching with the national number..."), 0.05)
+        ask_ggdork = str(input(f"{display_question} Do you want to search this '{maBold(phone_number)}' phone number in Google? ({maGreen('y')}/{maRed('n')}): "))
+
+        if check_key(ask_ggdork):
+            sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
+            tor = check_key(sel)
+            if tor: gg_connection(True)
+
+            wait_out(0.5)
+            write_effect(maYellow("\nSearching with the international number..."), 0.05)
+
+            search_phone_int = [
+                (f'a_descr="{global_numb}"', 10, 3),
+                (f'a_descr="{global_numb}"&docs', 10, 3),
+                (f'a_descr="{global_numb}"&dbase', 10, 3)
+            ]
+
+            multi_search(1, search_phone_int, file, tor)
+            space_between()
+            write_effect(maYellow("\nSearching with the national number..."), 0.05)
 
-        search_phone_nt = [
-            (f'a_descr="{natal_numb}"', 10, 3),
-            (f'a_descr="{natal_numb}"&docs', 10, 3),
-            (f'a_descr="{natal_numb}"&dbase', 10, 3)
-        ]
+            search_phone_nt = [
+                (f'a_descr="{natal_numb}"', 10, 3),
+                (f'a_descr="{natal_numb}"&docs', 10, 3),
+                (f'a_descr="{natal_numb}"&dbase', 10, 3)
+            ]
 
-        multi_search(1, search_phone_nt, file, tor)
+            multi_search(1, search_phone_nt, file, tor)
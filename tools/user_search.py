@@ -5,21 +5,34 @@ and deep analysis using Google Dorking techniques.
 
 Core Features:
 - Username checks on over 150 websites (including NSFW sites optionally)
-- Optional TOR proxy support for anonymity
-- Automatic saving of results to a text file
+- Optional per-site detection rules in the websites JSON files:
+    "status": expected status code(s) when the user exists
+    "claimed": text only present on the page of an existing user
+    "unclaimed": text only present when the user doesn't exist
+    "max_bytes": max bytes of the page to read looking for the markers
+- Batch mode to search many usernames at once sharing the connections
+- Re-entrant UserSearch engine, several searches can run in the same process
+- Results of each (site, username) cached on disk, bypass with --refresh
+- Timeouts of each site adapted from its latency history, slow sites start first
+- Health ledger of every site, dead sites are quarantined and re-tested less often
+- Every hit saved in the results store (core/results_store.py)
+- Optional TOR proxy support for anonymity, spread over isolated circuits
+- Results shown and saved as soon as each website answers
 - Option to extend analysis with Google Dorking
 """
 
 import requests
-import threading
-import random
 import time
+import tempfile
 import json
+import codecs
 import re
 import os
-from core.save_data import save_data
+from core.save_data import save_data, report
 from tools.g_dorking import multi_search, gg_connection
-from core.agents import agents
+from core.sessions import SessionPool
+from core import probe_cache, latency, site_health, results_store
+from core.scheduler import stream_queue, host_key
 from core.display import (
     prRed, prGreen, prCyan, prYellow, maRed, maBlue, maCyan,
     maYellow, maOrange, maMagenta, maGreen, maPink,
@@ -28,13 +41,14 @@ from core.display import (
     backRed, display_extra, display_error,
     display_validate, display_info, display_question, happy, sad,
     angry, pointing, nervous, surprised, waiting, write_effect,
-    wait_out, space_between, between_tag, check_key
+    wait_out, space_between, between_tag, check_key, blank_line, progress_line, clear_line
 )
 
-cf_us = []
-nc_us = []
-fr_us = []
-lock = threading.Lock()
+max_workers = 20
+max_per_host = 2
+batch_interval = 0.5
+default_max_bytes = 1048576
+chunk_size = 16384
 
 def ask_connect():
     """
@@ -52,76 +66,468 @@ def ask_connect():
     else: return requests
 
 
-def make_search(connection, nickname, ls):
+def read_markers(web, nickname, site):
     """
-    Perform HTTP requests on a list of URLs using the specified nickname to determine if user exists.
+    Reads the body of the response in chunks and stops as soon as a marker matches,
+    so most pages are never downloaded completely.
+
+    The "claimed" marker of the site is used when given, otherwise the nickname itself,
+    unless the site only has an "unclaimed" marker: then it's claimed only when the
+    whole body was read without finding it.
 
     Parameters:
-        connection (requests or Session): HTTP client to use.
+        web (Response): Streamed response of the website.
         nickname (str): The username to search for.
-        list (list): List of (site_name, url) tuples.
+        site (dict): Entry of the website with its optional rules.
+
+    Returns:
+        str or None: "claimed", "unclaimed" or None if nothing matched.
     """
 
-    equals = True
-    for title, url in ls:
-        try:
-            select_agent = agents()
-            web = connection.get(url=url, headers=select_agent, timeout=20)
-        except requests.exceptions.RequestException: continue
+    claimed = site.get("claimed")
+    unclaimed = site.get("unclaimed")
+    max_bytes = site.get("max_bytes", default_max_bytes)
+    find = re.compile(re.escape(claimed) if claimed else rf"\b{re.escape(nickname)}\b", 0 if claimed else re.IGNORECASE)
+    # With only the unclaimed marker the nickname proves nothing (it's echoed
+    # on the "not found" pages too), the whole head must be read without it
+    if unclaimed and not claimed: find = None
 
-        if web.status_code == 404: continue
-        elif web.status_code == 403:
-            with lock: fr_us.append((title, url))
+    try:
+        decoder = codecs.getincrementaldecoder(web.encoding or "utf-8")(errors="ignore")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
 
-        elif web.status_code == 200:
-            if equals:
-                equals = False
+    keep = max(len(claimed or nickname), len(unclaimed or "")) + 1
+    tail = ""
+    read = 0
+    complete = True
 
-            find = re.search(rf"\b{re.escape(nickname)}\b", web.text, re.IGNORECASE)
+    for chunk in web.iter_content(chunk_size):
+        read += len(chunk)
+        text = tail + decoder.decode(chunk)
 
-            if web.url != url and not find: continue
-            if find:
-                with lock: cf_us.append((title, url))
-            else:
-                with lock: nc_us.append((title, url))
+        if unclaimed and unclaimed in text: return "unclaimed"
+        if find and find.search(text): return "claimed"
 
-def execute_thr(connection, nickname, ls, main):
-    max_core = 10
+        tail = text[-keep:]
+        if read >= max_bytes:
+            complete = False
+            break
 
-    cf_us.clear()
-    write_effect(maYellow("Collecting the users... this could take a few seconds."), 0.03)
+    if complete and unclaimed and not claimed: return "claimed"
+    return None
+
+def probe_site(connection, nickname, site):
+    """
+    Perform an HTTP request on a single website to determine if the user exists.
+
+    Parameters:
+        connection (Session): Pooled session of the worker.
+        nickname (str): The username to search for.
+        site (dict): Entry of the website with the nickname already inserted in the url.
 
-    with open(ls, "r", encoding="utf-8") as file: json_data = json.load(file)
+    Returns:
+        tuple: (status code, result, final url), result is "confirmed", "unconfirmed",
+               "manual" or None if the user wasn't found.
 
-    raw_websites = json_data[main]
-    data = [(entry["site"], entry["url"].format(nickname)) for entry in raw_websites]
+    Raises:
+        requests.exceptions.RequestException: If the request failed.
+    """
 
-    k, m = divmod(len(data), max_core)
-    parts = [data[x * k + min(x, m):(x + 1) * k + min(x + 1, m)] for x in range(max_core)]
-    thr = []
+    url = site["url"]
+    expected = site.get("status")
+    if isinstance(expected, int): expected = [expected]
 
+    host = host_key(site.get("template", url))
+    transport = "tor" if getattr(connection, "tor_circuit", None) is not None else "direct"
     begin = time.time()
+    try:
+        web = connection.get(url=url, timeout=latency.timeout_for(host, 20, transport), stream=True)
+    except requests.exceptions.RequestException as err:
+        latency.record(host, time.time() - begin, False, transport, isinstance(err, requests.exceptions.Timeout))
+        raise
+    latency.record(host, time.time() - begin, transport=transport)
+
+    code = web.status_code
+    try:
+        if expected:
+            if code not in expected: return code, None, web.url
+            if not site.get("claimed") and not site.get("unclaimed"): return code, "confirmed", web.url
+
+        elif code == 404: return code, None, web.url
+        elif code == 403: return code, "manual", web.url
+        elif code != 200: return code, None, web.url
+
+        found = read_markers(web, nickname, site)
+
+        if found == "unclaimed": return code, None, web.url
+        if web.url != url and not found: return code, None, web.url
+        return code, "confirmed" if found else "unconfirmed", web.url
+    finally:
+        web.close()
+
+def definitive(site, code):
+    """
+    Tells whether the outcome of a probe can be cached: a 404, a status other
+    than the expected ones of the site, or a 200 read for its markers. The 5xx,
+    429 and other unexpected codes (WAF or challenge pages) can be transient,
+    so the site is checked again on the next search.
+    """
+
+    if code >= 500 or code == 429: return False
+    if code == 404 or site.get("status"): return True
+    return code == 200
+
+def make_search(connection, nickname, site, ledger=site_health):
+    """
+    Checks a single website for the user, answering from the probe cache when
+    the same site and username were checked within the TTL, and keeps the
+    health ledger of the site up to date.
+
+    Parameters:
+        connection (Session): Pooled session of the worker.
+        nickname (str): The username to search for.
+        site (dict): Entry of the website with the nickname already inserted in the url.
+        ledger (RunLedger or module): Where the health of the site is recorded.
+
+    Returns:
+        str or None: "confirmed", "unconfirmed", "manual" or None if the user wasn't found.
+    """
+
+    cached = probe_cache.get(site["site"], nickname)
+    if cached: return cached["result"]
+
+    try:
+        code, result, final_url = probe_site(connection, nickname, site)
+    except requests.exceptions.RequestException as err:
+        ledger.record(site, site_health.describe(err))
+        return None
+
+    ledger.record(site, f"HTTP {code}" if code >= 500 else None)
+    if definitive(site, code): probe_cache.put(site["site"], nickname, code, result, final_url)
+    return result
+
+def show_circuits():
+    """
+    Shows the throughput of every Tor circuit used.
+    """
+
+    from core.socks_connect import circuit_report
+    for circuit, sent, errors, size, seconds, speed in circuit_report():
+        write_effect(f"{display_extra} Tor circuit {maBold(circuit)}: {maBold(sent)} requests, {maRed(errors)} errors, {maBold(round(size / 1024, 1))} KB in {seconds}s ({maGreen(speed)} KB/s)", 0.01)
+
+catalogues = {}
 
-    for x in range(max_core):
-        t = threading.Thread(target=make_search, args=(connection, nickname, parts[x]))
-        thr.append(t)
-        t.start()
-    for t in thr: t.join()
+def read_catalogue(ls, main):
+    """
+    Returns the websites of a catalogue file, parsed once and kept in memory
+    until the file changes.
+    """
+
+    mtime = os.path.getmtime(ls)
+    cached = catalogues.get((ls, main))
+    if cached and cached[0] == mtime: return cached[1]
+
+    with open(ls, "r", encoding="utf-8") as file: sites = json.load(file)[main]
+    catalogues[(ls, main)] = (mtime, sites)
+    return sites
+
+class ProbeResult:
+    """
+    Compact record of a website where the user may exist.
+    """
+
+    __slots__ = ("nickname", "site", "url", "result")
 
-    end = round(time.time() - begin, 2)
+    def __init__(self, nickname, site, url, result):
+        self.nickname = nickname
+        self.site = site
+        self.url = url
+        self.result = result
 
+    def as_dict(self):
+        return {"nickname": self.nickname, "site": self.site, "url": self.url, "result": self.result}
+
+
+class UserSearch:
+    """
+    Re-entrant user search engine. Every instance owns its session pool and
+    counters, the results are streamed to the caller and never kept, so several
+    searches can run side by side in the same process with flat memory.
+
+    Parameters:
+        connection (requests or Session): HTTP client selected, only its proxies are used.
+        workers (int): Number of worker threads pulling from the queue.
+        per_host (int): Max requests running at the same time against one host.
+        interval (float): Min seconds between two requests to the same host.
+        pool (SessionPool, TorPool or None): Long-lived pool to use instead of a new one per run
+                                             (or the process-wide Tor pool), it's not closed.
+    """
+
+    def __init__(self, connection=requests, workers=max_workers, per_host=max_per_host, interval=0, pool=None):
+        self.proxies = None if connection is requests else connection.proxies
+        self.tor = getattr(connection, "tor_circuit", None) is not None
+        self.workers = workers
+        self.per_host = per_host
+        self.interval = interval
+        self.pool = pool
+
+        self.counts = {}
+        self.sites = 0
+        self.skipped = 0
+        self.elapsed = 0
+        self.stats = {"requests": 0, "connections": 0, "reused": 0}
+
+    def load_sites(self, catalogue):
+        """
+        Reads the websites of the catalogue files, leaving out the quarantined ones.
+
+        Parameters:
+            catalogue (list): List of (path of the JSON file, key of the list of websites).
+        """
+
+        sites = []
+        for ls, main in catalogue: sites += read_catalogue(ls, main)
+
+        ready = [entry for entry in sites if not site_health.skip(dict(entry, template=entry["url"]))]
+        self.skipped += len(sites) - len(ready)
+        return ready
+
+    def run(self, nicknames, catalogue):
+        """
+        Checks every nickname on every website of the catalogue through one work queue.
+
+        Parameters:
+            nicknames (list): The usernames to search for.
+            catalogue (list): List of (path of the JSON file, key of the list of websites).
+
+        Yields:
+            tuple: ("result", ProbeResult) as soon as a probe finds something and
+                   ("progress", (done, total)) after every probe.
+        """
+
+        sites = self.load_sites(catalogue)
+        self.sites += len(sites)
+
+        jobs = []
+        for nickname in nicknames:
+            self.counts.setdefault(nickname, {"confirmed": 0, "unconfirmed": 0, "manual": 0})
+            for entry in sites:
+                site = dict(entry, url=entry["url"].format(nickname), template=entry["url"], nickname=nickname)
+                jobs.append((host_key(site["template"]), site))
+        jobs = latency.slow_first(jobs, "tor" if self.tor else "direct")
+
+        ledger = site_health.RunLedger(self.tor)
+        if self.tor:
+            from core.socks_connect import get_pool
+            pool = self.pool or get_pool()
+            probe = lambda site: make_search(pool.get(host_key(site["template"])), site["nickname"], site, ledger)
+        else:
+            pool = self.pool or SessionPool(self.proxies)
+            probe = lambda site: make_search(pool.get(), site["nickname"], site, ledger)
+
+        before = pool.stats()
+        begin = time.time()
+        try:
+            for event, site, value in stream_queue(jobs, probe, self.workers, self.per_host, self.interval):
+                if event == "progress":
+                    yield event, (site, value)
+                    continue
+
+                record = ProbeResult(site["nickname"], site["site"], site["url"], value)
+                self.counts[record.nickname][value] += 1
+                results_store.add("user", record.nickname, {"site": record.site, "result": record.result}, [record.url])
+                yield "result", record
+        finally:
+            self.elapsed = round(self.elapsed + time.time() - begin, 2)
+            for key, value in pool.stats().items(): self.stats[key] += value - before[key]
+            if not self.pool and not self.tor: pool.close()
+            latency.save()
+            ledger.flush()
+
+def execute_thr(connection, nickname, ls, main, on_result=None, workers=max_workers, per_host=max_per_host):
+    """
+    Checks the nickname on every website of the list through the shared work queue.
+    Every result is shown and handed to on_result as soon as its probe finishes.
+
+    Parameters:
+        connection (requests or Session): HTTP client selected, only its proxies are used.
+        nickname (str): The username to search for.
+        ls (str): Path of the JSON file with the websites.
+        main (str): Key of the JSON file that holds the list of websites.
+        on_result (callable or None): Called as on_result(result, site, url) for every result.
+        workers (int): Number of worker threads pulling from the queue.
+        per_host (int): Max requests running at the same time against one host.
+
+    Returns:
+        tuple: (counts of each result, seconds taken, connection stats)
+    """
+
+    write_effect(maYellow("Collecting the users... this could take a few seconds."), 0.03)
     write_effect(f"\n{display_validate} {maGreen(surprised)} {maGreen('Confirmed users of:')} {maGreen(nickname)}\n", 0.03)
 
-    for tl, url in cf_us:
-        mess = f"""{display_extra} {maBold('Site:')} {maBold(tl)}
-{display_info} {maCyan('URL:')} {maUnderline(url)}
+    engine = UserSearch(connection, workers, per_host)
+    for event, value in engine.run([nickname], [(ls, main)]):
+        if event == "progress":
+            progress_line(*value)
+            continue
+
+        if on_result: on_result(value.result, value.site, value.url)
+        if value.result != "confirmed": continue
+
+        clear_line()
+        mess = f"""{display_extra} {maBold('Site:')} {maBold(value.site)}
+{display_info} {maCyan('URL:')} {maUnderline(value.url)}
 {display_validate} {maGreen('The user')} "{maGreen(nickname)}" {maGreen('was found on the website')}"""
         write_effect(mess, 0.0005)
         space_between()
-    write_effect(f"\n{display_info} The user {maBold(nickname)} was found on {maGreen(len(cf_us))} of {maMagenta(len(data))} websites", 0.03)
+
+    counts, end, stats = engine.counts[nickname], engine.elapsed, engine.stats
+
+    write_effect(f"\n{display_info} The user {maBold(nickname)} was found on {maGreen(counts['confirmed'])} of {maMagenta(engine.sites)} websites", 0.03)
     write_effect(f"{display_validate} Finished on: '{maGreen(end)}' seconds {maGreen(happy)}", 0.03)
+    write_effect(f"{display_info} Requests: {maBold(stats['requests'])}, connections opened: {maBold(stats['connections'])}, reused: {maGreen(stats['reused'])}", 0.03)
+    if engine.tor: show_circuits()
+    if engine.skipped: write_effect(f"{display_extra} {maYellow(engine.skipped)} quarantined websites skipped, list them with: {maBold('python SpyNexus.py --quarantined')}", 0.03)
+
+    return counts, end, stats
 
-    return len(cf_us), end
+def execute_batch(connection, nicknames, nsfw=False, workers=max_workers, per_host=max_per_host, interval=batch_interval):
+    """
+    Checks a list of nicknames on every website through a single work queue,
+    sharing the pooled connections and the per-host limits between all of them.
+
+    Every result is appended as soon as it's known to the JSON Lines file of its nickname
+    (opened once for the whole run): data/users/batch_<nickname>_results.jsonl
+
+    Parameters:
+        connection (requests or Session): HTTP client selected, only its proxies are used.
+        nicknames (list): The usernames to search for.
+        nsfw (bool): Whether to include the NSFW websites.
+        workers (int): Number of worker threads pulling from the queue.
+        per_host (int): Max requests running at the same time against one host.
+        interval (float): Min seconds between two requests to the same host.
+
+    Returns:
+        tuple: (dict of nickname -> counts of each result, seconds taken, connection stats)
+    """
+
+    catalogue = get_catalogue(nsfw)
+
+    write_effect(maYellow(f"Collecting {len(nicknames)} users... this could take a while."), 0.03)
+
+    engine = UserSearch(connection, workers, per_host, interval)
+    outputs = {}
+    try:
+        for event, value in engine.run(nicknames, catalogue):
+            if event == "progress":
+                progress_line(*value)
+                continue
+
+            out = outputs.get(value.nickname)
+            if out is None:
+                out = outputs[value.nickname] = open(f"data/users/batch_{value.nickname}_results.jsonl", "a", encoding="utf-8")
+            out.write(json.dumps(dict(value.as_dict(), time=round(time.time(), 2)), ensure_ascii=False) + "\n")
+
+            if value.result == "confirmed":
+                clear_line()
+                write_effect(f"{display_validate} {maBold(value.nickname)} found on {maBold(value.site)}: {maUnderline(value.url)}", 0.0005)
+    finally:
+        for out in outputs.values(): out.close()
+
+    if engine.tor: show_circuits()
+    return engine.counts, engine.elapsed, engine.stats
+
+def get_catalogue(nsfw=False):
+    catalogue = [("tools/sites_user/websites.json", "websites")]
+    if nsfw: catalogue.append(("tools/sites_user/nsfw_websites.json", "nsfw_websites"))
+    return catalogue
+
+def run_job(nickname, nsfw=False, tor=False, workers=max_workers, per_host=max_per_host, pool=None):
+    """
+    Non-interactive user search, used by the headless runner.
+
+    Parameters:
+        nickname (str): The username to search for.
+        nsfw (bool): Whether to include the NSFW websites.
+        tor (bool): Whether to use the Tor network.
+        workers (int): Number of worker threads pulling from the queue.
+        per_host (int): Max requests running at the same time against one host.
+        pool (SessionPool, TorPool or None): Long-lived pool to reuse (e.g. by the service mode).
+
+    Returns:
+        tuple: (dict with the websites of each result, list of confirmed URLs)
+    """
+
+    connection = requests
+    if tor:
+        from core.socks_connect import get_tor_connection
+        connection = get_tor_connection()
+
+    found = {"confirmed": [], "unconfirmed": [], "manual": []}
+    engine = UserSearch(connection, workers, per_host, pool=pool)
+    for event, value in engine.run([nickname], get_catalogue(nsfw)):
+        if event == "result": found[value.result].append({"site": value.site, "url": value.url})
+
+    fields = dict(found, websites=engine.sites, seconds=engine.elapsed)
+    return fields, [item["url"] for item in found["confirmed"]]
+
+def execute_user_batch():
+    """
+    Entry point of the batch mode, asks for a file with one username per line
+    (or a list separated by commas) and searches all of them at once.
+    """
+
+    write_effect(f"{display_info} Enter a file with one user per line like: users.txt\n{display_info} Or a list of users separated by commas like: john_doe,jane_doe", 0)
+
+    source = input(f'\n×××{maRed("[")}{maBold("SPY-USERNAMES")}{maRed("]")}---> ').strip()
+    if not source: raise Exception(f"{display_error} You can't leave the usernames empty! {maRed(angry)}")
+
+    if os.path.isfile(source):
+        with open(source, "r", encoding="utf-8") as file: raw = file.read().splitlines()
+    else: raw = source.split(",")
+
+    nicknames = []
+    for nickname in raw:
+        nickname = nickname.strip()
+        if not nickname or nickname in nicknames: continue
+        if " " in nickname:
+            write_effect(f"{display_extra} Skipping {maBold(nickname)}, the nickname can't have spaces!", 0.02)
+            continue
+        nicknames.append(nickname)
+    if not nicknames: raise Exception(f"{display_error} Error, there are no valid usernames to search!")
+
+    type = ask_connect()
+    adult_search = str(input(f"\n{display_question} Do you want to include {maMagenta('NSFW')} websites? ({maGreen('y')}/{maRed('n')}): "))
+
+    wait_out(0.3)
+    counts, tm, stats = execute_batch(type, nicknames, bool(check_key(adult_search)))
+
+    file = f"data/users/batch_{len(nicknames)}_users_{int(time.time())}_results.md"
+    with report(file):
+        save_data(file, f"\n# <center>👥 Search of {len(nicknames)} users in 200+ websites</center>\n---", "| User | ✅ Confirmed | ❓ Unconfirmed | 🎭 Manual | Results |\n|---|---|---|---|---|", "a", False)
+
+        write_effect(f"\n{display_validate} {maGreen(surprised)} {maGreen('Results of the users:')}\n", 0.03)
+        for nickname, count in counts.items():
+            write_effect(f"{display_info} {maBold(nickname)}: {maGreen(count['confirmed'])} confirmed, {maYellow(count['unconfirmed'])} unconfirmed, {maCyan(count['manual'])} manual", 0.005)
+            save_data(file, f"| {nickname} | {count['confirmed']} | {count['unconfirmed']} | {count['manual']} | `data/users/batch_{nickname}_results.jsonl` |", None, "a", False)
+
+        write_effect(f"\n{display_validate} Finished on: '{maGreen(tm)}' seconds {maGreen(happy)}", 0.03)
+        write_effect(f"{display_info} Requests: {maBold(stats['requests'])}, connections opened: {maBold(stats['connections'])}, reused: {maGreen(stats['reused'])}", 0.03)
+
+        mess = f"""
+\n---
+## 📑 Final Summary
+
+- 👥 Total users searched: **{len(nicknames)}**
+- 🕒 Total amount of time has taken to process: **{tm} Seconds.**
+- 🔌 Requests sent: **{stats['requests']}**, connections opened: **{stats['connections']}**, reused: **{stats['reused']}**
+    """
+        if type == requests:
+            mess += "\n- 🧅 Tor used: ❌"
+        else: mess +=  "\n- 🧄 Tor used: ✅"
+
+        save_data(file, mess, "> Always check the websites one by one it's **NOT** 100% accurate", "a", True)
 
 def execute_user():
     """
@@ -130,40 +536,69 @@ def execute_user():
     and optional deep analysis using Google Dorking.
     """
 
-    print(f"{display_info} Enter a user like: john_doe\n{display_info} Don't use spaces in the username!")
+    ls_modes = [
+        "Search one user",
+        "Search multiple users (file or list)"
+    ]
+    blank_line()
+    for i, item in enumerate(ls_modes, start=1):
+        write_effect(f"{maRed('[')}{maBold(i)}{maRed(']')}: {maRed(item)}", 0.003)
+
+    while True:
+        try:
+            mode = int(input(f"\n×××{maRed('[')}{maBold('SELECT-OPTION')}{maRed(']')}---> "))
+            if mode in (1, 2): break
+        except ValueError:
+            pass
+        write_effect(f"{display_error} {maRed('Invalid option, select 1 or 2...')}", 0.03)
+
+    if mode == 2: return execute_user_batch()
+
+    write_effect(f"\n{display_info} Enter a user like: john_doe\n{display_info} Don't use spaces in the username!", 0)
 
     nickname = input(f'\n×××{maRed("[")}{maBold("SPY-USERNAME")}{maRed("]")}---> ').strip()
     if not nickname: raise Exception(f"{display_error} You can't leave the username empty! {maRed(angry)}")
     if " " in nickname: raise Exception(f"{display_error} Error, the nickname can't have spaces! example: john_doe")
     file = f"data/users/users_{nickname}_results.md"
-    save_data(file, f'\n# <center>👤 Search of the user {nickname} in 200+ websites</center>\n---', None, "a", False)
+    with report(file):
+        save_data(file, f'\n# <center>👤 Search of the user {nickname} in 200+ websites</center>\n---', None, "a", False)
 
-    type = ask_connect()
+        type = ask_connect()
 
-    wait_out(0.3)
-    write_effect(f'\n{maYellow("Searching user:")} {maYellow(nickname)}{maYellow("...")}', 0.05)
+        wait_out(0.3)
+        write_effect(f'\n{maYellow("Searching user:")} {maYellow(nickname)}{maYellow("...")}', 0.05)
 
-    nrm_wb, tm = execute_thr(type, nickname, "tools/sites_user/websites.json", "websites")
-    adult_search = str(input(f"\n{display_question} Do you want to search user {maBold(nickname)} in {maMagenta('NSFW')} websites? ({maGreen('y')}/{maRed('n')}): "))
-    nsfw_wb = 0
-    ns_tm = 0
+        spool = {"unconfirmed": tempfile.TemporaryFile("w+", encoding="utf-8"), "manual": tempfile.TemporaryFile("w+", encoding="utf-8")}
+        marks = {"unconfirmed": "⚠️", "manual": "🔍"}
 
-    save_data(file, f"## 🖥️ Confirmed users of {nickname} on normal websites", "---\n", "a", False)
-    for tl, url in cf_us: save_data(file, f"- [{tl}]({url})", None, "a", False)
+        def saver(prefix):
+            def on_result(result, tl, url):
+                if result == "confirmed": save_data(file, f"- {prefix}[{tl}]({url})", None, "a", False)
+                else: spool[result].write(f"- {marks[result]} [{tl}]({url})\n")
+            return on_result
 
-    if check_key(adult_search):
-        save_data(file, '\n---\n', f'## Confirmed users {nickname} in ~~NSFW~~ websites 🔞\n---\n', "a", False)
-        wait_out(0.3)
-        nsfw_wb, ns_tm = execute_thr(type, nickname, "tools/sites_user/nsfw_websites.json", "nsfw_websites")
-        for tl, url in cf_us: save_data(file, f"- 🔞 [{tl}]({url})", None, "a", False)
+        save_data(file, f"## 🖥️ Confirmed users of {nickname} on normal websites", "---\n", "a", False)
+        nrm_ct, tm, nrm_st = execute_thr(type, nickname, "tools/sites_user/websites.json", "websites", saver(""))
+
+        adult_search = str(input(f"\n{display_question} Do you want to search user {maBold(nickname)} in {maMagenta('NSFW')} websites? ({maGreen('y')}/{maRed('n')}): "))
+        ns_ct = {"confirmed": 0, "unconfirmed": 0, "manual": 0}
+        ns_tm = 0
+        ns_st = {"requests": 0, "connections": 0, "reused": 0}
 
-    save_data(file, "\n---\n## ❓ Unconfirmed Users:\n", None, "a", False)
-    for tl, url in nc_us: save_data(file, f"- ⚠️ [{tl}]({url})", None, "a", False)
+        if check_key(adult_search):
+            save_data(file, '\n---\n', f'## Confirmed users {nickname} in ~~NSFW~~ websites 🔞\n---\n', "a", False)
+            wait_out(0.3)
+            ns_ct, ns_tm, ns_st = execute_thr(type, nickname, "tools/sites_user/nsfw_websites.json", "nsfw_websites", saver("🔞 "))
 
-    save_data(file, "\n---", "## 🎭 Manual user confirmation:\n", "a", False)
-    for tl, url in fr_us: save_data(file, f"- 🔍 [{tl}]({url})", None, "a", False)
+        nrm_wb = nrm_ct["confirmed"]
+        nsfw_wb = ns_ct["confirmed"]
 
-    mess = f"""
+        for result, header in (("unconfirmed", "\n---\n## ❓ Unconfirmed Users:\n"), ("manual", "\n---\n## 🎭 Manual user confirmation:\n")):
+            spool[result].seek(0)
+            save_data(file, header, spool[result].read().rstrip("\n") or None, "a", False)
+            spool[result].close()
+
+        mess = f"""
 \n---
 ## 📑 Final Summary
 
@@ -171,34 +606,35 @@ def execute_user():
 - 🕒 Total amount of time has taken to process: **{tm + ns_tm} Seconds.**
 - 🖥️ Total Confirmed Users on **"Normal Websites"**: **{nrm_wb}**
 - 🔞 Total Confirmed Users on **"~~NSFW Websites~~"**: **{nsfw_wb}**
-- ❓ Total **Unconfirmed** Users: **{len(nc_us)}**
-- 🎭 Manual user verification: **{len(fr_us)}**
+- ❓ Total **Unconfirmed** Users: **{nrm_ct['unconfirmed'] + ns_ct['unconfirmed']}**
+- 🎭 Manual user verification: **{nrm_ct['manual'] + ns_ct['manual']}**
+- 🔌 Requests sent: **{nrm_st['requests'] + ns_st['requests']}**, connections opened: **{nrm_st['connections'] + ns_st['connections']}**, reused: **{nrm_st['reused'] + ns_st['reused']}**
     """
-    if type == requests:
-        mess += "\n- 🧅 Tor used: ❌"
-    else: mess +=  "\n- 🧄 Tor used: ✅"
-
-    save_data(file, mess, "> Always check the websites one by one it's **NOT** 100% accurate\n> Check too the **Unconfirmed/Possible users**, it could have **False Positives**", "a", True)
-    ask_input = str(input(f"\n{display_question} Do you want to make a search the user {maBold(nickname)} using Google Dorks? ({maGreen('y')}/{maRed('n')}): "))
-
-    if check_key(ask_input):
-        save_data(file, f'\n---\n## <center>🔍 Searching the user {nickname} using the Google Dorks module</center>\n', None, "a", False)
-
-        sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
-        tor = check_key(sel)
-        if tor: gg_connection(True)
-
-        wait_out(0.5)
-
-        ls_search_user = [
-           (f'descr="{nickname}"', 10),
-           (f'descr="{nickname}"&docs', 10),
-           (f'descr="{nickname}"&email', 10),
-           (f'descr="{nickname}"&phone', 10),
-           (f'descr="{nickname}"&adr', 10),
-           (f'descr="{nickname}"&dbase', 10),
-           (f'descr="{nickname}"&cv', 10),
-           (f'descr="{nickname}"&cv&docs', 10)
-        ]
-
-        multi_search(1, ls_search_user, file, tor)
+        if type == requests:
+            mess += "\n- 🧅 Tor used: ❌"
+        else: mess +=  "\n- 🧄 Tor used: ✅"
+
+        save_data(file, mess, "> Always check the websites one by one it's **NOT** 100% accurate\n> Check too the **Unconfirmed/Possible users**, it could have **False Positives**", "a", True)
+        ask_input = str(input(f"\n{display_question} Do you want to make a search the user {maBold(nickname)} using Google Dorks? ({maGreen('y')}/{maRed('n')}): "))
+
+        if check_key(ask_input):
+            save_data(file, f'\n---\n## <center>🔍 Searching the user {nickname} using the Google Dorks module</center>\n', None, "a", False)
+
+            sel = str(input(f"{display_question} Do you want to use a Tor network for this module? ({maGreen('y')}/{maRed('n')}): ")).strip()
+            tor = check_key(sel)
+            if tor: gg_connection(True)
+
+            wait_out(0.5)
+
+            ls_search_user = [
+               (f'descr="{nickname}"', 10),
+               (f'descr="{nickname}"&docs', 10),
+               (f'descr="{nickname}"&email', 10),
+               (f'descr="{nickname}"&phone', 10),
+               (f'descr="{nickname}"&adr', 10),
+               (f'descr="{nickname}"&dbase', 10),
+               (f'descr="{nickname}"&cv', 10),
+               (f'descr="{nickname}"&cv&docs', 10)
+            ]
+
+            multi_search(1, ls_search_user, file, tor)